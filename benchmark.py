@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for Yunite MCP Server
+
+Usage:
+    python3 benchmark.py list_tools [--iterations N] [--profile NAME]
+    python3 benchmark.py startup [--iterations N] [--login-delay SECONDS]
+"""
+
+import os
+import sys
+import json
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Arguments the MCP session passes when dumping a result onto the wire
+DUMP_OPTIONS = {"by_alias": True, "mode": "json", "exclude_none": True}
+
+
+async def measure(label: str, iterations: int, run):
+    """Time an async callable and record its peak allocation per call"""
+    await run()  # warm up
+    
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await run()
+    elapsed = (time.perf_counter() - start) / iterations
+    
+    tracemalloc.start()
+    await run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    print(f"   {label:<28} {elapsed * 1e6:>10.1f} µs/call   {peak / 1024:>8.1f} KiB peak")
+    return elapsed, peak
+
+
+async def bench_list_tools(iterations: int, profile: str):
+    """Compare rebuilding the tool list per request with the memoized, pre-serialized response"""
+    from mcp.types import ListToolsRequest, ListToolsResult, ServerResult
+    import server
+    
+    server.load_tool_profile(profile)
+    request = ListToolsRequest(method="tools/list")
+    
+    async def rebuild():
+        # What every tools/list used to do: build every Tool model, wrap and dump them
+        tools = [endpoint.to_tool() for endpoint in server._tool_endpoints]
+        ServerResult(ListToolsResult(tools=tools)).model_dump(**DUMP_OPTIONS)
+    
+    async def memoized():
+        result = await server.app.request_handlers[ListToolsRequest](request)
+        result.model_dump(**DUMP_OPTIONS)
+    
+    print(f"📋 tools/list, profile '{profile}' with {len(server._tool_endpoints)} tools ({iterations} iterations)")
+    before, before_peak = await measure("rebuild per request", iterations, rebuild)
+    after, after_peak = await measure("memoized + pre-serialized", iterations, memoized)
+    print(f"   ✅ {before / after:.0f}x faster, {before_peak / max(after_peak, 1):.0f}x less peak allocation")
+
+
+class StubAPIHandler(BaseHTTPRequestHandler):
+    """Stand-in Yunite API: answers login after a delay and echoes every other request"""
+    login_delay = 0.0
+    
+    def do_POST(self):
+        if self.path == "/auth/login":
+            time.sleep(self.login_delay)
+            self._reply({"access_token": "benchmark", "expires_in": 3600})
+        else:
+            self._reply({"path": self.path})
+    
+    def do_GET(self):
+        self._reply({"path": self.path})
+    
+    def _reply(self, body: dict):
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+async def bench_startup(iterations: int, login_delay: float):
+    """Launch the stdio server as a client would and time the handshake and first tool result"""
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+    
+    StubAPIHandler.login_delay = login_delay
+    api = ThreadingHTTPServer(("127.0.0.1", 0), StubAPIHandler)
+    threading.Thread(target=api.serve_forever, daemon=True).start()
+    
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=[os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")],
+        env={
+            **os.environ,
+            "API_BASE_URL": f"http://127.0.0.1:{api.server_port}",
+            "ADMIN_USERNAME": "benchmark",
+            "ADMIN_PASSWORD": "benchmark",
+            "CACHE_DISK_PATH": ""
+        }
+    )
+    
+    initialized, first_results = [], []
+    with open(os.devnull, "w") as errlog:
+        for _ in range(iterations):
+            start = time.perf_counter()
+            async with stdio_client(params, errlog=errlog) as (read_stream, write_stream):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+                    initialized.append(time.perf_counter() - start)
+                    await session.call_tool("get_my_profile", {})
+                    first_results.append(time.perf_counter() - start)
+    api.shutdown()
+    
+    print(f"🚀 stdio startup, {login_delay * 1000:.0f} ms login ({iterations} launches)")
+    for label, samples in (("time to initialize", initialized), ("time to first tool result", first_results)):
+        print(f"   {label:<28} {statistics.median(samples) * 1000:>10.1f} ms median   {min(samples) * 1000:>8.1f} ms best")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yunite MCP Server micro-benchmarks")
+    parser.add_argument("benchmark", choices=["list_tools", "startup"])
+    parser.add_argument("--iterations", type=int, help="Default: 200 for list_tools, 10 for startup")
+    parser.add_argument("--profile", default="full", help="Tool profile to list (see profiles.py)")
+    parser.add_argument("--login-delay", type=float, default=0.3, help="Seconds the stub API takes to log in")
+    args = parser.parse_args()
+    
+    if args.benchmark == "list_tools":
+        asyncio.run(bench_list_tools(args.iterations or 200, args.profile))
+    elif args.benchmark == "startup":
+        asyncio.run(bench_startup(args.iterations or 10, args.login_delay))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Circuit breakers for Yunite MCP Server
+One breaker per route group. A breaker opens when too many recent calls fail
+or are slow, so calls to a degraded backend area fail fast instead of each
+waiting out the HTTP timeout. After a cool-down a single probe is let through
+(half-open); its outcome closes the breaker or opens it again.
+"""
+
+import time
+from collections import deque
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while its group's breaker is open"""
+    
+    def __init__(self, group: str, retry_in: float):
+        super().__init__(f"Circuit breaker for '{group}' is open, failing fast (retry in {retry_in:.0f}s)")
+        self.group = group
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Error-rate and slow-call-rate breaker over a sliding time window"""
+    
+    def __init__(
+        self,
+        window: float = 30,
+        min_calls: int = 10,
+        error_rate: float = 0.5,
+        slow_call: float = 4,
+        slow_rate: float = 0.8,
+        open_seconds: float = 30
+    ):
+        self.window = window
+        self.min_calls = min_calls
+        self.error_rate = error_rate
+        self.slow_call = slow_call
+        self.slow_rate = slow_rate
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self._probing = False
+        # (finished_at, failed, slow) for calls within the window
+        self._calls: deque = deque()
+    
+    def retry_in(self) -> float:
+        """Seconds until an open breaker lets a probe through"""
+        return max(self.opened_at + self.open_seconds - time.time(), 0)
+    
+    def allow(self) -> bool:
+        """Whether a call may go out now; in half-open state only one probe at a time"""
+        if self.state == OPEN:
+            if self.retry_in() > 0:
+                return False
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN:
+            if self._probing:
+                return False
+            self._probing = True
+        return True
+    
+    def record(self, failed: bool, latency: float):
+        """Record a finished call and open or close the breaker accordingly"""
+        now = time.time()
+        slow = latency >= self.slow_call
+        if self.state == HALF_OPEN:
+            self._probing = False
+            if failed or slow:
+                self._open(now)
+            else:
+                self.state = CLOSED
+                self._calls.clear()
+            return
+        
+        self._calls.append((now, failed, slow))
+        while self._calls and self._calls[0][0] < now - self.window:
+            self._calls.popleft()
+        if self.state != CLOSED or len(self._calls) < self.min_calls:
+            return
+        
+        failures = sum(1 for _, failed, _ in self._calls if failed)
+        slow_calls = sum(1 for _, _, slow in self._calls if slow)
+        if failures >= self.error_rate * len(self._calls) or slow_calls >= self.slow_rate * len(self._calls):
+            self._open(now)
+    
+    def release(self):
+        """Give back a probe slot whose call ended without an outcome (e.g. it was cancelled)"""
+        if self.state == HALF_OPEN:
+            self._probing = False
+    
+    def _open(self, now: float):
+        self.state = OPEN
+        self.opened_at = now
+        self._calls.clear()
+
+
+class CircuitBreakers:
+    """Breakers by route group, created on first use with shared settings and any group overrides"""
+    
+    def __init__(self, **settings):
+        self.settings = settings
+        self.group_settings: dict = {}
+        self._breakers: dict = {}
+    
+    def configure(self, group: str, **overrides):
+        """Override settings for one group's breaker, starting it afresh"""
+        self.group_settings[group] = overrides
+        self._breakers.pop(group, None)
+    
+    def get(self, group: str) -> CircuitBreaker:
+        breaker = self._breakers.get(group)
+        if breaker is None:
+            settings = {**self.settings, **self.group_settings.get(group, {})}
+            breaker = self._breakers[group] = CircuitBreaker(**settings)
+        return breaker
+    
+    def states(self) -> list:
+        """[(labels, value)] for a metrics gauge: 0 closed, 1 half-open, 2 open"""
+        codes = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+        return [({"group": group}, codes[breaker.state]) for group, breaker in self._breakers.items()]
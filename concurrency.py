@@ -0,0 +1,215 @@
+"""
+Adaptive concurrency limits for Yunite MCP Server
+Bounds how many requests are outstanding to the Yunite API, overall and per
+route group. Limits follow AIMD: they grow by one per round of calls that used
+them, and shrink by a factor when the API signals overload (429/503, timeouts)
+or, for route groups, when response times climb well above their route's baseline.
+Requests beyond the limit wait in a queue, up to a deadline. Waiting requests
+are let through by weighted fair queuing over their priority classes, so bulk
+writes keep moving without starving interactive reads.
+"""
+
+import time
+import asyncio
+from collections import deque
+from typing import Optional
+
+
+class QueueTimeout(Exception):
+    """Raised when a request waited for a concurrency slot past its deadline"""
+    
+    def __init__(self, scope: str, waited: float):
+        super().__init__(f"Too many concurrent requests to the Yunite API ({scope}), gave up after waiting {waited:.1f}s")
+        self.scope = scope
+        self.waited = waited
+
+
+class _Baseline:
+    """Lowest RTT seen for a route, re-measured every window seconds so a lasting shift is accepted"""
+    
+    def __init__(self, window: float):
+        self.window = window
+        self.value: Optional[float] = None
+        self._window_min: Optional[float] = None
+        self._window_started = time.monotonic()
+    
+    def track(self, rtt: float, now: float):
+        self._window_min = rtt if self._window_min is None else min(self._window_min, rtt)
+        if self.value is None or rtt < self.value:
+            self.value = rtt
+        if now - self._window_started >= self.window:
+            self.value = self._window_min
+            self._window_min = None
+            self._window_started = now
+
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit with a wait queue per priority class
+    With latency_tolerance set, a response slower than that multiple of its
+    route's baseline (lowest RTT over the last baseline_window seconds) counts as
+    overload. Baselines are kept per route, so a group mixing cheap and expensive
+    routes doesn't judge the expensive ones by the cheap ones' response times.
+    Freed slots go to the waiting classes in proportion to their weights
+    (classes without a weight count 1), FIFO within a class.
+    """
+    
+    def __init__(
+        self,
+        scope: str,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff: float = 0.9,
+        latency_tolerance: Optional[float] = None,
+        baseline_window: float = 60,
+        weights: Optional[dict] = None
+    ):
+        self.scope = scope
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.latency_tolerance = latency_tolerance
+        self.baseline_window = baseline_window
+        self.weights = weights or {}
+        self.in_flight = 0
+        # Waiters by priority class, and each class's virtual finish time for fair queuing
+        self._queues: dict = {}
+        self._finish: dict = {}
+        self._virtual_time = 0.0
+        self._baselines: dict = {}
+        self._last_decrease = 0.0
+    
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+    
+    def queued_by_priority(self) -> dict:
+        return {priority: len(queue) for priority, queue in self._queues.items()}
+    
+    async def acquire(self, timeout: Optional[float] = None, priority: str = ""):
+        """Take a slot, queueing in the priority class for at most timeout seconds"""
+        if not self.queued and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+        
+        started = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        queue = self._queues.setdefault(priority, deque())
+        if not queue:
+            # A class that was idle rejoins at the current virtual time, without banked credit
+            self._finish[priority] = max(self._finish.get(priority, 0.0), self._virtual_time)
+        queue.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout)
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # Granted a slot just as we gave up: hand it on
+                self.release()
+            else:
+                try:
+                    queue.remove(waiter)
+                except ValueError:
+                    pass
+            if isinstance(e, asyncio.TimeoutError):
+                raise QueueTimeout(self.scope, time.monotonic() - started) from None
+            raise
+    
+    def release(self, rtt: Optional[float] = None, overloaded: bool = False, route: str = ""):
+        """Give back a slot, adjusting the limit by the call's outcome (none if rtt is None)"""
+        saturated = self.queued or self.in_flight >= int(self.limit)
+        self.in_flight -= 1
+        if rtt is not None or overloaded:
+            self._adjust(rtt, overloaded, saturated, route)
+        self._wake()
+    
+    def _adjust(self, rtt: Optional[float], overloaded: bool, saturated: bool, route: str):
+        now = time.monotonic()
+        baseline = self._baselines.get(route)
+        if rtt is not None:
+            if baseline is None:
+                baseline = self._baselines[route] = _Baseline(self.baseline_window)
+            baseline.track(rtt, now)
+            if self.latency_tolerance and rtt > baseline.value * self.latency_tolerance:
+                overloaded = True
+        
+        if overloaded:
+            # At most one decrease per round trip, however many slow calls finish in it
+            if now - self._last_decrease >= (baseline.value if baseline is not None else 0):
+                self.limit = max(self.min_limit, self.limit * self.backoff)
+                self._last_decrease = now
+        elif saturated:
+            # Additive increase: about one per limit's worth of successful calls
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+    
+    def _next_waiter(self) -> Optional[asyncio.Future]:
+        """Pop the head of the waiting class with the earliest virtual finish time"""
+        waiting = [priority for priority, queue in self._queues.items() if queue]
+        if not waiting:
+            return None
+        
+        priority = min(waiting, key=self._finish.__getitem__)
+        self._virtual_time = self._finish[priority]
+        self._finish[priority] += 1 / self.weights.get(priority, 1)
+        return self._queues[priority].popleft()
+    
+    def _wake(self):
+        while self.in_flight < int(self.limit):
+            waiter = self._next_waiter()
+            if waiter is None:
+                return
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class ConcurrencyLimits:
+    """A global limiter plus one per route group; a request holds a slot in both"""
+    
+    def __init__(self, global_settings: dict, group_settings: dict):
+        self.global_limiter = AdaptiveLimiter("global", **global_settings)
+        self.group_settings = group_settings
+        self._groups: dict = {}
+    
+    def get(self, group: str) -> AdaptiveLimiter:
+        limiter = self._groups.get(group)
+        if limiter is None:
+            limiter = self._groups[group] = AdaptiveLimiter(group, **self.group_settings)
+        return limiter
+    
+    async def acquire(self, group: str, timeout: Optional[float] = None, priority: str = ""):
+        """Take a slot for the group, then a global one, within timeout seconds overall"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        group_limiter = self.get(group)
+        await group_limiter.acquire(timeout, priority)
+        try:
+            remaining = max(deadline - time.monotonic(), 0) if deadline is not None else None
+            await self.global_limiter.acquire(remaining, priority)
+        except BaseException:
+            group_limiter.release()
+            raise
+    
+    def release(self, group: str, rtt: Optional[float] = None, overloaded: bool = False, route: str = ""):
+        """Give back both slots taken by acquire, judging the call's RTT against its route's baseline"""
+        self.global_limiter.release(rtt, overloaded, route)
+        self.get(group).release(rtt, overloaded, route)
+    
+    def _limiters(self) -> list:
+        return [self.global_limiter, *self._groups.values()]
+    
+    def limits(self) -> list:
+        """[(labels, value)] of current limits, for a metrics gauge"""
+        return [({"scope": limiter.scope}, int(limiter.limit)) for limiter in self._limiters()]
+    
+    def in_flight(self) -> list:
+        """[(labels, value)] of requests holding a slot, for a metrics gauge"""
+        return [({"scope": limiter.scope}, limiter.in_flight) for limiter in self._limiters()]
+    
+    def queue_depths(self) -> list:
+        """[(labels, value)] of requests waiting for a slot by priority class, for a metrics gauge"""
+        return [
+            ({"scope": limiter.scope, "priority": priority}, depth)
+            for limiter in self._limiters()
+            for priority, depth in limiter.queued_by_priority().items()
+        ]
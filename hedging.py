@@ -0,0 +1,55 @@
+"""
+Hedged requests for Yunite MCP Server
+For latency-critical reads, a second identical request is sent when the first
+hasn't answered by the route's recent p95 response time; the first response
+wins and the other is cancelled. A budget caps hedges at a small fraction of
+the requests to those routes, so the tail shrinks without doubling traffic.
+"""
+
+from collections import deque
+from typing import Optional
+
+
+class HedgeBudget:
+    """Token bucket: every request earns ratio of a hedge, every hedge spends one"""
+    
+    def __init__(self, ratio: float = 0.05, burst: float = 10):
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = 0.0
+    
+    def earn(self):
+        self.tokens = min(self.burst, self.tokens + self.ratio)
+    
+    def spend(self) -> bool:
+        """Take a token for a hedge, if one is available"""
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+class Hedging:
+    """Recent response times per hedged route and the budget they share"""
+    
+    def __init__(self, ratio: float = 0.05, percentile: float = 95, min_samples: int = 20, window: int = 200):
+        self.budget = HedgeBudget(ratio)
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.window = window
+        self._latencies: dict = {}
+    
+    def record(self, route: str, latency: float):
+        """Record how long an answered request to the route took"""
+        samples = self._latencies.get(route)
+        if samples is None:
+            samples = self._latencies[route] = deque(maxlen=self.window)
+        samples.append(latency)
+    
+    def delay(self, route: str) -> Optional[float]:
+        """Seconds to wait before hedging a request to the route, or None until enough samples"""
+        samples = self._latencies.get(route)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(int(len(ordered) * self.percentile / 100), len(ordered) - 1)]
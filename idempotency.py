@@ -0,0 +1,93 @@
+"""
+Idempotent writes for Yunite MCP Server
+POST/PATCH writes are sent with an Idempotency-Key that stays the same across
+retries, and across repeats of a write whose outcome is unknown (a timeout, a
+transport error or a 5xx), so a write the backend applied before failing isn't
+applied again. Writes that completed recently are remembered by request fingerprint,
+so repeating the same tool call replays the first result instead of writing twice.
+A later write that changes an endpoint drops the records of writes to it, so a
+write repeated after, say, the removal it undid is sent again.
+"""
+
+import json
+import time
+import hashlib
+from uuid import uuid4
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Iterable, Optional
+
+
+def make_write_fingerprint(
+    method: str,
+    endpoint: str,
+    data: Optional[dict] = None,
+    params: Optional[dict] = None,
+    namespace: Optional[str] = None
+) -> str:
+    """Identify a write by who sends it, where and with what payload"""
+    canonical = json.dumps(
+        [method.upper(), endpoint, data, params, namespace],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class CompletedWrites:
+    """
+    Results of recently completed writes by fingerprint, expiring after ttl seconds
+    Also hands out the Idempotency-Key of each write, kept for ttl seconds until settled.
+    """
+    
+    def __init__(self, ttl: float = 60, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, tuple]" = OrderedDict()
+        self._keys: "OrderedDict[str, tuple]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._results)
+    
+    def get(self, fingerprint: str) -> Optional[Any]:
+        """Result of the write with this fingerprint, if it completed within the ttl"""
+        record = self._results.get(fingerprint)
+        if record is None:
+            return None
+        
+        expires_at, _, result = record
+        if expires_at <= time.time():
+            del self._results[fingerprint]
+            return None
+        return result
+    
+    def record(self, fingerprint: str, result: Any, endpoint: str = ""):
+        """Remember a completed write to endpoint, dropping the oldest beyond max_entries"""
+        self._results[fingerprint] = (time.time() + self.ttl, endpoint, result)
+        self._results.move_to_end(fingerprint)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+    
+    def key(self, fingerprint: str, endpoint: str = "") -> str:
+        """Idempotency-Key for the write with this fingerprint, the same one until settled or ttl seconds pass"""
+        record = self._keys.get(fingerprint)
+        if record is None or record[0] <= time.time():
+            record = (time.time() + self.ttl, endpoint, uuid4().hex)
+            self._keys[fingerprint] = record
+        self._keys.move_to_end(fingerprint)
+        while len(self._keys) > self.max_entries:
+            self._keys.popitem(last=False)
+        return record[2]
+    
+    def settle(self, fingerprint: str):
+        """Drop the key of a write whose outcome is known, so sending it again is a new write"""
+        self._keys.pop(fingerprint, None)
+    
+    def invalidate(self, patterns: Iterable[str], keep: Optional[str] = None):
+        """Forget completed writes and keys for endpoints matching any glob pattern, except the keep fingerprint"""
+        patterns = list(patterns)
+        for records in (self._results, self._keys):
+            for fingerprint, (_, endpoint, _) in list(records.items()):
+                if fingerprint != keep and any(fnmatchcase(endpoint, pattern) for pattern in patterns):
+                    del records[fingerprint]
@@ -0,0 +1,99 @@
+"""
+Per-identity API sessions for Yunite MCP Server
+A bounded LRU of users who logged in through the login tool, each with
+their own token, single-flight token refresh and cache namespace. Calls
+without a logged-in user keep using the shared admin token.
+"""
+
+import hmac
+import time
+import asyncio
+from collections import OrderedDict
+from typing import Optional
+
+
+class Identity:
+    """One API user: credentials, current token and a shared in-flight refresh"""
+    
+    def __init__(self, username: str, password: str, request_token):
+        self.username = username
+        self.password = password
+        self.token: Optional[str] = None
+        self.expires_at = 0.0
+        # async (username, password) -> (token, expires_at)
+        self._request_token = request_token
+        self._refresh: Optional[asyncio.Task] = None
+    
+    @property
+    def cache_namespace(self) -> str:
+        """Cache key namespace keeping this user's responses apart from everyone else's"""
+        return f"user:{self.username}"
+    
+    async def get_token(self, expiry_buffer: float = 0) -> str:
+        """Return the current token, logging in again once it is within expiry_buffer of expiring"""
+        if self.token and self.expires_at > time.time() + expiry_buffer:
+            return self.token
+        return await self.refresh()
+    
+    async def refresh(self) -> str:
+        """Log in again, sharing one in-flight login between all callers"""
+        if self._refresh is None:
+            self._refresh = asyncio.ensure_future(self._login())
+            self._refresh.add_done_callback(self._on_refresh_done)
+        
+        # Shield so a cancelled caller doesn't abort the login for everyone else
+        return await asyncio.shield(self._refresh)
+    
+    async def _login(self) -> str:
+        self.token, self.expires_at = await self._request_token(self.username, self.password)
+        return self.token
+    
+    def _on_refresh_done(self, task: asyncio.Task):
+        if self._refresh is task:
+            self._refresh = None
+        if not task.cancelled():
+            # Mark the exception as retrieved; waiters re-raise it themselves
+            task.exception()
+    
+    def forget_token(self):
+        """Drop the token, e.g. after logging out, so the next call logs in again"""
+        self.token = None
+        self.expires_at = 0.0
+
+
+class IdentityPool:
+    """Identities keyed by username, evicting the least recently used beyond max_identities"""
+    
+    def __init__(self, request_token, max_identities: int = 64, expiry_buffer: float = 0):
+        self.max_identities = max_identities
+        self.expiry_buffer = expiry_buffer
+        self._request_token = request_token
+        self._identities: "OrderedDict[str, Identity]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._identities)
+    
+    async def login(self, username: str, password: str) -> Identity:
+        """
+        Return the identity for these credentials, reusing a known user's token
+        instead of logging in again; raises if the API rejects the login
+        """
+        identity = self._identities.get(username)
+        if identity is not None and hmac.compare_digest(identity.password.encode(), password.encode()):
+            await identity.get_token(self.expiry_buffer)
+            self._identities.move_to_end(username)
+            return identity
+        
+        # Unknown user or different password: only keep the identity once the API accepts it
+        identity = Identity(username, password, self._request_token)
+        await identity.refresh()
+        self._identities[username] = identity
+        self._identities.move_to_end(username)
+        while len(self._identities) > self.max_identities:
+            self._identities.popitem(last=False)
+        return identity
+    
+    def discard(self, identity: Identity):
+        """Forget an identity, e.g. after it logged out"""
+        if self._identities.get(identity.username) is identity:
+            del self._identities[identity.username]
@@ -0,0 +1,93 @@
+"""
+Process-wide metrics for Yunite MCP Server
+Counters and gauges rendered in the Prometheus text format, served on
+/metrics in HTTP mode and dumped to stderr on SIGUSR1 and at shutdown.
+"""
+
+from typing import Callable, Optional
+
+# Every metric, in registration order
+REGISTRY: list = []
+
+
+def _labels_key(labels: dict) -> tuple:
+    return tuple(sorted(labels.items()))
+
+
+def _escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: tuple) -> str:
+    if not key:
+        return ""
+    pairs = ",".join(f'{name}="{_escape_label(value)}"' for name, value in key)
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    """Exact sample value: ints as ints, floats at full precision"""
+    if isinstance(value, int):
+        return str(int(value))
+    value = float(value)
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(value)
+
+
+class Counter:
+    """Monotonic count, one series per label combination"""
+    kind = "counter"
+    
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._values: dict = {}
+        REGISTRY.append(self)
+    
+    def inc(self, amount: float = 1, **labels):
+        key = _labels_key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels) -> float:
+        return self._values.get(_labels_key(labels), 0)
+    
+    def samples(self) -> list:
+        return list(self._values.items())
+
+
+class Gauge:
+    """Current value, either set directly or read from a callback when rendered"""
+    kind = "gauge"
+    
+    def __init__(self, name: str, help: str, read: Optional[Callable[[], list]] = None):
+        self.name = name
+        self.help = help
+        # Callback returning [(labels dict, value)], for values owned elsewhere
+        self._read = read
+        self._values: dict = {}
+        REGISTRY.append(self)
+    
+    def set(self, value: float, **labels):
+        self._values[_labels_key(labels)] = value
+    
+    def value(self, **labels) -> float:
+        return dict(self.samples()).get(_labels_key(labels), 0)
+    
+    def samples(self) -> list:
+        if self._read is not None:
+            return [(_labels_key(labels), value) for labels, value in self._read()]
+        return list(self._values.items())
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format"""
+    lines = []
+    for metric in REGISTRY:
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for key, value in metric.samples():
+            lines.append(f"{metric.name}{_format_labels(key)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,52 @@
+"""
+Tool profiles for Yunite MCP Server
+Named subsets of the read/write endpoint tables, so a client session only
+sees (and the server only builds and routes) the tools it needs
+"""
+
+from fnmatch import fnmatchcase
+
+from tools_comprehensive import READ_ENDPOINTS
+from tools_write import WRITE_ENDPOINTS
+
+DEFAULT_PROFILE = "full"
+
+# Profile name -> glob patterns over the route path templates of the read and
+# write endpoints it exposes
+TOOL_PROFILES = {
+    "full": {
+        "read": ("*",),
+        "write": ("*",),
+    },
+    "readonly": {
+        "read": ("*",),
+        "write": (),
+    },
+    "academic-admin": {
+        "read": ("/users/*", "/departments/*", "/academic/*", "/admin/*"),
+        "write": ("/users/{user_id}", "/departments/*", "/academic/*", "/admin/*"),
+    },
+    "store": {
+        "read": ("/users/me", "/rewards/*", "/pool/*"),
+        "write": ("/rewards/*", "/pool/*"),
+    },
+    "events": {
+        "read": ("/users/me", "/events/*", "/groups/*", "/alerts/*"),
+        "write": ("/alerts/*",),
+    },
+}
+
+
+def _matching(endpoints, patterns) -> list:
+    return [
+        endpoint for endpoint in endpoints
+        if any(fnmatchcase(endpoint.route.path, pattern) for pattern in patterns)
+    ]
+
+
+def get_profile_endpoints(name: str) -> tuple:
+    """Return the (read, write) endpoints exposed by a profile"""
+    profile = TOOL_PROFILES.get(name)
+    if profile is None:
+        raise ValueError(f"Unknown tool profile '{name}' (available: {', '.join(TOOL_PROFILES)})")
+    return _matching(READ_ENDPOINTS, profile["read"]), _matching(WRITE_ENDPOINTS, profile["write"])
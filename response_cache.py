@@ -0,0 +1,402 @@
+"""
+Response cache for Yunite MCP Server
+In-memory read-through cache with per-entry TTL and LRU eviction.
+Expired entries are kept while they can still be served stale or carry
+ETag/Last-Modified validators for conditional revalidation, and otherwise for a
+fallback grace window in which they are only served when the API is unreachable.
+
+An optional SQLite tier persists entries across restarts and shares them
+between server processes on the same host. Invalidations are logged there
+too, so every process drops the matching entries from its memory tier.
+SQLite stays off the hot path: the log is polled at most every few hundred
+milliseconds, recency updates are batched into the periodic sweep, and a
+locked file is given up on after a short busy timeout. When the SQLite tier
+fails, the memory tier keeps serving on its own.
+"""
+
+import sys
+import json
+import time
+from fnmatch import fnmatchcase
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+def make_cache_key(endpoint: str, params: Optional[dict] = None, namespace: Optional[str] = None) -> str:
+    """
+    Build a cache key from the endpoint and canonicalized query params
+    Responses fetched as a logged-in user get that identity's namespace appended
+    """
+    canonical = json.dumps(params or {}, sort_keys=True, separators=(",", ":"), default=str)
+    key = f"{endpoint}?{canonical}"
+    return f"{key}#{namespace}" if namespace else key
+
+
+@dataclass
+class CacheEntry:
+    """A cached API response"""
+    endpoint: str
+    value: Any
+    size: int
+    expires_at: float
+    stale_until: float = 0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    
+    @property
+    def is_fresh(self) -> bool:
+        return self.expires_at > time.time()
+    
+    @property
+    def is_servable_stale(self) -> bool:
+        return self.stale_until > time.time()
+    
+    @property
+    def can_revalidate(self) -> bool:
+        return bool(self.etag or self.last_modified)
+    
+    @property
+    def is_usable(self) -> bool:
+        return self.is_fresh or self.is_servable_stale or self.can_revalidate
+    
+    def is_retained(self, fallback_ttl: float = 0) -> bool:
+        """Usable, or expired less than fallback_ttl seconds ago and still kept for outages"""
+        return self.is_usable or self.expires_at + fallback_ttl > time.time()
+
+
+# How long logged invalidations are kept for other processes to pick up
+INVALIDATION_LOG_TTL = 3600
+
+# Seconds between sweeps of dead rows and size-cap eviction in the disk tier
+DISK_EVICT_INTERVAL = 30
+
+# Seconds between logged disk tier errors
+DISK_ERROR_LOG_INTERVAL = 60
+
+# Seconds to wait for a lock on the SQLite file before falling back to the memory tier
+DISK_BUSY_TIMEOUT = 0.05
+
+# Seconds between polls of the disk tier's invalidation log, which bounds how long another
+# process's write can leave a stale entry in this process's memory tier
+DISK_SYNC_INTERVAL = 0.25
+
+# Buffered accessed_at updates that force a flush before the next sweep
+DISK_MAX_PENDING_TOUCHES = 1024
+
+
+class DiskCache:
+    """SQLite cache tier with TTL metadata and size-capped LRU eviction, swept periodically"""
+    
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        evict_interval: float = DISK_EVICT_INTERVAL,
+        fallback_ttl: float = 0,
+        busy_timeout: float = DISK_BUSY_TIMEOUT
+    ):
+        # Imported here so servers without a disk tier don't pay for sqlite3 at startup
+        import sqlite3
+        
+        self.max_bytes = max_bytes
+        self.evict_interval = evict_interval
+        self.fallback_ttl = fallback_ttl
+        self._next_evict = 0.0
+        self._written_since_evict = 0
+        # accessed_at of rows read since the last sweep, written in one batch by the sweep
+        self._touched: dict = {}
+        # Autocommit + WAL so several processes can read while one writes; the short busy
+        # timeout keeps a locked file from stalling the event loop
+        self._db = sqlite3.connect(path, timeout=busy_timeout, isolation_level=None, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                stale_until REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS invalidations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                pattern TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+            """
+        )
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Load an entry, dropping it once it is past its fallback grace window"""
+        row = self._db.execute(
+            "SELECT endpoint, value, size, expires_at, stale_until, etag, last_modified FROM responses WHERE key = ?",
+            (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        
+        endpoint, value, size, expires_at, stale_until, etag, last_modified = row
+        entry = CacheEntry(endpoint, json.loads(value), size, expires_at, stale_until, etag, last_modified)
+        if not entry.is_retained(self.fallback_ttl):
+            self.delete(key)
+            return None
+        self._touched[key] = time.time()
+        if len(self._touched) >= DISK_MAX_PENDING_TOUCHES:
+            self._flush_touches()
+        return entry
+    
+    def set(self, key: str, entry: CacheEntry):
+        """
+        Store an entry, sweeping least recently used rows beyond the size cap every
+        evict_interval seconds, or sooner after an eighth of the cap was written
+        """
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                entry.endpoint,
+                json.dumps(entry.value, separators=(",", ":")),
+                entry.size,
+                entry.expires_at,
+                entry.stale_until,
+                entry.etag,
+                entry.last_modified,
+                time.time()
+            )
+        )
+        # The size cap is shared by every process using the file, so it is enforced by a
+        # periodic sweep rather than a per-process running total
+        self._written_since_evict += entry.size
+        if time.monotonic() >= self._next_evict or self._written_since_evict > self.max_bytes / 8:
+            self._next_evict = time.monotonic() + self.evict_interval
+            self._written_since_evict = 0
+            self._evict()
+    
+    def renew(self, key: str, expires_at: float, stale_until: float):
+        """Update an entry's expiry"""
+        self._db.execute(
+            "UPDATE responses SET expires_at = ?, stale_until = ? WHERE key = ?",
+            (expires_at, stale_until, key)
+        )
+    
+    def delete(self, key: str):
+        """Remove a single entry"""
+        self._touched.pop(key, None)
+        self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+    
+    def invalidate(self, patterns):
+        """Remove every entry whose endpoint matches one of the glob patterns and log the patterns"""
+        now = time.time()
+        for pattern in patterns:
+            self._db.execute("DELETE FROM responses WHERE endpoint GLOB ?", (pattern,))
+            self._db.execute("INSERT INTO invalidations (pattern, created_at) VALUES (?, ?)", (pattern, now))
+    
+    def last_invalidation(self) -> int:
+        """Id of the most recent logged invalidation"""
+        return self._db.execute("SELECT COALESCE(MAX(id), 0) FROM invalidations").fetchone()[0]
+    
+    def invalidations_since(self, last_id: int) -> list:
+        """(id, pattern) of every invalidation logged after last_id, oldest first"""
+        return self._db.execute(
+            "SELECT id, pattern FROM invalidations WHERE id > ? ORDER BY id",
+            (last_id,)
+        ).fetchall()
+    
+    def clear(self):
+        """Remove all entries"""
+        self._db.execute("DELETE FROM responses")
+    
+    def _flush_touches(self):
+        """Write the buffered accessed_at updates"""
+        touched, self._touched = self._touched, {}
+        self._db.executemany(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?",
+            [(accessed_at, key) for key, accessed_at in touched.items()]
+        )
+    
+    def _evict(self):
+        """Drop dead rows and old invalidations, then the least recently used rows until under the size cap"""
+        self._flush_touches()
+        now = time.time()
+        self._db.execute(
+            "DELETE FROM responses WHERE expires_at <= ?2 AND stale_until <= ?1 AND etag IS NULL AND last_modified IS NULL",
+            (now, now - self.fallback_ttl)
+        )
+        self._db.execute("DELETE FROM invalidations WHERE created_at < ?", (now - INVALIDATION_LOG_TTL,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        
+        excess = total - self.max_bytes
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._db.executemany("DELETE FROM responses WHERE key = ?", victims)
+    
+    def close(self):
+        self._flush_touches()
+        self._db.close()
+
+
+class ResponseCache:
+    """
+    LRU cache bounded by both entry count and total bytes,
+    optionally backed by a shared DiskCache tier
+    Expired entries are kept for fallback_ttl seconds, for callers to fall back on
+    when the API is unreachable.
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        disk: Optional[DiskCache] = None,
+        fallback_ttl: float = 0,
+        sync_interval: float = DISK_SYNC_INTERVAL
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.fallback_ttl = fallback_ttl
+        self.sync_interval = sync_interval
+        self.total_bytes = 0
+        self.disk = disk
+        # Bumped on every invalidation so in-flight fetches can tell they may be stale
+        self.generation = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._disk_error_logged_at = 0.0
+        # Last invalidation from the disk tier's log applied to the memory tier
+        self._seen_invalidation = self._disk_call("last_invalidation", default=0)
+        self._next_sync = time.monotonic() + sync_interval
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def _disk_call(self, method: str, *args, default: Any = None) -> Any:
+        """Call a disk tier method, falling back to default (memory tier only) if SQLite fails"""
+        if self.disk is None:
+            return default
+        import sqlite3
+        
+        try:
+            return getattr(self.disk, method)(*args)
+        except sqlite3.Error as e:
+            now = time.monotonic()
+            if now - self._disk_error_logged_at >= DISK_ERROR_LOG_INTERVAL:
+                self._disk_error_logged_at = now
+                print(f"   ⚠️  Disk cache {method} failed, using the memory cache only: {e}", file=sys.stderr)
+            return default
+    
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Return an entry and mark it recently used
+        Expired entries are dropped unless they can be served stale or revalidated,
+        or are within the fallback grace window
+        """
+        if self.disk is not None and time.monotonic() >= self._next_sync:
+            self.sync_invalidations()
+        entry = self._entries.get(key)
+        if entry is None:
+            # Fall through to the disk tier and promote what it has
+            entry = self._disk_call("get", key)
+            if entry is not None:
+                self._put(key, entry)
+            return entry
+        if not entry.is_retained(self.fallback_ttl):
+            self.delete(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+    
+    def set(
+        self,
+        key: str,
+        endpoint: str,
+        value: Any,
+        size: int,
+        ttl: float,
+        stale_ttl: float = 0,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """Store a response, servable stale for stale_ttl seconds after it expires"""
+        expires_at = time.time() + ttl
+        entry = CacheEntry(endpoint, value, size, expires_at, expires_at + stale_ttl, etag, last_modified)
+        self._put(key, entry)
+        self._disk_call("set", key, entry)
+    
+    def _put(self, key: str, entry: CacheEntry):
+        """Insert into the memory tier, evicting least recently used entries to stay within bounds"""
+        self._remove(key)
+        if entry.size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self.total_bytes += entry.size
+        
+        while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.total_bytes -= evicted.size
+    
+    def renew(self, key: str, ttl: float, stale_ttl: float = 0):
+        """Extend an entry's lifetime after the server confirmed it is unchanged"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.expires_at = time.time() + ttl
+            entry.stale_until = entry.expires_at + stale_ttl
+            self._disk_call("renew", key, entry.expires_at, entry.stale_until)
+    
+    def _remove(self, key: str):
+        """Remove an entry from the memory tier only"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+    
+    def delete(self, key: str):
+        """Remove a single entry if present"""
+        self._remove(key)
+        self._disk_call("delete", key)
+    
+    def invalidate(self, patterns) -> int:
+        """Remove every entry whose endpoint matches one of the glob patterns"""
+        removed = self._invalidate_memory(patterns)
+        self._disk_call("invalidate", patterns)
+        return removed
+    
+    def _invalidate_memory(self, patterns) -> int:
+        """Remove matching entries from the memory tier only"""
+        self.generation += 1
+        stale = [
+            key for key, entry in self._entries.items()
+            if any(fnmatchcase(entry.endpoint, pattern) for pattern in patterns)
+        ]
+        for key in stale:
+            self._remove(key)
+        return len(stale)
+    
+    def sync_invalidations(self):
+        """Apply invalidations other processes logged in the disk tier to the memory tier"""
+        self._next_sync = time.monotonic() + self.sync_interval
+        logged = self._disk_call("invalidations_since", self._seen_invalidation, default=[])
+        if logged:
+            self._seen_invalidation = logged[-1][0]
+            self._invalidate_memory([pattern for _, pattern in logged])
+    
+    def clear(self):
+        """Remove all entries"""
+        self._entries.clear()
+        self.total_bytes = 0
+        self._disk_call("clear")
@@ -0,0 +1,192 @@
+"""
+Declarative routing for Yunite MCP tools
+Maps tool arguments onto API paths, query params and request bodies
+"""
+
+from dataclasses import dataclass, field
+from string import Formatter
+from types import MappingProxyType
+from typing import Any, NamedTuple
+
+from mcp.types import Tool
+
+# HTTP methods make_api_request can send
+SUPPORTED_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE"})
+
+# Scheduling priority classes: interactive calls are let through ahead of bulk ones
+# when requests queue for the API (see concurrency.py)
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITIES = frozenset({INTERACTIVE, BULK})
+
+# Marker for arguments without a default (missing ones raise KeyError)
+REQUIRED = object()
+
+# Mapping that passes through every non-None argument not used in the path
+REST = object()
+
+
+class Arg(NamedTuple):
+    """A tool argument read into a request param or body field"""
+    name: str
+    default: Any = REQUIRED
+    
+    def resolve(self, arguments: dict) -> Any:
+        if self.default is REQUIRED:
+            return arguments[self.name]
+        return arguments.get(self.name, self.default)
+
+
+class _WildcardArguments(dict):
+    """Tool arguments that format missing keys as a glob wildcard"""
+    
+    def __missing__(self, key):
+        return "*"
+
+
+def route_group(path: str) -> str:
+    """Default route group: the first path segment, e.g. /events/{event_id} -> events"""
+    return path.strip("/").split("/", 1)[0] or "root"
+
+
+def default_priority(method: str) -> str:
+    """Default priority class: reads are interactive, writes bulk"""
+    return INTERACTIVE if method.upper() == "GET" else BULK
+
+
+@dataclass(frozen=True)
+class Route:
+    """
+    How a tool maps onto an API call
+    
+    params/data are one of: None, REST, an Arg (the whole value), a dict of
+    field -> Arg or constant, or a callable taking the tool arguments.
+    cache_ttl/stale_ttl control response caching for GETs; invalidates lists
+    the cached read endpoints (glob patterns over the arguments) a write makes stale.
+    group names the backend area for circuit breaking and concurrency limits
+    (default: first path segment); priority is its scheduling class when requests
+    queue (default: interactive for GETs, bulk for writes). timeout is the tool's
+    time budget in seconds, queueing and retries included (default: the server's),
+    and slow_call how long its calls may take before they count as slow for the
+    group's circuit breaker (default: the server's; a group takes its routes' longest).
+    hedge (GETs only) sends a second request when the first is slower than usual.
+    replayable=False marks a POST/PATCH whose repeats must reach the API (toggles,
+    activations, joins), so an identical write is never joined or replayed.
+    """
+    method: str
+    path: str
+    params: Any = None
+    data: Any = None
+    cache_ttl: float = 0
+    stale_ttl: float = 0
+    invalidates: tuple = ()
+    group: str = ""
+    priority: str = ""
+    timeout: float = 0
+    slow_call: float = 0
+    hedge: bool = False
+    replayable: bool = True
+    path_fields: frozenset = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        fields = frozenset(name for _, name, _, _ in Formatter().parse(self.path) if name)
+        object.__setattr__(self, "path_fields", fields)
+        if not self.group:
+            object.__setattr__(self, "group", route_group(self.path))
+        if not self.priority:
+            object.__setattr__(self, "priority", default_priority(self.method))
+    
+    def _resolve(self, spec: Any, arguments: dict) -> Any:
+        if spec is None:
+            return None
+        if spec is REST:
+            return {k: v for k, v in arguments.items() if v is not None and k not in self.path_fields}
+        if isinstance(spec, Arg):
+            return spec.resolve(arguments)
+        if callable(spec):
+            return spec(arguments)
+        return {key: value.resolve(arguments) if isinstance(value, Arg) else value for key, value in spec.items()}
+    
+    def build_request(self, arguments: dict) -> tuple:
+        """Return (endpoint, params, data) for a tool call"""
+        endpoint = self.path.format(**arguments) if self.path_fields else self.path
+        return endpoint, self._resolve(self.params, arguments), self._resolve(self.data, arguments)
+    
+    def request_options(self, arguments: dict) -> dict:
+        """Return the caching, circuit breaker, scheduling and deadline options to pass to make_api_request"""
+        # Response times are tracked per route, whatever its arguments
+        options = {"route": self.path, "group": self.group, "priority": self.priority}
+        if self.timeout:
+            options["timeout"] = self.timeout
+        if self.hedge:
+            options["hedge"] = True
+        if not self.replayable:
+            options["replayable"] = False
+        if self.cache_ttl:
+            options["cache_ttl"] = self.cache_ttl
+            options["stale_ttl"] = self.stale_ttl
+        if self.invalidates:
+            args = _WildcardArguments(arguments)
+            options["invalidates"] = [pattern.format_map(args) for pattern in self.invalidates]
+        return options
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """A tool declared once: its MCP schema plus the API route that serves it"""
+    name: str
+    description: str
+    inputSchema: dict
+    route: Route
+    
+    def __post_init__(self):
+        if self.route.method not in SUPPORTED_METHODS:
+            raise ValueError(f"{self.name}: unsupported HTTP method {self.route.method}")
+        if self.route.priority not in PRIORITIES:
+            raise ValueError(f"{self.name}: unknown priority {self.route.priority}")
+        if self.route.hedge and self.route.method != "GET":
+            raise ValueError(f"{self.name}: only GETs can be hedged")
+        missing = self.route.path_fields - set(self.inputSchema.get("required", ()))
+        if missing:
+            raise ValueError(f"{self.name}: path fields {sorted(missing)} are not required arguments")
+    
+    def to_tool(self) -> Tool:
+        return Tool(name=self.name, description=self.description, inputSchema=self.inputSchema)
+
+
+def build_routes(endpoints) -> MappingProxyType:
+    """Build a read-only tool name -> route table from endpoint declarations"""
+    routes = {}
+    for endpoint in endpoints:
+        if endpoint.name in routes:
+            raise ValueError(f"Tool declared twice: {endpoint.name}")
+        routes[endpoint.name] = endpoint.route
+    return MappingProxyType(routes)
+
+
+def build_registry(*route_tables) -> MappingProxyType:
+    """Merge route tables into one read-only tool registry, rejecting duplicate tool names"""
+    registry = {}
+    for table in route_tables:
+        for name, route in table.items():
+            if name in registry:
+                raise ValueError(f"Tool registered twice: {name}")
+            registry[name] = route
+    return MappingProxyType(registry)
+
+
+async def dispatch(registry: dict, name: str, arguments: dict, make_api_request, unknown_message: str = "Unknown tool"):
+    """Route a tool call through the registry with a single lookup"""
+    route = registry.get(name)
+    if route is None:
+        return {"error": True, "message": f"{unknown_message}: {name}"}
+    
+    arguments = arguments or {}
+    endpoint, params, data = route.build_request(arguments)
+    return await make_api_request(
+        route.method,
+        endpoint,
+        data=data,
+        params=params,
+        **route.request_options(arguments)
+    )
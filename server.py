@@ -2,24 +2,42 @@
 """
 Yunite MCP Server
 
-MCP server with stdio transport for the Yunite platform.
+MCP server for the Yunite platform over stdio, a Unix socket daemon (--daemon)
+or streamable HTTP and SSE (--http).
 Provides comprehensive read access to all API endpoints.
 """
 
 import os
 import json
+import argparse
+import time
+import hmac
+import base64
+import signal
+import random
 import asyncio
+import weakref
+from functools import partial
+from fnmatch import fnmatchcase
+from email.utils import parsedate_to_datetime
 from typing import Any, Optional
 
 import httpx
 from mcp.server import Server
-from mcp.types import Tool, TextContent
+from mcp.types import ListToolsRequest, ServerResult, Tool, TextContent
+from pydantic import PrivateAttr
 from dotenv import load_dotenv
 from mcp.server.stdio import stdio_server
-from tools_comprehensive import get_comprehensive_tools
-from tool_handlers import handle_tool_call
-from tools_write import get_write_tools
-from tool_handlers_write import handle_write_tool_call
+from profiles import DEFAULT_PROFILE, get_profile_endpoints
+from routing import BULK, INTERACTIVE, SUPPORTED_METHODS, build_registry, build_routes, dispatch, default_priority, route_group
+from response_cache import CacheEntry, DiskCache, ResponseCache, make_cache_key
+from token_store import TokenStore
+from identities import Identity, IdentityPool
+from idempotency import CompletedWrites, make_write_fingerprint
+from circuit_breaker import CircuitBreakers, CircuitOpenError
+from concurrency import ConcurrencyLimits, QueueTimeout
+from hedging import Hedging
+import metrics
 
 # Load environment variables
 load_dotenv()
@@ -29,118 +47,1143 @@ API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
 ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "")
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "")
 
+# Token lifetime handling (seconds)
+TOKEN_EXPIRY_BUFFER = 300
+TOKEN_RENEW_AHEAD = float(os.getenv("TOKEN_RENEW_AHEAD", "60"))
+TOKEN_RENEW_RETRY = float(os.getenv("TOKEN_RENEW_RETRY", "30"))
+TOKEN_FALLBACK_TTL = float(os.getenv("TOKEN_FALLBACK_TTL", "900"))
+
+# Connection pool for the shared HTTP client
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+
+# HTTP/2 multiplexing (negotiated via ALPN on https, or h2c with prior knowledge)
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "false").lower() in ("1", "true", "yes")
+HTTP2_PRIOR_KNOWLEDGE = os.getenv("HTTP2_PRIOR_KNOWLEDGE", "false").lower() in ("1", "true", "yes")
+
+# Response cache for read tools
+CACHE_ENABLED = os.getenv("CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+CACHE_MAX_ENTRIES = int(os.getenv("CACHE_MAX_ENTRIES", "1024"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+# Seconds an expired response is kept to answer (flagged stale) while its route group's
+# breaker is open or the API is saturated or too slow
+CACHE_FALLBACK_TTL = float(os.getenv("CACHE_FALLBACK_TTL", "300"))
+
+# Optional on-disk cache tier shared by all server processes (disabled when unset)
+CACHE_DISK_PATH = os.getenv("CACHE_DISK_PATH", "")
+CACHE_DISK_MAX_BYTES = int(os.getenv("CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Retries for idempotent requests (GET, PUT, DELETE): transport errors and transient
+# statuses are retried with capped exponential backoff and full jitter, waiting for
+# Retry-After on 429/503 unless it asks for longer than HTTP_RETRY_AFTER_MAX
+HTTP_RETRY_ATTEMPTS = int(os.getenv("HTTP_RETRY_ATTEMPTS", "3"))
+HTTP_RETRY_BACKOFF = float(os.getenv("HTTP_RETRY_BACKOFF", "0.2"))
+HTTP_RETRY_BACKOFF_MAX = float(os.getenv("HTTP_RETRY_BACKOFF_MAX", "5"))
+HTTP_RETRY_AFTER_MAX = float(os.getenv("HTTP_RETRY_AFTER_MAX", "30"))
+RETRY_METHODS = {"GET", "PUT", "DELETE"}
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# Non-idempotent writes get an Idempotency-Key, reused across their retries and, until the
+# write succeeds or gets a 4xx, by identical writes within IDEMPOTENCY_TTL seconds; an identical
+# write repeated within IDEMPOTENCY_TTL seconds replays the first result (0 disables both),
+# unless its route is marked replayable=False. Keyed writes are only retried with
+# HTTP_RETRY_KEYED_WRITES, for APIs that honour the Idempotency-Key header
+IDEMPOTENCY_TTL = float(os.getenv("IDEMPOTENCY_TTL", "60"))
+IDEMPOTENCY_MAX_ENTRIES = int(os.getenv("IDEMPOTENCY_MAX_ENTRIES", "1024"))
+IDEMPOTENCY_KEY_METHODS = {"POST", "PATCH"}
+HTTP_RETRY_KEYED_WRITES = os.getenv("HTTP_RETRY_KEYED_WRITES", "false").lower() in ("1", "true", "yes")
+
+# Time budget (seconds) for a tool call's API request, queueing and retries included,
+# unless its route declares one (see tools_comprehensive.py)
+REQUEST_TIMEOUT = float(os.getenv("REQUEST_TIMEOUT", "10"))
+
+# Circuit breakers per route group: a group whose calls within BREAKER_WINDOW seconds
+# (at least BREAKER_MIN_CALLS) fail at BREAKER_ERROR_RATE, or take BREAKER_SLOW_CALL seconds
+# at BREAKER_SLOW_RATE, fails fast for BREAKER_OPEN_SECONDS before a single probe is let through.
+# Groups of slow tools declare their own slow-call threshold on their routes
+BREAKER_ENABLED = os.getenv("BREAKER_ENABLED", "true").lower() in ("1", "true", "yes")
+BREAKER_WINDOW = float(os.getenv("BREAKER_WINDOW", "30"))
+BREAKER_MIN_CALLS = int(os.getenv("BREAKER_MIN_CALLS", "10"))
+BREAKER_ERROR_RATE = float(os.getenv("BREAKER_ERROR_RATE", "0.5"))
+BREAKER_SLOW_CALL = float(os.getenv("BREAKER_SLOW_CALL", "4"))
+BREAKER_SLOW_RATE = float(os.getenv("BREAKER_SLOW_RATE", "0.8"))
+BREAKER_OPEN_SECONDS = float(os.getenv("BREAKER_OPEN_SECONDS", "30"))
+
+# Adaptive (AIMD) limits on concurrent requests to the API, overall and per route group:
+# they start at LIMITER_INITIAL_LIMIT and shrink on 429/503/timeouts, or for a group when
+# responses take LIMITER_LATENCY_TOLERANCE times their route's baseline; requests beyond the limit
+# wait up to LIMITER_QUEUE_TIMEOUT seconds for a slot
+LIMITER_ENABLED = os.getenv("LIMITER_ENABLED", "true").lower() in ("1", "true", "yes")
+LIMITER_INITIAL_LIMIT = int(os.getenv("LIMITER_INITIAL_LIMIT", "10"))
+LIMITER_MAX_LIMIT = int(os.getenv("LIMITER_MAX_LIMIT", str(HTTP_MAX_CONNECTIONS)))
+LIMITER_GROUP_MAX_LIMIT = int(os.getenv("LIMITER_GROUP_MAX_LIMIT", "32"))
+LIMITER_LATENCY_TOLERANCE = float(os.getenv("LIMITER_LATENCY_TOLERANCE", "2"))
+LIMITER_QUEUE_TIMEOUT = float(os.getenv("LIMITER_QUEUE_TIMEOUT", "10"))
+OVERLOAD_STATUSES = {429, 503}
+
+# Share of freed slots each priority class gets while requests queue (reads are
+# interactive and writes bulk unless a tool's route says otherwise)
+PRIORITY_WEIGHTS = {
+    INTERACTIVE: float(os.getenv("PRIORITY_INTERACTIVE_WEIGHT", "4")),
+    BULK: float(os.getenv("PRIORITY_BULK_WEIGHT", "1"))
+}
+
+# Hedged reads (routes declared with hedge=True): a second request goes out when the first
+# is slower than the route's recent HEDGE_PERCENTILE response time, for at most
+# HEDGE_BUDGET extra requests per request to those routes
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "false").lower() in ("1", "true", "yes")
+HEDGE_BUDGET = float(os.getenv("HEDGE_BUDGET", "0.05"))
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", "95"))
+HEDGE_MIN_SAMPLES = int(os.getenv("HEDGE_MIN_SAMPLES", "20"))
+
+# Tool profile: which subset of tools is advertised and routed (see profiles.py);
+# overridden by the --profile command line option
+MCP_TOOL_PROFILE = os.getenv("MCP_TOOL_PROFILE", DEFAULT_PROFILE)
+
+# Unix socket the --daemon mode listens on and shim.py connects to
+MCP_DAEMON_SOCKET = os.getenv("MCP_DAEMON_SOCKET", "/tmp/yunite-mcp.sock")
+
+# Address the --http mode serves streamable HTTP (/mcp) and SSE (/sse) on,
+# and how many worker processes share it (overridden by --workers)
+SERVER_HOST = os.getenv("SERVER_HOST", "127.0.0.1")
+SERVER_PORT = int(os.getenv("SERVER_PORT", "7000"))
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", "1"))
+
+# Bearer token HTTP clients must send (Authorization: Bearer <token>); every tool call runs
+# with the admin account, so --http refuses a non-loopback SERVER_HOST while this is empty
+MCP_HTTP_TOKEN = os.getenv("MCP_HTTP_TOKEN", "")
+
+# Most users kept logged in at once through the login tool (least recently used dropped first)
+MAX_IDENTITIES = int(os.getenv("MAX_IDENTITIES", "64"))
+
+# File the API token is shared through between server processes (leave empty to disable);
+# --workers defaults it next to the disk cache
+MCP_TOKEN_STORE = os.getenv("MCP_TOKEN_STORE", "")
+
 # Initialize MCP server
 app = Server("yunite-mcp-server")
 
+# Active tool profile, its endpoints and tool name -> API route registry, set by load_tool_profile
+_tool_profile: Optional[str] = None
+_tool_endpoints: list = []
+TOOL_ROUTES = build_registry()
+
 # Cache for API token
 _api_token_cache = {"token": None, "expires_at": 0}
 
+# Token shared with other server processes, if configured
+_token_store = TokenStore(MCP_TOKEN_STORE) if MCP_TOKEN_STORE else None
+
+# Users logged in through the login tool, and the identity each MCP session is bound to
+_identities = IdentityPool(
+    lambda username, password: _request_token(username, password),
+    max_identities=MAX_IDENTITIES,
+    expiry_buffer=TOKEN_EXPIRY_BUFFER
+)
+_session_identities: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+# Set by --workers, whose stateless HTTP starts a new MCP session for every request
+_stateless_sessions = False
+
+# In-flight token refresh and background renewal tasks
+_token_refresh: Optional[asyncio.Task] = None
+_token_renewer: Optional[asyncio.Task] = None
+
+# Cache for GET responses, keyed by endpoint and params
+_response_cache = ResponseCache(
+    max_entries=CACHE_MAX_ENTRIES,
+    max_bytes=CACHE_MAX_BYTES,
+    disk=DiskCache(CACHE_DISK_PATH, CACHE_DISK_MAX_BYTES, fallback_ttl=CACHE_FALLBACK_TTL) if CACHE_ENABLED and CACHE_DISK_PATH else None,
+    fallback_ttl=CACHE_FALLBACK_TTL
+)
+
+# In-flight GET requests, keyed by endpoint and params
+_inflight_gets: dict = {}
+
+# In-flight and recently completed keyed writes, by request fingerprint
+_inflight_writes: dict = {}
+_completed_writes = CompletedWrites(IDEMPOTENCY_TTL, IDEMPOTENCY_MAX_ENTRIES)
+
+# Response times of hedged routes and the budget their hedges draw on
+_hedging = Hedging(HEDGE_BUDGET, HEDGE_PERCENTILE, HEDGE_MIN_SAMPLES)
+
+# How many callers await each shared in-flight request task
+_shared_waiters: dict = {}
+
+# Background refreshes of stale cache entries, keyed by cache key
+_background_refreshes: dict = {}
+
+# Circuit breakers for API route groups, created on first use
+_circuit_breakers = CircuitBreakers(
+    window=BREAKER_WINDOW,
+    min_calls=BREAKER_MIN_CALLS,
+    error_rate=BREAKER_ERROR_RATE,
+    slow_call=BREAKER_SLOW_CALL,
+    slow_rate=BREAKER_SLOW_RATE,
+    open_seconds=BREAKER_OPEN_SECONDS
+)
+
+# Concurrency limits for API requests; the global one only reacts to explicit overload,
+# since response times differ too much between route groups to share a baseline
+_concurrency_limits = ConcurrencyLimits(
+    global_settings={
+        "initial_limit": LIMITER_INITIAL_LIMIT,
+        "max_limit": LIMITER_MAX_LIMIT,
+        "weights": PRIORITY_WEIGHTS
+    },
+    group_settings={
+        "initial_limit": LIMITER_INITIAL_LIMIT,
+        "max_limit": LIMITER_GROUP_MAX_LIMIT,
+        "latency_tolerance": LIMITER_LATENCY_TOLERANCE,
+        "weights": PRIORITY_WEIGHTS
+    }
+)
+
+# Metrics for requests to the Yunite API
+API_REQUESTS = metrics.Counter("yunite_api_requests_total", "Requests sent to the Yunite API, by method and status or error")
+API_RETRIES = metrics.Counter("yunite_api_retries_total", "Requests retried after a transient failure, by method and reason")
+API_RETRIES_EXHAUSTED = metrics.Counter("yunite_api_retries_exhausted_total", "Requests that still failed after their last retry, by method")
+WRITE_REPLAYS = metrics.Counter("yunite_write_replays_total", "Repeated writes joined to an identical in-flight write or replayed from the completed-write record, by method")
+BREAKER_REJECTIONS = metrics.Counter("yunite_circuit_breaker_rejections_total", "Requests failed fast by an open circuit breaker, by route group")
+BREAKER_STATE = metrics.Gauge(
+    "yunite_circuit_breaker_state",
+    "Circuit breaker state by route group (0 closed, 1 half-open, 2 open)",
+    read=_circuit_breakers.states
+)
+CONCURRENCY_LIMIT = metrics.Gauge(
+    "yunite_concurrency_limit",
+    "Current adaptive limit on concurrent API requests, globally and by route group",
+    read=_concurrency_limits.limits
+)
+CONCURRENCY_IN_FLIGHT = metrics.Gauge(
+    "yunite_concurrency_in_flight",
+    "API requests holding a concurrency slot, globally and by route group",
+    read=_concurrency_limits.in_flight
+)
+CONCURRENCY_QUEUE_DEPTH = metrics.Gauge(
+    "yunite_concurrency_queue_depth",
+    "API requests waiting for a concurrency slot, globally and by route group, by priority class",
+    read=_concurrency_limits.queue_depths
+)
+HEDGED_REQUESTS = metrics.Counter("yunite_hedged_requests_total", "Second requests sent for slow hedged reads, by route")
+HEDGE_WINS = metrics.Counter("yunite_hedge_wins_total", "Hedged reads answered by the second request, by route")
+CONCURRENCY_QUEUE_TIMEOUTS = metrics.Counter(
+    "yunite_concurrency_queue_timeouts_total",
+    "API requests that gave up waiting for a concurrency slot, by scope"
+)
+
+# Process-wide HTTP client, created lazily on first use
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_supported() -> bool:
+    """Check whether HTTP/2 is enabled and the h2 package is installed"""
+    import sys
+    
+    if not HTTP2_ENABLED:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        print("   ⚠️  HTTP2_ENABLED is set but 'h2' is not installed, using HTTP/1.1", file=sys.stderr)
+        return False
+    return True
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared pooled HTTP client, creating it on first use"""
+    global _http_client
+    
+    if _http_client is None or _http_client.is_closed:
+        http2 = _http2_supported()
+        # All requests go to API_BASE_URL, so the pool limits are effectively per-host limits
+        _http_client = httpx.AsyncClient(
+            http1=not (http2 and HTTP2_PRIOR_KNOWLEDGE),
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+            )
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client and its pooled connections"""
+    global _http_client
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _token_expiry(data: dict) -> float:
+    """Work out when a freshly issued token expires"""
+    # Prefer the exp claim from the JWT (base64url, padding stripped)
+    try:
+        payload = data["access_token"].split('.')[1]
+        payload += '=' * (-len(payload) % 4)
+        exp = json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+        if exp:
+            return float(exp)
+    except Exception:
+        pass
+    
+    # Fall back to the login response, then to a conservative default
+    if data.get("expires_in"):
+        return time.time() + float(data["expires_in"])
+    return time.time() + TOKEN_FALLBACK_TTL
+
+
+async def _login() -> str:
+    """Log in as the admin user and cache the new token, sharing it with other processes if configured"""
+    if _token_store is None:
+        return await _login_to_api()
+    
+    # Serialize logins across processes, then reuse a newer token another process just stored
+    async with _token_store.login_lock():
+        shared = _token_store.load()
+        if (
+            shared is not None
+            and shared["expires_at"] > _api_token_cache["expires_at"]
+            and shared["expires_at"] > time.time() + TOKEN_EXPIRY_BUFFER
+        ):
+            _api_token_cache["token"] = shared["token"]
+            _api_token_cache["expires_at"] = shared["expires_at"]
+            return _api_token_cache["token"]
+        
+        token = await _login_to_api()
+        _token_store.save(token, _api_token_cache["expires_at"])
+        return token
+
+
+async def _request_token(username: str, password: str) -> tuple:
+    """Log in to the Yunite API and return the new (token, expires_at)"""
+    client = get_http_client()
+    response = await client.post(
+        f"{API_BASE_URL}/auth/login",
+        json={
+            "username": username,
+            "password": password
+        }
+    )
+    response.raise_for_status()
+    data = response.json()
+    return data["access_token"], _token_expiry(data)
+
+
+async def _login_to_api() -> str:
+    """Log in to the Yunite API as the admin user and cache the new token"""
+    token, expires_at = await _request_token(ADMIN_USERNAME, ADMIN_PASSWORD)
+    _api_token_cache["token"] = token
+    _api_token_cache["expires_at"] = expires_at
+    return token
+
+
+def _on_token_refresh_done(task: asyncio.Task):
+    """Clear the in-flight refresh once it settles"""
+    global _token_refresh
+    
+    if _token_refresh is task:
+        _token_refresh = None
+    if not task.cancelled():
+        # Mark the exception as retrieved; waiters re-raise it themselves
+        task.exception()
+
+
+async def refresh_api_token() -> str:
+    """Refresh the API token, sharing one in-flight login between all callers"""
+    global _token_refresh
+    
+    if _token_refresh is None:
+        _token_refresh = asyncio.ensure_future(_login())
+        _token_refresh.add_done_callback(_on_token_refresh_done)
+    
+    # Shield so a cancelled caller doesn't abort the login for everyone else
+    return await asyncio.shield(_token_refresh)
+
 
 async def get_api_token() -> str:
     """Get or refresh API token"""
-    import time
-    
     # Check if cached token is still valid (with 5 minute buffer)
-    if _api_token_cache["token"] and _api_token_cache["expires_at"] > time.time() + 300:
+    if _api_token_cache["token"] and _api_token_cache["expires_at"] > time.time() + TOKEN_EXPIRY_BUFFER:
         return _api_token_cache["token"]
     
-    # Get new token
-    async with httpx.AsyncClient() as client:
-        response = await client.post(
-            f"{API_BASE_URL}/auth/login",
-            json={
-                "username": ADMIN_USERNAME,
-                "password": ADMIN_PASSWORD
-            }
-        )
-        response.raise_for_status()
-        data = response.json()
-        
-        # Cache the token
-        _api_token_cache["token"] = data["access_token"]
+    return await refresh_api_token()
+
+
+async def _renew_api_token_forever():
+    """Log in, then renew the token ahead of the expiry buffer so tool calls never wait on login"""
+    import sys
+    
+    while True:
+        # Log in straight away while there is no token yet
+        if _api_token_cache["token"]:
+            renew_at = _api_token_cache["expires_at"] - TOKEN_EXPIRY_BUFFER - TOKEN_RENEW_AHEAD
+            if _token_store is not None and not _token_store.is_owner():
+                # Only the owning process renews ahead; the rest pick its token up from the store
+                renew_at += TOKEN_RENEW_AHEAD
+            # Floor the wait so tokens shorter than the buffer can't cause a login loop
+            await asyncio.sleep(max(renew_at - time.time(), 1))
         
-        # Decode JWT to get expiration (simple base64 decode)
-        import base64
-        import json as json_module
+        first_login = not _api_token_cache["token"]
         try:
-            payload = data["access_token"].split('.')[1]
-            # Add padding if needed
-            payload += '=' * (4 - len(payload) % 4)
-            decoded = json_module.loads(base64.b64decode(payload))
-            _api_token_cache["expires_at"] = decoded.get("exp", 0)
-        except:
-            # If decode fails, cache for 1 hour
-            _api_token_cache["expires_at"] = time.time() + 3600
-        
-        return _api_token_cache["token"]
+            await refresh_api_token()
+            if first_login:
+                print(f"   ✅ Token generated successfully", file=sys.stderr)
+        except Exception as e:
+            if first_login:
+                print(f"   ❌ Failed to generate token: {e}", file=sys.stderr)
+                print(f"   Please check your ADMIN_USERNAME and ADMIN_PASSWORD in .env", file=sys.stderr)
+            else:
+                print(f"   ⚠️  Background token renewal failed: {e}", file=sys.stderr)
+            await asyncio.sleep(TOKEN_RENEW_RETRY)
+
 
+def start_token_renewal():
+    """Start the background token renewal task"""
+    global _token_renewer
+    
+    if _token_renewer is None or _token_renewer.done():
+        _token_renewer = asyncio.ensure_future(_renew_api_token_forever())
+
+
+async def stop_token_renewal():
+    """Stop the background token renewal task"""
+    global _token_renewer
+    
+    if _token_renewer is not None:
+        _token_renewer.cancel()
+        try:
+            await _token_renewer
+        except asyncio.CancelledError:
+            pass
+        _token_renewer = None
 
-async def get_headers():
-    """Get headers with authentication token"""
-    token = await get_api_token()
+
+async def get_headers(identity: Optional[Identity] = None):
+    """Get headers with the logged-in user's token, or the admin token"""
+    # Login runs in the background at startup; a failure surfaces on the first call
+    try:
+        if identity is not None:
+            token = await identity.get_token(TOKEN_EXPIRY_BUFFER)
+        else:
+            token = await get_api_token()
+    except Exception as e:
+        raise RuntimeError(f"Authentication with the Yunite API failed: {e}") from e
     return {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json"
     }
 
 
-async def make_api_request(
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Seconds the API asked us to wait in Retry-After (delta-seconds or an HTTP date)"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+async def _send_attempt(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    group: str,
+    priority: str,
+    deadline: float,
+    route: str,
+    **kwargs
+) -> httpx.Response:
+    """
+    Send one attempt through the group's circuit breaker and concurrency limits,
+    within what is left of the deadline (raising asyncio.TimeoutError once it passes)
+    Its outcome and latency feed the breaker and adapt the limits (against the route's baseline).
+    """
+    if not _remaining(deadline):
+        raise asyncio.TimeoutError()
+    
+    breaker = _circuit_breakers.get(group) if BREAKER_ENABLED else None
+    if breaker is not None and not breaker.allow():
+        BREAKER_REJECTIONS.inc(group=group)
+        raise CircuitOpenError(group, breaker.retry_in())
+    
+    if LIMITER_ENABLED:
+        try:
+            await _concurrency_limits.acquire(group, min(LIMITER_QUEUE_TIMEOUT, _remaining(deadline)), priority)
+        except BaseException as e:
+            if isinstance(e, QueueTimeout):
+                CONCURRENCY_QUEUE_TIMEOUTS.inc(scope=e.scope)
+            if breaker is not None:
+                breaker.release()
+            raise
+    
+    started = time.monotonic()
+    remaining = _remaining(deadline)
+    try:
+        # The httpx timeout lifts the client's per-phase default, wait_for bounds the whole call
+        response = await asyncio.wait_for(client.request(method, url, timeout=remaining, **kwargs), remaining)
+    except (httpx.TransportError, asyncio.TimeoutError) as e:
+        timed_out = isinstance(e, (httpx.TimeoutException, asyncio.TimeoutError))
+        _finish_attempt(breaker, group, route, time.monotonic() - started, True, timed_out)
+        raise
+    except BaseException:
+        # Cancelled: free the slots without judging the backend by it
+        if breaker is not None:
+            breaker.release()
+        if LIMITER_ENABLED:
+            _concurrency_limits.release(group)
+        raise
+    
+    status = response.status_code
+    _finish_attempt(breaker, group, route, time.monotonic() - started, status >= 500, status in OVERLOAD_STATUSES)
+    return response
+
+
+async def _send_hedged(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    group: str,
+    priority: str,
+    deadline: float,
+    route: str,
+    **kwargs
+) -> httpx.Response:
+    """
+    Send an attempt, and an identical second one if the first is slower than usual for the route
+    The first answer wins and the other attempt is cancelled; hedges are capped by the budget.
+    """
+    _hedging.budget.earn()
+    send = partial(_send_attempt, client, method, url, group, priority, deadline, route, **kwargs)
+    attempts = [(asyncio.ensure_future(send()), time.monotonic())]
+    try:
+        delay = _hedging.delay(route)
+        if delay is not None:
+            done, _ = await asyncio.wait([attempts[0][0]], timeout=delay)
+            if not done and _hedging.budget.spend():
+                HEDGED_REQUESTS.inc(route=route)
+                attempts.append((asyncio.ensure_future(send()), time.monotonic()))
+        
+        pending = {attempt for attempt, _ in attempts}
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for index, (attempt, started) in enumerate(attempts):
+                if attempt in done and attempt.exception() is None:
+                    _hedging.record(route, time.monotonic() - started)
+                    if index:
+                        HEDGE_WINS.inc(route=route)
+                    return attempt.result()
+        
+        # Every attempt failed: surface the first one's error
+        return attempts[0][0].result()
+    finally:
+        for attempt, _ in attempts:
+            if not attempt.done():
+                attempt.cancel()
+            elif not attempt.cancelled():
+                # Retrieve the loser's error so it isn't logged as never retrieved
+                attempt.exception()
+
+
+def _remaining(deadline: float) -> float:
+    """Seconds left until a deadline on the monotonic clock"""
+    return max(deadline - time.monotonic(), 0)
+
+
+def _finish_attempt(breaker, group: str, route: str, latency: float, failed: bool, overloaded: bool):
+    """Report a finished attempt to its circuit breaker and concurrency limits"""
+    if breaker is not None:
+        breaker.record(failed, latency)
+    if LIMITER_ENABLED:
+        _concurrency_limits.release(group, latency, overloaded, route)
+
+
+async def _request_with_retries(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    group: str,
+    priority: str,
+    deadline: float,
+    route: str,
+    hedge: bool = False,
+    **kwargs
+) -> httpx.Response:
+    """
+    Send a request, retrying idempotent methods (and keyed writes, if enabled) on transport errors and transient statuses
+    Retries stop once the backoff would run past the deadline. With hedge set, attempts are hedged.
+    """
+    keyed = HTTP_RETRY_KEYED_WRITES and "Idempotency-Key" in kwargs.get("headers", {})
+    retries = HTTP_RETRY_ATTEMPTS if method in RETRY_METHODS or keyed else 0
+    attempt = 0
+    while True:
+        response = None
+        try:
+            if hedge and HEDGE_ENABLED:
+                response = await _send_hedged(client, method, url, group, priority, deadline, route, **kwargs)
+            else:
+                response = await _send_attempt(client, method, url, group, priority, deadline, route, **kwargs)
+        except httpx.TransportError as e:
+            API_REQUESTS.inc(method=method, status=type(e).__name__)
+            if attempt >= retries:
+                if retries:
+                    API_RETRIES_EXHAUSTED.inc(method=method)
+                raise
+            error = e
+            reason = type(e).__name__
+            delay = None
+        else:
+            API_REQUESTS.inc(method=method, status=response.status_code)
+            if response.status_code not in RETRY_STATUSES or not retries:
+                return response
+            
+            delay = _retry_after(response) if response.status_code in (429, 503) else None
+            if attempt >= retries or (delay is not None and delay > HTTP_RETRY_AFTER_MAX):
+                API_RETRIES_EXHAUSTED.inc(method=method)
+                return response
+            reason = str(response.status_code)
+        
+        if delay is None:
+            # Full jitter keeps clients that failed together from retrying together
+            delay = random.uniform(0, min(HTTP_RETRY_BACKOFF_MAX, HTTP_RETRY_BACKOFF * 2 ** attempt))
+        if delay >= _remaining(deadline):
+            # No time left for another attempt
+            API_RETRIES_EXHAUSTED.inc(method=method)
+            if response is None:
+                raise error
+            return response
+        API_RETRIES.inc(method=method, reason=reason)
+        attempt += 1
+        await asyncio.sleep(delay)
+
+
+async def _send_request(
     method: str,
     endpoint: str,
     data: Optional[dict] = None,
-    params: Optional[dict] = None
+    params: Optional[dict] = None,
+    cache_key: Optional[str] = None,
+    cache_ttl: float = 0,
+    stale_ttl: float = 0,
+    entry: Optional[CacheEntry] = None,
+    identity: Optional[Identity] = None,
+    idempotency_key: Optional[str] = None,
+    group: Optional[str] = None,
+    priority: Optional[str] = None,
+    deadline: Optional[float] = None,
+    route: Optional[str] = None,
+    hedge: bool = False
 ) -> dict:
-    """Make an API request to the API"""
+    """
+    Send a request to the API as the given identity, storing cacheable results and revalidating the given entry
+    route is the path template its response times are tracked under (default: the endpoint).
+    """
+    # Writes that land while this request is in flight may make its response stale
+    generation = _response_cache.generation
     url = f"{API_BASE_URL}{endpoint}"
-    headers = await get_headers()
+    headers = await get_headers(identity)
+    if idempotency_key:
+        headers["Idempotency-Key"] = idempotency_key
+    
+    # Expired entry with validators: ask the server whether it changed
+    if entry is not None:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
     
-    async with httpx.AsyncClient() as client:
+    client = get_http_client()
+    try:
+        if method.upper() not in SUPPORTED_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        response = await _request_with_retries(
+            client,
+            method.upper(),
+            url,
+            group or route_group(endpoint),
+            priority or default_priority(method),
+            deadline or time.monotonic() + REQUEST_TIMEOUT,
+            route or endpoint,
+            hedge,
+            headers=headers,
+            json=data,
+            params=params
+        )
+        
+        if response.status_code == 304 and entry is not None:
+            _response_cache.renew(cache_key, cache_ttl, stale_ttl)
+            return entry.value
+        
+        response.raise_for_status()
+        result = response.json()
+        if cache_key is not None and _response_cache.generation == generation:
+            _response_cache.set(
+                cache_key,
+                endpoint,
+                result,
+                len(response.content),
+                cache_ttl,
+                stale_ttl=stale_ttl,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+        return result
+    except httpx.HTTPStatusError as e:
+        return {
+            "error": True,
+            "status_code": e.response.status_code,
+            "message": str(e),
+            "detail": e.response.text
+        }
+    except CircuitOpenError as e:
+        return {
+            "error": True,
+            "circuit_open": True,
+            "group": e.group,
+            "retry_in": round(e.retry_in, 1),
+            "message": str(e)
+        }
+    except QueueTimeout as e:
+        return {
+            "error": True,
+            "overloaded": True,
+            "scope": e.scope,
+            "message": str(e)
+        }
+    except (asyncio.TimeoutError, httpx.TimeoutException) as e:
+        return {
+            "error": True,
+            "timeout": True,
+            "message": str(e) or "Request to the Yunite API did not finish within its deadline"
+        }
+    except Exception as e:
+        return {
+            "error": True,
+            "message": str(e)
+        }
+
+
+async def _send_shared_get(key: str, endpoint: str, params: Optional[dict], **cache_options) -> dict:
+    """Send a GET, sharing one in-flight request between all callers asking for the same key"""
+    task = _inflight_gets.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_send_request("GET", endpoint, params=params, **cache_options))
+        _inflight_gets[key] = task
+        task.add_done_callback(lambda done: _inflight_gets.pop(key, None) if _inflight_gets.get(key) is done else None)
+    
+    return await _await_shared(task, _inflight_gets, key)
+
+
+async def _await_shared(task: asyncio.Task, inflight: dict, key: str) -> dict:
+    """
+    Await a request shared between callers, cancelling it once all of them have gone
+    Shielded so one cancelled caller doesn't abort the request for the others; the
+    last one to leave cancels it, freeing its connection and concurrency slot.
+    """
+    _shared_waiters[task] = _shared_waiters.get(task, 0) + 1
+    try:
+        return await asyncio.shield(task)
+    finally:
+        _shared_waiters[task] -= 1
+        if not _shared_waiters[task]:
+            del _shared_waiters[task]
+            if not task.done():
+                task.cancel()
+                # Later callers start a fresh request instead of joining the cancelled one
+                if inflight.get(key) is task:
+                    del inflight[key]
+
+
+def _write_fingerprint(method: str, endpoint: str, data: Optional[dict], params: Optional[dict], identity: Optional[Identity]) -> str:
+    """Fingerprint of a write sent as the given identity"""
+    namespace = identity.cache_namespace if identity is not None else None
+    return make_write_fingerprint(method, endpoint, data, params, namespace)
+
+
+def _is_settled(result: Any) -> bool:
+    """Whether a write's outcome is known: it succeeded, or the API refused it with a 4xx other than 429"""
+    if not (isinstance(result, dict) and result.get("error")):
+        return True
+    status = result.get("status_code")
+    return status is not None and 400 <= status < 500 and status != 429
+
+
+def _record_completed_write(fingerprint: str, endpoint: str, task: asyncio.Task):
+    """Stop sharing a finished write, remember it if it succeeded and drop its key once settled"""
+    if _inflight_writes.get(fingerprint) is task:
+        del _inflight_writes[fingerprint]
+    if task.cancelled() or task.exception() is not None:
+        return
+    
+    result = task.result()
+    if not (isinstance(result, dict) and result.get("error")):
+        _completed_writes.record(fingerprint, result, endpoint)
+    if _is_settled(result):
+        _completed_writes.settle(fingerprint)
+
+
+async def _send_keyed_write(
+    method: str,
+    endpoint: str,
+    data: Optional[dict],
+    params: Optional[dict],
+    identity: Optional[Identity],
+    group: Optional[str] = None,
+    priority: Optional[str] = None,
+    deadline: Optional[float] = None,
+    route: Optional[str] = None
+) -> dict:
+    """
+    Send a POST/PATCH under an Idempotency-Key that its retries and repeats reuse
+    An identical write that is in flight or just completed is joined or replayed
+    instead, and its result returned flagged replayed
+    """
+    fingerprint = _write_fingerprint(method, endpoint, data, params, identity)
+    result = _completed_writes.get(fingerprint)
+    if result is not None:
+        WRITE_REPLAYS.inc(method=method.upper())
+        return {"replayed": True, "data": result}
+    
+    task = _inflight_writes.get(fingerprint)
+    joined = task is not None
+    if not joined:
+        task = asyncio.ensure_future(
+            _send_request(
+                method,
+                endpoint,
+                data,
+                params,
+                identity=identity,
+                idempotency_key=_completed_writes.key(fingerprint, endpoint),
+                group=group,
+                priority=priority,
+                deadline=deadline,
+                route=route
+            )
+        )
+        _inflight_writes[fingerprint] = task
+        task.add_done_callback(partial(_record_completed_write, fingerprint, endpoint))
+    
+    # Callers joining this write keep it going if the one that started it is cancelled
+    result = await _await_shared(task, _inflight_writes, fingerprint)
+    if joined and not (isinstance(result, dict) and result.get("error")):
+        WRITE_REPLAYS.inc(method=method.upper())
+        return {"replayed": True, "data": result}
+    return result
+
+
+def _detach_inflight_gets(patterns):
+    """Stop sharing in-flight GETs for endpoints a write just changed, so later callers fetch afresh"""
+    for key in list(_inflight_gets):
+        endpoint = key.split("?", 1)[0]
+        if any(fnmatchcase(endpoint, pattern) for pattern in patterns):
+            del _inflight_gets[key]
+
+
+def _refresh_in_background(
+    endpoint: str,
+    params: Optional[dict],
+    cache_key: str,
+    cache_ttl: float,
+    stale_ttl: float,
+    entry: CacheEntry,
+    identity: Optional[Identity] = None,
+    group: Optional[str] = None,
+    timeout: Optional[float] = None,
+    route: Optional[str] = None
+):
+    """Refresh a stale cache entry without blocking the caller, once per key"""
+    if cache_key in _background_refreshes:
+        return
+    
+    async def refresh():
         try:
-            if method.upper() == "GET":
-                response = await client.get(url, headers=headers, params=params)
-            elif method.upper() == "POST":
-                response = await client.post(url, headers=headers, json=data, params=params)
-            elif method.upper() == "PUT":
-                response = await client.put(url, headers=headers, json=data, params=params)
-            elif method.upper() == "DELETE":
-                response = await client.delete(url, headers=headers, params=params)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            return {
-                "error": True,
-                "status_code": e.response.status_code,
-                "message": str(e),
-                "detail": e.response.text
-            }
-        except Exception as e:
+            await _send_shared_get(
+                cache_key,
+                endpoint,
+                params,
+                cache_key=cache_key,
+                cache_ttl=cache_ttl,
+                stale_ttl=stale_ttl,
+                entry=entry,
+                identity=identity,
+                group=group,
+                # Nobody is waiting on a background refresh
+                priority=BULK,
+                deadline=time.monotonic() + (timeout or REQUEST_TIMEOUT),
+                route=route
+            )
+        except Exception:
+            # Keep serving the stale value; the next caller past the stale window fetches in the foreground
+            pass
+        finally:
+            _background_refreshes.pop(cache_key, None)
+    
+    _background_refreshes[cache_key] = asyncio.ensure_future(refresh())
+
+
+async def make_api_request(
+    method: str,
+    endpoint: str,
+    data: Optional[dict] = None,
+    params: Optional[dict] = None,
+    cache_ttl: float = 0,
+    stale_ttl: float = 0,
+    invalidates: Optional[list] = None,
+    identity: Optional[Identity] = None,
+    group: Optional[str] = None,
+    priority: Optional[str] = None,
+    timeout: Optional[float] = None,
+    route: Optional[str] = None,
+    hedge: bool = False,
+    replayable: bool = True
+) -> dict:
+    """
+    Make an API request to the API, as the given logged-in identity or the admin user
+    GETs are served from cache when cache_ttl is set, revalidating expired
+    entries with their ETag/Last-Modified. With stale_ttl, an expired entry is
+    returned (flagged stale) for that long while it refreshes in the background.
+    Concurrent identical GETs share a single in-flight request.
+    POST/PATCH writes carry an Idempotency-Key and, if replayable, replay a repeated
+    identical write (flagged replayed).
+    Writes evict the cached endpoints matching the invalidates patterns, and the
+    records of earlier writes to them, so those are sent again if repeated.
+    Each identity's responses are cached and shared under its own namespace.
+    Requests wait for a slot under the adaptive concurrency limits, let through
+    by weighted fair queuing over their priority classes, and fail fast
+    while the circuit breaker for their route group is open; GETs that fail fast
+    or time out waiting fall back to an expired cached response if there is one
+    (kept up to CACHE_FALLBACK_TTL seconds past expiry).
+    Everything, queueing and retries included, must finish within timeout seconds
+    (REQUEST_TIMEOUT by default); a cancelled call cancels its API request.
+    route is the path template response times are tracked under, for the limits'
+    baselines and hedging; GETs with hedge set are hedged when HEDGE_ENABLED is set.
+    """
+    deadline = time.monotonic() + (timeout or REQUEST_TIMEOUT)
+    namespace = identity.cache_namespace if identity is not None else None
+    cache_key = None
+    entry = None
+    if cache_ttl and CACHE_ENABLED and method.upper() == "GET":
+        cache_key = make_cache_key(endpoint, params, namespace)
+        entry = _response_cache.get(cache_key)
+        if entry is not None:
+            if entry.is_fresh:
+                return entry.value
+            if entry.is_servable_stale:
+                _refresh_in_background(endpoint, params, cache_key, cache_ttl, stale_ttl, entry, identity, group, timeout, route)
+                return {
+                    "stale": True,
+                    "stale_seconds": round(time.time() - entry.expires_at, 1),
+                    "data": entry.value
+                }
+    
+    if method.upper() == "GET":
+        result = await _send_shared_get(
+            cache_key or make_cache_key(endpoint, params, namespace),
+            endpoint,
+            params,
+            cache_key=cache_key,
+            cache_ttl=cache_ttl,
+            stale_ttl=stale_ttl,
+            entry=entry,
+            identity=identity,
+            group=group,
+            priority=priority,
+            deadline=deadline,
+            route=route,
+            hedge=hedge
+        )
+        fallback_flags = [flag for flag in ("circuit_open", "overloaded", "timeout") if isinstance(result, dict) and result.get(flag)]
+        if entry is not None and fallback_flags:
+            # Backend area is down, saturated or too slow: an expired answer beats none
             return {
-                "error": True,
-                "message": str(e)
+                "stale": True,
+                "stale_seconds": round(time.time() - entry.expires_at, 1),
+                "data": entry.value,
+                **{flag: True for flag in fallback_flags}
             }
+        return result
+    
+    keyed = method.upper() in IDEMPOTENCY_KEY_METHODS and IDEMPOTENCY_TTL > 0
+    fingerprint = _write_fingerprint(method, endpoint, data, params, identity) if keyed else None
+    try:
+        if keyed and replayable:
+            return await _send_keyed_write(method, endpoint, data, params, identity, group, priority, deadline, route)
+        result = await _send_request(
+            method,
+            endpoint,
+            data,
+            params,
+            identity=identity,
+            idempotency_key=_completed_writes.key(fingerprint, endpoint) if keyed else None,
+            group=group,
+            priority=priority,
+            deadline=deadline,
+            route=route
+        )
+        if keyed and _is_settled(result):
+            _completed_writes.settle(fingerprint)
+        return result
+    finally:
+        # Evict even on failure: the write may have been applied before the error
+        if invalidates:
+            _response_cache.invalidate(invalidates)
+            _detach_inflight_gets(invalidates)
+            # A write keeps its own record and key, so repeating it still replays or reuses the key
+            _completed_writes.invalidate(invalidates, keep=fingerprint)
+
+
+class SerializedResult(ServerResult):
+    """A ServerResult that is dumped once and reuses the dumped dict for every response"""
+    _dumped: dict = PrivateAttr(default_factory=dict)
+    
+    def model_dump(self, **kwargs) -> dict:
+        key = repr(sorted(kwargs.items()))
+        if key not in self._dumped:
+            self._dumped[key] = super().model_dump(**kwargs)
+        return self._dumped[key]
+
+
+# Tool list and its serialized tools/list response, built on first request
+_tool_list: Optional[list[Tool]] = None
+_list_tools_result: Optional[SerializedResult] = None
+
+
+def load_tool_profile(name: str):
+    """Route and advertise only the endpoints in the named tool profile"""
+    global _tool_profile, _tool_endpoints, TOOL_ROUTES, _tool_list, _list_tools_result
+    
+    read_endpoints, write_endpoints = get_profile_endpoints(name)
+    _tool_profile = name
+    _tool_endpoints = read_endpoints + write_endpoints
+    TOOL_ROUTES = build_registry(build_routes(read_endpoints), build_routes(write_endpoints))
+    
+    # A group's breaker counts calls as slow past the longest threshold its routes declare
+    slow_calls: dict = {}
+    for route in TOOL_ROUTES.values():
+        if route.slow_call:
+            slow_calls[route.group] = max(slow_calls.get(route.group, 0), route.slow_call)
+    for group, slow_call in slow_calls.items():
+        _circuit_breakers.configure(group, slow_call=slow_call)
+    _tool_list = None
+    _list_tools_result = None
+
+
+def get_tool_list() -> list[Tool]:
+    """Build the Tool objects for the active profile once and reuse them"""
+    global _tool_list
+    
+    if _tool_list is None:
+        _tool_list = [endpoint.to_tool() for endpoint in _tool_endpoints]
+    return _tool_list
 
 
 @app.list_tools()
 async def list_tools() -> list[Tool]:
-    """List available tools - comprehensive API coverage (74 read + 53 write = 127 tools)"""
-    return get_comprehensive_tools() + get_write_tools()
+    """List available tools - the active profile's subset of 74 read + 59 write = 133 tools"""
+    return get_tool_list()
+
+
+# The SDK handler re-validates every tool name and rebuilds the result on each
+# tools/list; run it once (which also primes the SDK's tool cache used for input
+# validation) and answer later requests with the memoized, pre-serialized result.
+_sdk_list_tools_handler = app.request_handlers[ListToolsRequest]
+
+
+async def _handle_list_tools(request: ListToolsRequest) -> ServerResult:
+    global _list_tools_result
+    
+    if _list_tools_result is None:
+        result = await _sdk_list_tools_handler(request)
+        _list_tools_result = SerializedResult(result.root)
+    return _list_tools_result
+
+
+app.request_handlers[ListToolsRequest] = _handle_list_tools
+
+
+def _current_session():
+    """The MCP session of the request being handled, or None outside a request"""
+    try:
+        return app.request_context.session
+    except LookupError:
+        return None
+
+
+async def login_session(session, arguments: dict) -> dict:
+    """Log in as a user and bind that identity to the MCP session for its later tool calls"""
+    if _stateless_sessions:
+        # The binding would be gone by the next call, which would silently run as the admin
+        return {
+            "error": True,
+            "message": "Per-user login needs a stateful session; this server runs stateless HTTP workers (--workers), so tool calls use the admin account"
+        }
+    
+    try:
+        identity = await _identities.login(arguments["username"], arguments["password"])
+    except httpx.HTTPStatusError as e:
+        return {
+            "error": True,
+            "status_code": e.response.status_code,
+            "message": str(e),
+            "detail": e.response.text
+        }
+    
+    if session is not None:
+        _session_identities[session] = identity
+    return {
+        "logged_in": True,
+        "username": identity.username,
+        "expires_at": identity.expires_at
+    }
+
+
+async def logout_session(session, arguments: dict) -> dict:
+    """Log the session's user out and return the session to the admin identity"""
+    identity = _session_identities.pop(session, None) if session is not None else None
+    if identity is None:
+        # Never log out the admin token every other session shares
+        return {
+            "error": True,
+            "message": "No user is logged in on this session"
+        }
+    
+    try:
+        # Straight to the API: a logout must never be answered from the completed-write record
+        return await _send_request("POST", "/auth/logout", identity=identity)
+    finally:
+        identity.forget_token()
+        _identities.discard(identity)
+
+
+# Tools that manage the calling session's identity instead of only proxying the API
+SESSION_TOOLS = {
+    "login": login_session,
+    "logout": logout_session
+}
 
 
 @app.call_tool()
 async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Handle tool calls - 74 read tools + 53 write tools"""
+    """Handle tool calls - 74 read tools + 59 write tools"""
     
     try:
-        # Try comprehensive READ handler first
-        result = await handle_tool_call(name, arguments, make_api_request)
-        
-        # If not found in read tools, try WRITE tools
-        # Check if result is a dict before using .get() method
-        if isinstance(result, dict) and result.get("error") and result.get("message", "").startswith("Unknown tool"):
-            result = await handle_write_tool_call(name, arguments, make_api_request)
+        session = _current_session()
+        if name in SESSION_TOOLS and name in TOOL_ROUTES:
+            result = await SESSION_TOOLS[name](session, arguments)
+        else:
+            # Single registry lookup for both read and write tools, as the session's user if one logged in
+            identity = _session_identities.get(session) if session is not None else None
+            result = await dispatch(TOOL_ROUTES, name, arguments, partial(make_api_request, identity=identity))
         
         return [
             TextContent(
@@ -161,32 +1204,291 @@ async def call_tool(name: str, arguments: Any) -> list[TextContent]:
         ]
 
 
-async def main():
-    """Main entry point for stdio transport"""
+async def serve_daemon(socket_path: str):
+    """Serve MCP sessions from shim.py over a Unix socket, sharing pool, token and caches"""
     import sys
+    import fcntl
+    import anyio
+    from socket_transport import socket_server
     
-    # Log startup to stderr (stdout is reserved for MCP protocol)
-    print(f"🚀 Starting Yunite MCP Server (stdio transport)", file=sys.stderr)
+    # One daemon per socket: a second one started by hand exits here
+    lock_file = open(f"{socket_path}.lock", "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        print(f"   ⚠️  Another daemon is already serving {socket_path}", file=sys.stderr)
+        lock_file.close()
+        return
+    
+    async def serve_connection(stream):
+        try:
+            async with stream, socket_server(stream) as (read_stream, write_stream):
+                await app.run(
+                    read_stream,
+                    write_stream,
+                    app.create_initialization_options()
+                )
+        except Exception as e:
+            # One broken session must not take down the others
+            print(f"   ⚠️  Session ended with an error: {e}", file=sys.stderr)
+    
+    try:
+        listener = await anyio.create_unix_listener(socket_path, mode=0o600)
+        print(f"   ✅ Listening on {socket_path}", file=sys.stderr)
+        await listener.serve(serve_connection)
+    finally:
+        lock_file.close()
+
+
+class _ASGIEndpoint:
+    """Mounts an ASGI callable on an exact route path (Starlette wraps plain functions as request handlers)"""
+    
+    def __init__(self, handler):
+        self.handler = handler
+    
+    async def __call__(self, scope, receive, send):
+        await self.handler(scope, receive, send)
+
+
+class _BearerAuth:
+    """ASGI middleware rejecting HTTP requests that don't carry the bearer token (plain ASGI, so SSE streams pass through)"""
+    
+    def __init__(self, app, token: str):
+        self.app = app
+        self.expected = f"Bearer {token}".encode()
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            authorization = dict(scope["headers"]).get(b"authorization", b"")
+            if not hmac.compare_digest(authorization, self.expected):
+                from starlette.responses import PlainTextResponse
+                
+                response = PlainTextResponse("Unauthorized", status_code=401, headers={"WWW-Authenticate": "Bearer"})
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+def is_loopback_host(host: str) -> bool:
+    """Whether binding host only accepts connections from this machine"""
+    import ipaddress
+    
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def check_http_exposure():
+    """Exit instead of serving the admin account on a reachable address without a token"""
+    import sys
+    
+    if not MCP_HTTP_TOKEN and not is_loopback_host(SERVER_HOST):
+        print(
+            f"❌ Refusing to serve HTTP on {SERVER_HOST} without MCP_HTTP_TOKEN; set a token "
+            "or bind SERVER_HOST to 127.0.0.1",
+            file=sys.stderr
+        )
+        sys.exit(1)
+
+
+def create_http_app(worker: bool = False):
+    """
+    Starlette app serving MCP over streamable HTTP (/mcp) and SSE (/sse), plus /metrics
+    With MCP_HTTP_TOKEN set, every route requires it as a bearer token; without it the
+    server is on loopback and the MCP transports reject non-loopback Host and Origin
+    headers, so a web page can't reach it through DNS rebinding.
+    Worker processes can't share session state, so they serve stateless
+    streamable HTTP only, and own their login and HTTP client
+    """
+    from contextlib import asynccontextmanager
+    from starlette.applications import Starlette
+    from starlette.middleware import Middleware
+    from starlette.responses import PlainTextResponse, Response
+    from starlette.routing import Mount, Route
+    from mcp.server.sse import SseServerTransport
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from mcp.server.transport_security import TransportSecuritySettings
+    
+    global _stateless_sessions
+    
+    security = None
+    if not MCP_HTTP_TOKEN:
+        security = TransportSecuritySettings(
+            enable_dns_rebinding_protection=True,
+            allowed_hosts=["127.0.0.1:*", "localhost:*", "[::1]:*"],
+            allowed_origins=["http://127.0.0.1:*", "http://localhost:*", "http://[::1]:*"]
+        )
+    
+    _stateless_sessions = worker
+    session_manager = StreamableHTTPSessionManager(app, stateless=worker, security_settings=security)
+    sse = SseServerTransport("/messages/", security_settings=security)
+    
+    async def handle_sse(request):
+        async with sse.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                app.create_initialization_options()
+            )
+        return Response()
+    
+    async def handle_metrics(request):
+        return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+    
+    @asynccontextmanager
+    async def lifespan(_):
+        # main() does this for the single-process server
+        if worker:
+            start_token_renewal()
+        try:
+            async with session_manager.run():
+                yield
+        finally:
+            if worker:
+                await stop_token_renewal()
+                await close_http_client()
+    
+    routes = [
+        Route("/mcp", endpoint=_ASGIEndpoint(session_manager.handle_request)),
+        Route("/metrics", endpoint=handle_metrics, methods=["GET"])
+    ]
+    if not worker:
+        # An SSE stream and the POSTs that feed it must reach the same process
+        routes += [
+            Route("/sse", endpoint=handle_sse, methods=["GET"]),
+            Mount("/messages/", app=sse.handle_post_message)
+        ]
+    middleware = [Middleware(_BearerAuth, token=MCP_HTTP_TOKEN)] if MCP_HTTP_TOKEN else []
+    return Starlette(routes=routes, middleware=middleware, lifespan=lifespan)
+
+
+def create_worker_app():
+    """uvicorn factory for --workers: each worker process builds its own app, pool and caches"""
+    load_tool_profile(MCP_TOOL_PROFILE)
+    return create_http_app(worker=True)
+
+
+async def serve_http(host: str, port: int):
+    """Serve MCP over streamable HTTP (/mcp) and SSE (/sse), all clients sharing this process"""
+    import sys
+    import uvicorn
+    
+    print(f"   ✅ Listening on http://{host}:{port}/mcp (streamable HTTP) and /sse", file=sys.stderr)
+    config = uvicorn.Config(create_http_app(), host=host, port=port, log_level="warning")
+    await uvicorn.Server(config).serve()
+
+
+def run_http_workers(profile: str, workers: int):
+    """Serve HTTP from several worker processes sharing one listening socket, cache tier and token"""
+    import sys
+    import uvicorn
+    
+    # Workers re-import this module, so hand them their settings through the environment
+    os.environ["MCP_TOOL_PROFILE"] = profile
+    if CACHE_ENABLED and not CACHE_DISK_PATH:
+        os.environ["CACHE_DISK_PATH"] = "/tmp/yunite-mcp-cache.sqlite3"
+    if not MCP_TOKEN_STORE:
+        os.environ["MCP_TOKEN_STORE"] = "/tmp/yunite-mcp-token.json"
+    
+    print(f"🚀 Starting Yunite MCP Server (stateless HTTP on {SERVER_HOST}:{SERVER_PORT}/mcp, {workers} workers)", file=sys.stderr)
     print(f"   API Base URL: {API_BASE_URL}", file=sys.stderr)
     print(f"   Admin User: {ADMIN_USERNAME}", file=sys.stderr)
+    print(f"   Tool profile: {profile}", file=sys.stderr)
+    print(f"   Shared cache: {os.getenv('CACHE_DISK_PATH') or 'disabled'}, shared token: {os.environ['MCP_TOKEN_STORE']}", file=sys.stderr)
+    
+    uvicorn.run(
+        "server:create_worker_app",
+        factory=True,
+        host=SERVER_HOST,
+        port=SERVER_PORT,
+        workers=workers,
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        log_level="warning"
+    )
+
+
+def parse_args():
+    """Parse the command line"""
+    parser = argparse.ArgumentParser(description="Yunite MCP Server")
+    parser.add_argument("--profile", default=MCP_TOOL_PROFILE, help="Tool profile to expose (see profiles.py)")
+    parser.add_argument("--daemon", action="store_true", help=f"Serve shim.py sessions on MCP_DAEMON_SOCKET ({MCP_DAEMON_SOCKET})")
+    parser.add_argument("--http", action="store_true", help=f"Serve streamable HTTP and SSE on SERVER_HOST:SERVER_PORT ({SERVER_HOST}:{SERVER_PORT})")
+    parser.add_argument("--workers", type=int, default=SERVER_WORKERS, help="Worker processes for --http (SERVER_WORKERS)")
+    return parser.parse_args()
+
+
+def dump_metrics():
+    """Write the current metrics to stderr"""
+    import sys
+    
+    print(f"📊 Metrics\n{metrics.render()}", file=sys.stderr, end="")
+
+
+async def main(args):
+    """Main entry point for stdio transport, or the Unix socket daemon and/or HTTP server"""
+    import sys
     
-    # Test token generation on startup
     try:
-        token = await get_api_token()
-        print(f"   ✅ Token generated successfully", file=sys.stderr)
-    except Exception as e:
-        print(f"   ❌ Failed to generate token: {e}", file=sys.stderr)
-        print(f"   Please check your ADMIN_USERNAME and ADMIN_PASSWORD in .env", file=sys.stderr)
+        load_tool_profile(args.profile)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
         sys.exit(1)
     
-    # Run the server with stdio transport
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
-        )
+    # Log startup to stderr (stdout is reserved for MCP protocol)
+    transports = []
+    if args.daemon:
+        transports.append(f"daemon on {MCP_DAEMON_SOCKET}")
+    if args.http:
+        transports.append(f"HTTP on {SERVER_HOST}:{SERVER_PORT}")
+    print(f"🚀 Starting Yunite MCP Server ({', '.join(transports) or 'stdio transport'})", file=sys.stderr)
+    print(f"   API Base URL: {API_BASE_URL}", file=sys.stderr)
+    print(f"   Admin User: {ADMIN_USERNAME}", file=sys.stderr)
+    print(f"   Tool profile: {_tool_profile} ({len(_tool_endpoints)} tools)", file=sys.stderr)
+    
+    # Log in and keep the token fresh in the background so the MCP handshake
+    # isn't held up by the login round trip; if the login fails, the first
+    # tool call retries it and reports the error
+    start_token_renewal()
+    
+    # kill -USR1 <pid> dumps metrics to stderr; they are dumped at shutdown too
+    asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, dump_metrics)
+    
+    try:
+        if args.daemon or args.http:
+            # Both network transports can run side by side in one process
+            servers = []
+            if args.daemon:
+                servers.append(serve_daemon(MCP_DAEMON_SOCKET))
+            if args.http:
+                servers.append(serve_http(SERVER_HOST, SERVER_PORT))
+            await asyncio.gather(*servers)
+        else:
+            # Run the server with stdio transport
+            async with stdio_server() as (read_stream, write_stream):
+                await app.run(
+                    read_stream,
+                    write_stream,
+                    app.create_initialization_options()
+                )
+    finally:
+        await stop_token_renewal()
+        await close_http_client()
+        dump_metrics()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    import sys
+    
+    args = parse_args()
+    if args.http:
+        check_http_exposure()
+    if args.http and args.workers > 1:
+        if args.daemon:
+            print("❌ --daemon can't be combined with --workers; run the daemon as its own process", file=sys.stderr)
+            sys.exit(1)
+        run_http_workers(args.profile, args.workers)
+    else:
+        asyncio.run(main(args))
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Stdio shim for Yunite MCP Server
+
+Forwards MCP frames between stdin/stdout and the server daemon's Unix socket
+(python3 server.py --daemon), starting the daemon first if it isn't running.
+Only the standard library is imported, so a per-session launch costs an
+interpreter start instead of a full server start, login and cold cache.
+"""
+
+import os
+import sys
+import time
+import fcntl
+import socket
+import subprocess
+import threading
+
+DAEMON_SOCKET = os.getenv("MCP_DAEMON_SOCKET", "/tmp/yunite-mcp.sock")
+DAEMON_START_TIMEOUT = float(os.getenv("MCP_DAEMON_START_TIMEOUT", "30"))
+SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+
+
+def connect():
+    """Connect to the daemon socket, or return None if nothing is listening"""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(DAEMON_SOCKET)
+        return sock
+    except OSError:
+        sock.close()
+        return None
+
+
+def start_daemon():
+    """Spawn the daemon detached from this session, logging next to its socket"""
+    with open(f"{DAEMON_SOCKET}.log", "ab") as log:
+        subprocess.Popen(
+            [sys.executable, SERVER_PATH, "--daemon"],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True
+        )
+
+
+def wait_for_daemon():
+    """Poll the socket until the freshly started daemon accepts connections"""
+    deadline = time.monotonic() + DAEMON_START_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        sock = connect()
+        if sock is not None:
+            return sock
+    
+    print(f"❌ MCP daemon is not listening on {DAEMON_SOCKET}, see {DAEMON_SOCKET}.log", file=sys.stderr)
+    sys.exit(1)
+
+
+def connect_or_start():
+    """Connect to the running daemon, starting one if needed"""
+    sock = connect()
+    if sock is not None:
+        return sock
+    
+    # Serialize cold starts so shims launched together spawn a single daemon
+    with open(f"{DAEMON_SOCKET}.start", "w") as start_lock:
+        fcntl.flock(start_lock, fcntl.LOCK_EX)
+        sock = connect()
+        if sock is None:
+            start_daemon()
+            sock = wait_for_daemon()
+    return sock
+
+
+def forward_stdin(sock: socket.socket):
+    """Copy client frames to the daemon, then half-close so the daemon ends the session"""
+    try:
+        while True:
+            data = os.read(sys.stdin.fileno(), 65536)
+            if not data:
+                break
+            sock.sendall(data)
+    except OSError:
+        pass
+    finally:
+        try:
+            sock.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
+
+
+def main():
+    sock = connect_or_start()
+    threading.Thread(target=forward_stdin, args=(sock,), daemon=True).start()
+    
+    # Copy daemon frames to the client until the daemon closes the session
+    stdout = sys.stdout.buffer
+    try:
+        while True:
+            data = sock.recv(65536)
+            if not data:
+                break
+            stdout.write(data)
+            stdout.flush()
+    except (OSError, BrokenPipeError):
+        pass
+    finally:
+        sock.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Unix domain socket transport for Yunite MCP Server
+Carries newline-delimited JSON-RPC frames, the same framing as stdio, so a
+single daemon process can serve every session that connects through shim.py
+"""
+
+from contextlib import asynccontextmanager
+
+import anyio
+import anyio.lowlevel
+from anyio.abc import ByteStream
+from anyio.streams.buffered import BufferedByteReceiveStream
+import mcp.types as types
+from mcp.shared.message import SessionMessage
+
+# Largest single JSON-RPC frame accepted from a client
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+
+@asynccontextmanager
+async def socket_server(stream: ByteStream):
+    """Server transport over one accepted connection, mirroring mcp.server.stdio.stdio_server"""
+    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+    lines = BufferedByteReceiveStream(stream)
+    
+    async def socket_reader():
+        try:
+            async with read_stream_writer:
+                while True:
+                    try:
+                        line = await lines.receive_until(b"\n", MAX_FRAME_BYTES)
+                    except (anyio.EndOfStream, anyio.IncompleteRead):
+                        # Client disconnected: closing the read stream ends the session
+                        break
+                    if not line.strip():
+                        continue
+                    
+                    try:
+                        message = types.JSONRPCMessage.model_validate_json(line)
+                    except Exception as exc:
+                        await read_stream_writer.send(exc)
+                        continue
+                    
+                    await read_stream_writer.send(SessionMessage(message))
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            await anyio.lowlevel.checkpoint()
+    
+    async def socket_writer():
+        try:
+            async with write_stream_reader:
+                async for session_message in write_stream_reader:
+                    json = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                    await stream.send(json.encode() + b"\n")
+        except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+            await anyio.lowlevel.checkpoint()
+    
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(socket_reader)
+        tg.start_soon(socket_writer)
+        yield read_stream, write_stream
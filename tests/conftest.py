@@ -0,0 +1,54 @@
+"""Shared fixtures; also makes the server's top-level modules importable from the tests"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep server.py off any disk cache or token store configured in .env
+os.environ.update(CACHE_DISK_PATH="", MCP_TOKEN_STORE="")
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """
+    server.py wired to a mock Yunite API, with the admin already logged in
+    api.sent records (method, path, headers) of every request, api.statuses
+    queues statuses (or (status, headers) pairs) for the next requests, and
+    api.delay slows every response by that many seconds
+    """
+    import server
+    from response_cache import ResponseCache
+    from idempotency import CompletedWrites
+    
+    mock = SimpleNamespace(sent=[], statuses=[], delay=0)
+    
+    async def handle(request: httpx.Request) -> httpx.Response:
+        mock.sent.append((request.method, request.url.path, request.headers))
+        if request.url.path == "/auth/login":
+            username = json.loads(request.content)["username"]
+            return httpx.Response(200, json={"access_token": f"token-{username}", "expires_in": 3600})
+        if mock.delay:
+            await asyncio.sleep(mock.delay)
+        status, headers = mock.statuses.pop(0) if mock.statuses else 200, {}
+        if isinstance(status, tuple):
+            status, headers = status
+        return httpx.Response(status, headers=headers, json={"n": len(mock.sent)})
+    
+    server.load_tool_profile("full")
+    monkeypatch.setattr(server, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handle)))
+    monkeypatch.setattr(server, "_response_cache", ResponseCache())
+    monkeypatch.setattr(server, "_completed_writes", CompletedWrites(ttl=60))
+    monkeypatch.setattr(server, "BREAKER_ENABLED", False)
+    monkeypatch.setattr(server, "LIMITER_ENABLED", False)
+    monkeypatch.setattr(server, "HTTP_RETRY_BACKOFF", 0.001)
+    monkeypatch.setitem(server._api_token_cache, "token", "token-admin")
+    monkeypatch.setitem(server._api_token_cache, "expires_at", time.time() + 3600)
+    return mock
@@ -0,0 +1,99 @@
+"""Tests for circuit_breaker.py"""
+
+import time
+import asyncio
+
+from response_cache import ResponseCache
+from circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakers
+
+
+def test_opens_on_error_rate_after_min_calls():
+    breaker = CircuitBreaker(min_calls=4, error_rate=0.5)
+    for _ in range(3):
+        breaker.record(True, 0.1)
+    assert breaker.state == CLOSED
+    
+    breaker.record(False, 0.1)
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.retry_in() > 0
+
+
+def test_opens_on_slow_call_rate():
+    breaker = CircuitBreaker(min_calls=4, slow_call=1, slow_rate=0.75)
+    for latency in (0.1, 2, 2, 2):
+        breaker.record(False, latency)
+    assert breaker.state == OPEN
+
+
+def test_stays_closed_below_thresholds():
+    breaker = CircuitBreaker(min_calls=4, error_rate=0.5)
+    for failed in (True, False, False, False, False):
+        breaker.record(failed, 0.1)
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_half_open_lets_one_probe_through_and_closes_on_success():
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0)
+    breaker.record(True, 0.1)
+    assert breaker.state == OPEN
+    
+    assert breaker.allow()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow()
+    
+    breaker.record(False, 0.1)
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_failed_probe_opens_again():
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0)
+    breaker.record(True, 0.1)
+    assert breaker.allow()
+    
+    breaker.record(True, 0.1)
+    assert breaker.state == OPEN
+
+
+def test_released_probe_frees_the_slot():
+    breaker = CircuitBreaker(min_calls=1, open_seconds=0)
+    breaker.record(True, 0.1)
+    assert breaker.allow()
+    
+    breaker.release()
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+
+
+def test_group_overrides():
+    breakers = CircuitBreakers(slow_call=4, min_calls=10)
+    breakers.configure("analytics", slow_call=20)
+    assert breakers.get("analytics").slow_call == 20
+    assert breakers.get("analytics").min_calls == 10
+    assert breakers.get("posts").slow_call == 4
+    assert breakers.states() == [({"group": "analytics"}, 0), ({"group": "posts"}, 0)]
+
+
+def test_open_breaker_fails_fast_with_the_expired_cached_answer(api, monkeypatch):
+    import server
+    
+    monkeypatch.setattr(server, "BREAKER_ENABLED", True)
+    monkeypatch.setattr(server, "_circuit_breakers", CircuitBreakers(min_calls=2))
+    monkeypatch.setattr(server, "_response_cache", ResponseCache(fallback_ttl=300))
+    
+    async def calls():
+        fetched = await server.make_api_request("GET", "/departments/", cache_ttl=60)
+        for entry in server._response_cache._entries.values():
+            entry.expires_at = entry.stale_until = time.time() - 1
+        api.statuses.extend([500, 500])
+        for _ in range(2):
+            await server.make_api_request("GET", "/departments/1")
+        return fetched, await server.make_api_request("GET", "/departments/", cache_ttl=60)
+    
+    fetched, fallback = asyncio.run(calls())
+    assert fallback["stale"] and fallback["circuit_open"]
+    assert fallback["data"] == fetched
+    # The open breaker answered without another request to its group
+    assert [path for _, path, _ in api.sent].count("/departments/") == 1
@@ -0,0 +1,127 @@
+"""Tests for concurrency.py"""
+
+import asyncio
+
+import pytest
+
+from concurrency import AdaptiveLimiter, ConcurrencyLimits, QueueTimeout
+
+
+def _call(limiter: AdaptiveLimiter, rtt: float = 0.01, overloaded: bool = False, route: str = ""):
+    """One call through a limiter that has a free slot"""
+    asyncio.run(limiter.acquire())
+    limiter.release(rtt, overloaded, route)
+
+
+def test_limit_grows_while_saturated():
+    limiter = AdaptiveLimiter("test", initial_limit=2, max_limit=10)
+    
+    async def rounds():
+        for _ in range(20):
+            await limiter.acquire()
+            await limiter.acquire()
+            limiter.release(0.01)
+            limiter.release(0.01)
+    
+    asyncio.run(rounds())
+    assert limiter.limit > 2
+    assert limiter.in_flight == 0
+
+
+def test_limit_stays_put_when_not_saturated():
+    limiter = AdaptiveLimiter("test", initial_limit=5)
+    for _ in range(20):
+        _call(limiter)
+    assert limiter.limit == 5
+
+
+def test_limit_growth_is_capped():
+    limiter = AdaptiveLimiter("test", initial_limit=1, max_limit=2)
+    for _ in range(50):
+        _call(limiter)
+    assert limiter.limit == 2
+
+
+def test_overload_shrinks_limit_once_per_round_trip():
+    limiter = AdaptiveLimiter("test", initial_limit=10, backoff=0.5)
+    _call(limiter, rtt=60)
+    _call(limiter, rtt=60, overloaded=True)
+    _call(limiter, rtt=60, overloaded=True)
+    assert limiter.limit == 5
+
+
+def test_limit_does_not_shrink_below_min():
+    limiter = AdaptiveLimiter("test", initial_limit=2, min_limit=2, backoff=0.5)
+    _call(limiter, rtt=None, overloaded=True)
+    assert limiter.limit == 2
+
+
+def test_slow_response_counts_as_overload():
+    limiter = AdaptiveLimiter("test", initial_limit=10, backoff=0.5, latency_tolerance=2)
+    _call(limiter, rtt=0.001)
+    _call(limiter, rtt=0.01)
+    assert limiter.limit == 5
+
+
+def test_baselines_are_kept_per_route():
+    limiter = AdaptiveLimiter("test", initial_limit=10, backoff=0.5, latency_tolerance=2)
+    for _ in range(10):
+        _call(limiter, rtt=0.001, route="/cheap")
+        _call(limiter, rtt=0.01, route="/expensive")
+    assert limiter.limit == 10
+
+
+def test_queue_timeout():
+    limiter = AdaptiveLimiter("test", initial_limit=1)
+    
+    async def wait_for_slot():
+        await limiter.acquire()
+        with pytest.raises(QueueTimeout) as raised:
+            await limiter.acquire(timeout=0.01)
+        assert raised.value.scope == "test"
+        assert limiter.queued == 0
+        limiter.release()
+    
+    asyncio.run(wait_for_slot())
+    assert limiter.in_flight == 0
+
+
+def test_concurrency_limits_hold_group_and_global_slots():
+    limits = ConcurrencyLimits({"initial_limit": 10}, {"initial_limit": 1})
+    
+    async def contend():
+        await limits.acquire("posts")
+        assert limits.global_limiter.in_flight == 1
+        with pytest.raises(QueueTimeout):
+            await limits.acquire("posts", timeout=0.01)
+        # Another group isn't held up by the first one's limit
+        await limits.acquire("events")
+        limits.release("posts", 0.01)
+        limits.release("events", 0.01)
+    
+    asyncio.run(contend())
+    assert dict((labels["scope"], value) for labels, value in limits.in_flight()) == {"global": 0, "posts": 0, "events": 0}
+
+
+def test_weighted_fair_queuing_order():
+    limiter = AdaptiveLimiter("test", initial_limit=1, weights={"interactive": 4, "bulk": 1})
+    order = []
+    
+    async def call(priority: str):
+        await limiter.acquire(priority=priority)
+        order.append(priority[0])
+        await asyncio.sleep(0)
+        limiter.release()
+    
+    async def contend():
+        await limiter.acquire()
+        calls = [asyncio.ensure_future(call("bulk")) for _ in range(4)]
+        calls += [asyncio.ensure_future(call("interactive")) for _ in range(8)]
+        await asyncio.sleep(0)
+        assert limiter.queued_by_priority() == {"bulk": 4, "interactive": 8}
+        limiter.release()
+        await asyncio.gather(*calls)
+    
+    asyncio.run(contend())
+    # Four interactive grants for every bulk one while both classes wait
+    assert "".join(order) == "biiiibiiiibb"
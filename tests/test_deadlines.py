@@ -0,0 +1,45 @@
+"""Tests for request deadlines and cancellation in server.py"""
+
+import time
+import asyncio
+
+import server
+
+
+def test_slow_request_times_out_within_its_deadline(api):
+    api.delay = 5
+    started = time.monotonic()
+    result = asyncio.run(server.make_api_request("GET", "/users/me", timeout=0.2))
+    assert result["error"] and result["timeout"]
+    assert time.monotonic() - started < 1
+
+
+def test_cancelled_caller_cancels_its_request(api):
+    api.delay = 5
+    
+    async def cancel_caller():
+        caller = asyncio.ensure_future(server.make_api_request("GET", "/users/me"))
+        await asyncio.sleep(0.05)
+        [request] = server._inflight_gets.values()
+        caller.cancel()
+        await asyncio.sleep(0)
+        return request
+    
+    request = asyncio.run(cancel_caller())
+    assert request.cancelled()
+    assert server._inflight_gets == {}
+    assert server._shared_waiters == {}
+
+
+def test_shared_request_survives_one_cancelled_caller(api):
+    api.delay = 0.1
+    
+    async def callers():
+        first = asyncio.ensure_future(server.make_api_request("GET", "/users/me"))
+        second = asyncio.ensure_future(server.make_api_request("GET", "/users/me"))
+        await asyncio.sleep(0.02)
+        first.cancel()
+        return await second
+    
+    assert asyncio.run(callers()) == {"n": 1}
+    assert len(api.sent) == 1
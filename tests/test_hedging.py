@@ -0,0 +1,51 @@
+"""Tests for hedging.py"""
+
+from hedging import HedgeBudget, Hedging
+
+
+def test_budget_caps_hedges_at_ratio():
+    budget = HedgeBudget(ratio=0.05)
+    hedges = 0
+    for _ in range(200):
+        budget.earn()
+        if budget.spend():
+            hedges += 1
+    assert hedges == 10
+
+
+def test_budget_banks_at_most_burst():
+    budget = HedgeBudget(ratio=0.5, burst=2)
+    for _ in range(100):
+        budget.earn()
+    assert budget.spend()
+    assert budget.spend()
+    assert not budget.spend()
+
+
+def test_no_delay_until_enough_samples():
+    hedging = Hedging(min_samples=5)
+    for _ in range(4):
+        hedging.record("/posts/{post_id}", 0.1)
+    assert hedging.delay("/posts/{post_id}") is None
+    assert hedging.delay("/events/{event_id}") is None
+    
+    hedging.record("/posts/{post_id}", 0.1)
+    assert hedging.delay("/posts/{post_id}") == 0.1
+
+
+def test_delay_is_the_routes_percentile():
+    hedging = Hedging(percentile=95, min_samples=1)
+    for ms in range(1, 101):
+        hedging.record("/users/me", ms / 1000)
+    hedging.record("/events/{event_id}", 2)
+    assert hedging.delay("/users/me") == 0.096
+    assert hedging.delay("/events/{event_id}") == 2
+
+
+def test_latency_window_forgets_old_samples():
+    hedging = Hedging(percentile=50, min_samples=1, window=10)
+    for _ in range(10):
+        hedging.record("/users/me", 5)
+    for _ in range(10):
+        hedging.record("/users/me", 0.1)
+    assert hedging.delay("/users/me") == 0.1
@@ -0,0 +1,40 @@
+"""Tests for the HTTP transports' bearer token and DNS rebinding protection in server.py"""
+
+import pytest
+from starlette.testclient import TestClient
+
+import server
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {"protocolVersion": "2025-03-26", "capabilities": {}, "clientInfo": {"name": "test", "version": "1"}}
+}
+HEADERS = {"Accept": "application/json, text/event-stream"}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    def connect(token: str = "") -> TestClient:
+        monkeypatch.setattr(server, "MCP_HTTP_TOKEN", token)
+        # The SSE transport raises after sending its rejection, as under uvicorn
+        return TestClient(server.create_http_app(), base_url="http://127.0.0.1:8000", raise_server_exceptions=False)
+    return connect
+
+
+def test_without_a_token_only_loopback_hosts_and_origins_are_served(client):
+    with client() as http:
+        assert http.post("/mcp", json=INITIALIZE, headers=HEADERS).status_code == 200
+        assert http.post("/mcp", json=INITIALIZE, headers={**HEADERS, "Host": "rebound.example:8000"}).status_code == 421
+        assert http.post("/mcp", json=INITIALIZE, headers={**HEADERS, "Origin": "http://rebound.example"}).status_code == 403
+        assert http.get("/sse", headers={"Host": "rebound.example:8000"}).status_code == 421
+
+
+def test_with_a_token_every_route_requires_it(client):
+    with client("secret") as http:
+        assert http.post("/mcp", json=INITIALIZE, headers=HEADERS).status_code == 401
+        assert http.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+        assert http.get("/metrics", headers={"Authorization": "Bearer secret"}).status_code == 200
+        authorized = {**HEADERS, "Authorization": "Bearer secret", "Host": "mcp.example:8000"}
+        assert http.post("/mcp", json=INITIALIZE, headers=authorized).status_code == 200
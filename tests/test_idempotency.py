@@ -0,0 +1,147 @@
+"""Tests for idempotency.py and the write replay rules in server.py"""
+
+import asyncio
+
+import server
+from idempotency import CompletedWrites, make_write_fingerprint
+from routing import dispatch
+
+
+def test_fingerprint_covers_payload_and_identity():
+    fingerprint = make_write_fingerprint("post", "/posts/", {"content": "x", "title": None})
+    assert fingerprint == make_write_fingerprint("POST", "/posts/", {"title": None, "content": "x"})
+    assert fingerprint != make_write_fingerprint("POST", "/posts/", {"content": "y", "title": None})
+    assert fingerprint != make_write_fingerprint("POST", "/posts/", {"content": "x", "title": None}, namespace="alice")
+
+
+def test_completed_writes_expire_and_stay_bounded():
+    writes = CompletedWrites(ttl=60, max_entries=2)
+    writes.record("a", {"id": 1}, "/posts/")
+    writes.record("b", {"id": 2}, "/posts/")
+    writes.record("c", {"id": 3}, "/posts/")
+    assert writes.get("a") is None
+    assert writes.get("c") == {"id": 3}
+    
+    expired = CompletedWrites(ttl=-1)
+    expired.record("a", {"id": 1}, "/posts/")
+    assert expired.get("a") is None
+    assert len(expired) == 0
+
+
+def test_completed_writes_invalidate_matching_endpoints_except_keep():
+    writes = CompletedWrites()
+    writes.record("add", {}, "/groups/3/members")
+    writes.record("post", {}, "/posts/")
+    writes.record("comment", {}, "/posts/1/comments")
+    writes.invalidate(["/groups/3/members", "/posts/1/comments"], keep="comment")
+    assert writes.get("add") is None
+    assert writes.get("post") == {}
+    assert writes.get("comment") == {}
+
+
+def test_write_keys_are_kept_until_settled_or_expired():
+    writes = CompletedWrites(ttl=60)
+    first = writes.key("a", "/posts/")
+    assert writes.key("a", "/posts/") == first
+    assert writes.key("b", "/posts/") != first
+    writes.settle("a")
+    assert writes.key("a", "/posts/") != first
+    writes.invalidate(["/posts/*"])
+    assert writes._keys == {}
+    
+    expired = CompletedWrites(ttl=-1)
+    assert expired.key("a") != expired.key("a")
+
+
+def key(sent: tuple) -> str:
+    return sent[2].get("Idempotency-Key")
+
+
+def call(name: str, arguments: dict) -> dict:
+    return asyncio.run(dispatch(server.TOOL_ROUTES, name, arguments, server.make_api_request))
+
+
+def test_identical_write_is_replayed_and_flagged(api):
+    first = call("create_post", {"content": "hello"})
+    second = call("create_post", {"content": "hello"})
+    assert first == {"n": 1}
+    assert second == {"replayed": True, "data": {"n": 1}}
+    assert len(api.sent) == 1
+    assert key(api.sent[0]) is not None
+
+
+def test_concurrent_identical_writes_are_joined(api):
+    async def both():
+        return await asyncio.gather(
+            dispatch(server.TOOL_ROUTES, "create_post", {"content": "hi"}, server.make_api_request),
+            dispatch(server.TOOL_ROUTES, "create_post", {"content": "hi"}, server.make_api_request)
+        )
+    
+    results = asyncio.run(both())
+    assert len(api.sent) == 1
+    assert {"replayed": True, "data": {"n": 1}} in results
+    assert {"n": 1} in results
+
+
+def test_toggles_and_joins_are_always_sent(api):
+    assert call("toggle_like", {"post_id": 1}) == {"n": 1}
+    assert call("toggle_like", {"post_id": 1}) == {"n": 2}
+    call("join_group", {"group_id": 3})
+    call("join_group", {"group_id": 3})
+    assert [method for method, _, _ in api.sent] == ["POST"] * 4
+    # Each repeat is a new write to the API, under a new key
+    assert len({key(sent) for sent in api.sent}) == 4
+
+
+def test_write_undone_by_a_later_write_is_sent_again(api):
+    call("create_post", {"content": "hello"})
+    call("delete_comment", {"post_id": 1, "comment_id": 2})
+    again = call("create_post", {"content": "hello"})
+    assert again == {"n": 3}
+    assert call("create_post", {"content": "hello"}) == {"replayed": True, "data": {"n": 3}}
+
+
+def test_failed_write_is_not_replayed(api):
+    api.statuses.append(400)
+    assert call("create_post", {"content": "hello"})["error"]
+    assert call("create_post", {"content": "hello"}) == {"n": 2}
+
+
+def test_keyed_writes_are_retried_only_when_enabled(api, monkeypatch):
+    api.statuses.append(502)
+    assert call("create_post", {"content": "one"})["status_code"] == 502
+    assert len(api.sent) == 1
+    
+    monkeypatch.setattr(server, "HTTP_RETRY_KEYED_WRITES", True)
+    api.statuses.append(502)
+    assert call("create_post", {"content": "two"}) == {"n": 3}
+    # The retry reuses the first attempt's key
+    assert key(api.sent[1]) == key(api.sent[2])
+
+
+def test_write_repeated_after_a_timeout_reuses_its_key(api):
+    api.delay = 5
+    timed_out = asyncio.run(server.make_api_request("POST", "/posts/", data={"content": "hi"}, timeout=0.2))
+    assert timed_out["timeout"]
+    api.delay = 0
+    api.statuses.append(503)
+    assert asyncio.run(server.make_api_request("POST", "/posts/", data={"content": "hi"}))["status_code"] == 503
+    assert asyncio.run(server.make_api_request("POST", "/posts/", data={"content": "hi"})) == {"n": 3}
+    # The backend may have applied any of the failed attempts, so all of them share one key
+    assert key(api.sent[0]) == key(api.sent[1]) == key(api.sent[2])
+
+
+def test_toggle_repeated_after_a_timeout_reuses_its_key_until_it_succeeds(api):
+    api.delay = 5
+    assert asyncio.run(server.make_api_request("POST", "/posts/1/like", timeout=0.2, replayable=False))["timeout"]
+    api.delay = 0
+    assert call("toggle_like", {"post_id": 1}) == {"n": 2}
+    assert call("toggle_like", {"post_id": 1}) == {"n": 3}
+    assert key(api.sent[0]) == key(api.sent[1]) != key(api.sent[2])
+
+
+def test_refused_write_gets_a_new_key(api):
+    api.statuses.append(422)
+    assert call("create_post", {"content": "hello"})["status_code"] == 422
+    call("create_post", {"content": "hello"})
+    assert key(api.sent[0]) != key(api.sent[1])
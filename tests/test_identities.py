@@ -0,0 +1,104 @@
+"""Tests for identities.py and per-session login in server.py"""
+
+import asyncio
+
+import pytest
+
+from identities import IdentityPool
+
+
+class FakeLogin:
+    """Stands in for the API's login, counting calls and rejecting wrong passwords"""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    async def __call__(self, username: str, password: str) -> tuple:
+        self.calls += 1
+        await asyncio.sleep(0)
+        if password != "secret":
+            raise PermissionError(username)
+        return f"token-{username}-{self.calls}", 2 ** 40
+
+
+def test_login_reuses_a_known_users_token():
+    login = FakeLogin()
+    pool = IdentityPool(login)
+    
+    async def twice():
+        first = await pool.login("alice", "secret")
+        second = await pool.login("alice", "secret")
+        return first, second
+    
+    first, second = asyncio.run(twice())
+    assert first is second
+    assert first.token == "token-alice-1"
+    assert first.cache_namespace == "user:alice"
+    assert login.calls == 1
+
+
+def test_wrong_password_is_not_kept():
+    pool = IdentityPool(FakeLogin())
+    
+    async def attempts():
+        alice = await pool.login("alice", "secret")
+        with pytest.raises(PermissionError):
+            await pool.login("alice", "guess")
+        return alice
+    
+    alice = asyncio.run(attempts())
+    assert len(pool) == 1
+    assert asyncio.run(pool.login("alice", "secret")) is alice
+
+
+def test_least_recently_used_identity_is_dropped():
+    pool = IdentityPool(FakeLogin(), max_identities=2)
+    
+    async def logins():
+        for username in ("alice", "bob", "alice", "carol"):
+            await pool.login(username, "secret")
+    
+    asyncio.run(logins())
+    assert list(pool._identities) == ["alice", "carol"]
+
+
+def test_concurrent_refreshes_share_one_login():
+    login = FakeLogin()
+    pool = IdentityPool(login)
+    
+    async def refreshes():
+        alice = await pool.login("alice", "secret")
+        return await asyncio.gather(*[alice.refresh() for _ in range(5)])
+    
+    assert set(asyncio.run(refreshes())) == {"token-alice-2"}
+    assert login.calls == 2
+
+
+def test_logged_in_session_calls_as_its_user(api):
+    import server
+    
+    class Session:
+        pass
+    
+    session = Session()
+    
+    async def calls():
+        logged_in = await server.login_session(session, {"username": "alice", "password": "pw"})
+        identity = server._session_identities.get(session)
+        await server.make_api_request("GET", "/users/me", identity=identity)
+        await server.make_api_request("GET", "/users/me")
+        return logged_in
+    
+    logged_in = asyncio.run(calls())
+    assert logged_in["logged_in"] and logged_in["username"] == "alice"
+    authorizations = [headers["authorization"] for method, path, headers in api.sent if path == "/users/me"]
+    assert authorizations == ["Bearer token-alice", "Bearer token-admin"]
+
+
+def test_login_is_refused_without_stateful_sessions(api, monkeypatch):
+    import server
+    
+    monkeypatch.setattr(server, "_stateless_sessions", True)
+    result = asyncio.run(server.login_session(object(), {"username": "alice", "password": "pw"}))
+    assert result["error"]
+    assert not [path for _, path, _ in api.sent if path == "/auth/login"]
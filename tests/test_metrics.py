@@ -0,0 +1,25 @@
+"""Tests for metrics.py"""
+
+import metrics
+from metrics import Counter, Gauge
+
+
+def test_values_render_exactly(monkeypatch):
+    monkeypatch.setattr(metrics, "REGISTRY", [])
+    requests = Counter("requests_total", "Requests")
+    requests.inc(1234567)
+    seconds = Counter("seconds_total", "Seconds")
+    seconds.inc(1234567.125)
+    Gauge("ready", "Ready", read=lambda: [({}, True), ({"scope": "x"}, float("inf"))])
+    lines = metrics.render().splitlines()
+    assert "requests_total 1234567" in lines
+    assert "seconds_total 1234567.125" in lines
+    assert "ready 1" in lines
+    assert 'ready{scope="x"} +Inf' in lines
+
+
+def test_label_values_are_escaped(monkeypatch):
+    monkeypatch.setattr(metrics, "REGISTRY", [])
+    errors = Counter("errors_total", "Errors")
+    errors.inc(reason='say "hi"\\n\nnext')
+    assert 'errors_total{reason="say \\"hi\\"\\\\n\\nnext"} 1' in metrics.render().splitlines()
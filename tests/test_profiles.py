@@ -0,0 +1,38 @@
+"""Tests for profiles.py"""
+
+import pytest
+
+from profiles import DEFAULT_PROFILE, TOOL_PROFILES, get_profile_endpoints
+
+
+def names(endpoints) -> set:
+    return {endpoint.name for endpoint in endpoints}
+
+
+def test_full_profile_exposes_every_tool():
+    read, write = get_profile_endpoints(DEFAULT_PROFILE)
+    assert len(read) + len(write) == 133
+
+
+def test_readonly_profile_has_no_writes():
+    read, write = get_profile_endpoints("readonly")
+    assert write == []
+    assert names(read) == names(get_profile_endpoints("full")[0])
+
+
+def test_narrow_profiles_only_expose_their_area():
+    read, write = get_profile_endpoints("store")
+    assert {"get_my_profile", "list_rewards", "give_reward"} <= names(read) | names(write)
+    assert all(e.route.path.startswith(("/users/me", "/rewards/", "/pool/")) for e in read + write)
+    assert "create_post" not in names(write)
+
+
+@pytest.mark.parametrize("profile", sorted(TOOL_PROFILES))
+def test_every_profile_exposes_some_tools(profile):
+    read, write = get_profile_endpoints(profile)
+    assert read
+
+
+def test_unknown_profile():
+    with pytest.raises(ValueError, match="Unknown tool profile 'nope'"):
+        get_profile_endpoints("nope")
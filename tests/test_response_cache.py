@@ -0,0 +1,146 @@
+"""Tests for response_cache.py"""
+
+import time
+
+from response_cache import CacheEntry, DiskCache, ResponseCache, make_cache_key
+
+
+def test_cache_key_ignores_param_order_and_separates_identities():
+    assert make_cache_key("/posts/", {"a": 1, "b": 2}) == make_cache_key("/posts/", {"b": 2, "a": 1})
+    assert make_cache_key("/users/me", namespace="alice") != make_cache_key("/users/me", namespace="bob")
+
+
+def test_evicts_least_recently_used_beyond_max_entries():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", "/a", 1, 10, ttl=60)
+    cache.set("b", "/b", 2, 10, ttl=60)
+    cache.get("a")
+    cache.set("c", "/c", 3, 10, ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a").value == 1
+    assert cache.get("c").value == 3
+
+
+def test_evicts_beyond_max_bytes():
+    cache = ResponseCache(max_bytes=100)
+    cache.set("a", "/a", 1, 60, ttl=60)
+    cache.set("b", "/b", 2, 60, ttl=60)
+    assert cache.get("a") is None
+    assert cache.total_bytes == 60
+    
+    # Larger than the whole cache: not stored at all
+    cache.set("c", "/c", 3, 200, ttl=60)
+    assert cache.get("c") is None
+    assert cache.get("b").value == 2
+
+
+def test_invalidate_removes_matching_endpoints():
+    cache = ResponseCache()
+    cache.set("p1", "/posts/1", 1, 10, ttl=60)
+    cache.set("p1c", "/posts/1/comments", 2, 10, ttl=60)
+    cache.set("e1", "/events/1", 3, 10, ttl=60)
+    generation = cache.generation
+    
+    assert cache.invalidate(["/posts/1", "/posts/*/likes"]) == 1
+    assert cache.get("p1") is None
+    assert cache.get("p1c").value == 2
+    assert cache.invalidate(["/posts/*"]) == 1
+    assert cache.get("e1").value == 3
+    assert cache.generation == generation + 2
+
+
+def test_expired_entries_are_kept_while_usable():
+    cache = ResponseCache()
+    cache.set("stale", "/a", 1, 10, ttl=-1, stale_ttl=60)
+    cache.set("etag", "/b", 2, 10, ttl=-1, etag='"v1"')
+    cache.set("dead", "/c", 3, 10, ttl=-1)
+    assert cache.get("stale").is_servable_stale
+    assert cache.get("etag").can_revalidate
+    assert cache.get("dead") is None
+
+
+def test_expired_entries_are_kept_for_the_fallback_window():
+    cache = ResponseCache(fallback_ttl=60)
+    cache.set("recent", "/a", 1, 10, ttl=-1)
+    cache.set("old", "/b", 2, 10, ttl=-120)
+    entry = cache.get("recent")
+    assert entry.value == 1
+    assert not entry.is_usable
+    assert cache.get("old") is None
+
+
+def test_disk_tier_serves_other_caches_and_shares_invalidations(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = ResponseCache(disk=DiskCache(path))
+    second = ResponseCache(disk=DiskCache(path), sync_interval=0)
+    first.set("p1", "/posts/1", {"id": 1}, 10, ttl=60)
+    assert second.get("p1").value == {"id": 1}
+    
+    first.invalidate(["/posts/*"])
+    assert second.get("p1") is None
+    assert second._entries == {}
+
+
+def test_disk_invalidation_log_is_polled_at_most_every_sync_interval(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    first = ResponseCache(disk=DiskCache(path))
+    second = ResponseCache(disk=DiskCache(path), sync_interval=0.1)
+    first.set("p1", "/posts/1", {"id": 1}, 10, ttl=60)
+    assert second.get("p1").value == {"id": 1}
+    
+    first.invalidate(["/posts/*"])
+    assert second.get("p1").value == {"id": 1}
+    time.sleep(0.1)
+    assert second.get("p1") is None
+
+
+def test_disk_tier_batches_recency_updates_into_the_sweep(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=100, evict_interval=60)
+    for i in range(3):
+        disk.set(f"k{i}", CacheEntry("/e", i, 30, time.time() + 60))
+    accessed_at = disk._db.execute("SELECT accessed_at FROM responses WHERE key = 'k0'").fetchone()[0]
+    assert disk.get("k0").value == 0
+    assert disk._db.execute("SELECT accessed_at FROM responses WHERE key = 'k0'").fetchone()[0] == accessed_at
+    
+    # Going over an eighth of the cap forces a sweep, which flushes the read of k0 first
+    disk.set("k3", CacheEntry("/e", 3, 30, time.time() + 60))
+    keys = [key for key, in disk._db.execute("SELECT key FROM responses ORDER BY key")]
+    assert keys == ["k0", "k2", "k3"]
+
+
+def test_locked_disk_tier_fails_fast_to_memory(tmp_path, capsys):
+    import sqlite3
+    
+    path = str(tmp_path / "cache.sqlite3")
+    cache = ResponseCache(disk=DiskCache(path))
+    cache.set("a", "/a", 1, 10, ttl=60)
+    locker = sqlite3.connect(path, isolation_level=None)
+    locker.execute("BEGIN EXCLUSIVE")
+    
+    started = time.monotonic()
+    cache.set("b", "/b", 2, 10, ttl=60)
+    assert cache.get("b").value == 2
+    assert cache.get("missing") is None
+    assert time.monotonic() - started < 1
+    assert "Disk cache" in capsys.readouterr().err
+    locker.rollback()
+
+
+def test_disk_tier_sweeps_beyond_its_size_cap(tmp_path):
+    disk = DiskCache(str(tmp_path / "cache.sqlite3"), max_bytes=100)
+    for i in range(5):
+        disk.set(f"k{i}", CacheEntry("/e", i, 30, time.time() + 60))
+    keys = [key for key, in disk._db.execute("SELECT key FROM responses ORDER BY key")]
+    assert keys == ["k2", "k3", "k4"]
+
+
+def test_disk_tier_failure_falls_back_to_memory(tmp_path, capsys):
+    disk = DiskCache(str(tmp_path / "cache.sqlite3"))
+    cache = ResponseCache(disk=disk)
+    disk.close()
+    
+    cache.set("a", "/a", 1, 10, ttl=60)
+    assert cache.get("a").value == 1
+    assert cache.get("missing") is None
+    cache.invalidate(["/a"])
+    assert "Disk cache" in capsys.readouterr().err
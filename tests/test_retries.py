@@ -0,0 +1,69 @@
+"""Tests for request retries with backoff and Retry-After in server.py"""
+
+import time
+import asyncio
+
+import httpx
+
+import server
+
+
+def request(method: str, endpoint: str = "/users/me") -> dict:
+    return asyncio.run(server.make_api_request(method, endpoint))
+
+
+def test_transient_statuses_are_retried_until_success(api):
+    retried = server.API_RETRIES.value(method="GET", reason="502"), server.API_RETRIES.value(method="GET", reason="503")
+    api.statuses.extend([502, 503])
+    assert request("GET") == {"n": 3}
+    assert len(api.sent) == 3
+    assert server.API_RETRIES.value(method="GET", reason="502") == retried[0] + 1
+    assert server.API_RETRIES.value(method="GET", reason="503") == retried[1] + 1
+
+
+def test_retries_give_up_after_the_last_attempt(api, monkeypatch):
+    monkeypatch.setattr(server, "HTTP_RETRY_ATTEMPTS", 2)
+    exhausted = server.API_RETRIES_EXHAUSTED.value(method="DELETE")
+    api.statuses.extend([502, 502, 502, 502])
+    assert request("DELETE", "/posts/1")["status_code"] == 502
+    assert len(api.sent) == 3
+    assert server.API_RETRIES_EXHAUSTED.value(method="DELETE") == exhausted + 1
+
+
+def test_client_errors_and_plain_posts_are_not_retried(api):
+    api.statuses.extend([404, 502])
+    assert request("GET")["status_code"] == 404
+    assert request("POST", "/posts/")["status_code"] == 502
+    assert len(api.sent) == 2
+
+
+def test_retry_after_is_honoured(api):
+    api.statuses.append((503, {"Retry-After": "0.2"}))
+    started = time.monotonic()
+    assert request("GET") == {"n": 2}
+    assert time.monotonic() - started >= 0.2
+
+
+def test_retry_after_beyond_the_cap_is_not_waited_for(api, monkeypatch):
+    monkeypatch.setattr(server, "HTTP_RETRY_AFTER_MAX", 1)
+    api.statuses.append((429, {"Retry-After": "120"}))
+    assert request("GET")["status_code"] == 429
+    assert len(api.sent) == 1
+
+
+def test_backoff_is_capped_full_jitter(monkeypatch):
+    delays = []
+    monkeypatch.setattr(server.random, "uniform", lambda low, high: delays.append((low, high)) or 0)
+    monkeypatch.setattr(server, "HTTP_RETRY_BACKOFF", 0.2)
+    monkeypatch.setattr(server, "HTTP_RETRY_BACKOFF_MAX", 0.5)
+    monkeypatch.setattr(server, "HTTP_RETRY_ATTEMPTS", 3)
+    monkeypatch.setattr(server, "LIMITER_ENABLED", False)
+    monkeypatch.setattr(server, "BREAKER_ENABLED", False)
+    
+    class Flaky:
+        async def request(self, *args, **kwargs):
+            return httpx.Response(502)
+    
+    response = asyncio.run(server._request_with_retries(Flaky(), "GET", "/x", "x", "interactive", time.monotonic() + 10, "/x"))
+    assert response.status_code == 502
+    assert delays == [(0, 0.2), (0, 0.4), (0, 0.5)]
@@ -0,0 +1,92 @@
+"""Tests for routing.py and the endpoint tables"""
+
+import asyncio
+
+import pytest
+
+from routing import REST, Arg, Endpoint, Route, build_registry, build_routes, dispatch
+from tools_comprehensive import READ_ENDPOINTS
+from tools_write import WRITE_ENDPOINTS
+
+REGISTRY = build_registry(build_routes(READ_ENDPOINTS), build_routes(WRITE_ENDPOINTS))
+
+
+def dispatched(name: str, arguments: dict) -> dict:
+    """The make_api_request call a tool call turns into"""
+    calls = []
+    
+    async def make_api_request(method, endpoint, **kwargs):
+        calls.append({"method": method, "endpoint": endpoint, **kwargs})
+        return {"ok": True}
+    
+    assert asyncio.run(dispatch(REGISTRY, name, arguments, make_api_request)) == {"ok": True}
+    return calls[0]
+
+
+@pytest.mark.parametrize("name, arguments, method, endpoint, params, data", [
+    ("get_my_profile", {}, "GET", "/users/me", None, None),
+    ("list_posts", {"limit": 5, "post_type": None}, "GET", "/posts/", {"limit": 5}, None),
+    ("get_post_by_id", {"post_id": 7}, "GET", "/posts/7", None, None),
+    ("get_posts_by_type", {"post_type": "INFO"}, "GET", "/posts/type/INFO", {"limit": 20, "offset": 0}, None),
+    ("list_departments", {}, "GET", "/departments/", {}, None),
+    ("list_departments", {"include_stats": True}, "GET", "/departments/", {"include_stats": True}, None),
+    ("add_comment", {"post_id": 3, "content": "hi"}, "POST", "/posts/3/comments", None, {"content": "hi"}),
+    ("update_user_profile", {"user_id": 4, "email": "a@b.c"}, "PUT", "/users/4", None, {"email": "a@b.c"}),
+    ("delete_comment", {"post_id": 3, "comment_id": 9}, "DELETE", "/posts/3/comments/9", None, None),
+    (
+        "give_reward", {"user_id": 5, "points": 10},
+        "POST", "/rewards/", None, {"user_id": 5, "points": 10, "reason": None}
+    ),
+])
+def test_tool_calls_map_to_api_requests(name, arguments, method, endpoint, params, data):
+    call = dispatched(name, arguments)
+    assert (call["method"], call["endpoint"], call["params"], call["data"]) == (method, endpoint, params, data)
+
+
+def test_request_options_carry_caching_and_invalidation():
+    read = dispatched("get_post_by_id", {"post_id": 7})
+    assert read["cache_ttl"] > 0
+    assert "invalidates" not in read
+    
+    write = dispatched("delete_comment", {"post_id": 3, "comment_id": 9})
+    assert "cache_ttl" not in write
+    assert write["invalidates"] == ["/posts/3/comments", "/posts/3", "/posts/", "/posts/type/*"]
+
+
+def test_invalidation_patterns_widen_missing_arguments():
+    route = Route("POST", "/things", data=REST, invalidates=("/things/{thing_id}",))
+    assert route.request_options({})["invalidates"] == ["/things/*"]
+
+
+def test_unknown_tool():
+    result = asyncio.run(dispatch(REGISTRY, "no_such_tool", {}, None))
+    assert result == {"error": True, "message": "Unknown tool: no_such_tool"}
+
+
+def test_missing_required_argument_raises():
+    with pytest.raises(KeyError):
+        Route("GET", "/posts/{post_id}", params={"q": Arg("q")}).build_request({"post_id": 1})
+
+
+def test_registry_rejects_duplicate_tools():
+    routes = build_routes(READ_ENDPOINTS[:1])
+    with pytest.raises(ValueError):
+        build_registry(routes, routes)
+
+
+def test_every_tool_is_declared_once_with_its_schema():
+    endpoints = READ_ENDPOINTS + WRITE_ENDPOINTS
+    assert len(endpoints) == len(REGISTRY) == 133
+    tool = next(endpoint for endpoint in endpoints if endpoint.name == "get_post_by_id").to_tool()
+    assert tool.name == "get_post_by_id"
+    assert tool.inputSchema["required"] == ["post_id"]
+
+
+@pytest.mark.parametrize("route, schema, message", [
+    (Route("HEAD", "/users/me"), {}, "unsupported HTTP method"),
+    (Route("GET", "/posts/{post_id}"), {}, "are not required arguments"),
+    (Route("POST", "/posts/", hedge=True), {}, "only GETs can be hedged"),
+])
+def test_endpoint_declarations_are_validated(route, schema, message):
+    with pytest.raises(ValueError, match=message):
+        Endpoint(name="bad", description="", inputSchema=schema, route=route)
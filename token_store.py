@@ -0,0 +1,65 @@
+"""
+Shared API token store for Yunite MCP Server
+Lets several server processes (HTTP workers, the daemon) share one admin
+token: logins are serialized with a file lock, and one process at a time
+owns proactive renewal.
+"""
+
+import os
+import json
+import fcntl
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Optional
+
+
+class TokenStore:
+    """API token kept in a JSON file, guarded by flock-based locks next to it"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._owner_lock = None
+    
+    def load(self) -> Optional[dict]:
+        """Return the stored {"token", "expires_at"}, or None if there is none"""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not data.get("token"):
+            return None
+        return data
+    
+    def save(self, token: str, expires_at: float):
+        """Replace the stored token atomically, readable by this user only"""
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump({"token": token, "expires_at": expires_at}, f)
+        os.replace(tmp_path, self.path)
+    
+    def is_owner(self) -> bool:
+        """Whether this process owns token renewal, taking ownership if nobody holds it"""
+        if self._owner_lock is not None:
+            return True
+        
+        lock = open(f"{self.path}.owner", "w")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock.close()
+            return False
+        # Held until the process exits, so ownership passes on when the owner dies
+        self._owner_lock = lock
+        return True
+    
+    @asynccontextmanager
+    async def login_lock(self):
+        """Hold the cross-process login lock, so only one process logs in at a time"""
+        with open(f"{self.path}.lock", "w") as lock:
+            await asyncio.to_thread(fcntl.flock, lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
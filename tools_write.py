@@ -1,812 +1,1177 @@
 """
 Comprehensive Write Tools for Yunite MCP Server
 Generated from OpenAPI schema - 92 write operations
+
+Each write tool is declared once as an Endpoint: its MCP schema together with
+the API route and the cached reads it invalidates.
 """
 
-from mcp.types import Tool
+from routing import INTERACTIVE, REST, Arg, Endpoint, Route
+from tools_comprehensive import AI_SLOW_CALL, AI_TIMEOUT
 
-def get_write_tools():
-    """Returns list of all write operation tools (POST, PUT, PATCH, DELETE)"""
+# Cached read endpoints listing posts
+POST_LISTS = ("/posts/", "/posts/type/*")
+
+# Time budget (seconds) for uploads, which send the whole file in one request, and the
+# response time past which they count as slow for the files group's circuit breaker
+UPLOAD_TIMEOUT = 60
+UPLOAD_SLOW_CALL = 30
+
+
+def _folder_delete_params(arguments: dict) -> dict:
+    """Accept folder_id as an alias for folder_path"""
+    return {
+        "folder_path": arguments.get("folder_path", arguments.get("folder_id")),
+        "recursive": arguments.get("recursive", False)
+    }
+
+
+def _folder_move_params(arguments: dict) -> dict:
+    """Accept folder_id/new_parent_id as aliases for source/destination paths"""
+    return {
+        "source_path": arguments.get("source_path", arguments.get("folder_id")),
+        "destination_path": arguments.get("destination_path", arguments.get("new_parent_id"))
+    }
+
+
+# Write endpoint table. invalidates lists the cached read endpoints (glob patterns,
+# formatted with the tool arguments) that the write makes stale; missing arguments
+# match anything. search_knowledge is a read tool, see tools_comprehensive.
+WRITE_ENDPOINTS = (
+    # ==================== POSTS ====================
+    Endpoint(
+        name="create_post",
+        description="Create a new post/announcement",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "Post content"},
+                "title": {"type": "string", "description": "Post title (optional)"}
+            },
+            "required": ["content"]
+        },
+        route=Route(
+            "POST", "/posts/",
+            data={"content": Arg("content"), "title": Arg("title", None)},
+            invalidates=POST_LISTS
+        )
+    ),
+    Endpoint(
+        name="update_post",
+        description="Update an existing post",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "post_id": {"type": "integer", "description": "Post ID to update"},
+                "content": {"type": "string", "description": "Updated content"},
+                "title": {"type": "string", "description": "Updated title (optional)"}
+            },
+            "required": ["post_id"]
+        },
+        route=Route(
+            "PUT", "/posts/{post_id}",
+            data=REST,
+            invalidates=("/posts/{post_id}",) + POST_LISTS
+        )
+    ),
+    Endpoint(
+        name="update_post_metadata",
+        description="Update post metadata (views, shares, etc)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "post_id": {"type": "integer", "description": "Post ID"},
+                "metadata": {"type": "object", "description": "Metadata to update"}
+            },
+            "required": ["post_id", "metadata"]
+        },
+        route=Route(
+            "PATCH", "/posts/{post_id}/metadata",
+            data=Arg("metadata"),
+            invalidates=("/posts/{post_id}",) + POST_LISTS
+        )
+    ),
+    Endpoint(
+        name="create_post_alert",
+        description="Create an alert for a post to notify users",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "post_id": {"type": "integer", "description": "Post ID"},
+                "alert_title": {"type": "string", "description": "Alert title"},
+                "alert_message": {"type": "string", "description": "Alert message"}
+            },
+            "required": ["post_id", "alert_title"]
+        },
+        route=Route(
+            "POST", "/posts/{post_id}/alert",
+            data={"alert_title": Arg("alert_title"), "alert_message": Arg("alert_message", None)},
+            invalidates=("/alerts/*",)
+        )
+    ),
     
-    return [
-        # ==================== POSTS ====================
-        Tool(
-            name="create_post",
-            description="Create a new post/announcement",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "Post content"},
-                    "title": {"type": "string", "description": "Post title (optional)"}
-                },
-                "required": ["content"]
-            }
-        ),
-        Tool(
-            name="update_post",
-            description="Update an existing post",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "post_id": {"type": "integer", "description": "Post ID to update"},
-                    "content": {"type": "string", "description": "Updated content"},
-                    "title": {"type": "string", "description": "Updated title (optional)"}
-                },
-                "required": ["post_id"]
-            }
-        ),
-        Tool(
-            name="update_post_metadata",
-            description="Update post metadata (views, shares, etc)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "post_id": {"type": "integer", "description": "Post ID"},
-                    "metadata": {"type": "object", "description": "Metadata to update"}
-                },
-                "required": ["post_id", "metadata"]
-            }
-        ),
-        Tool(
-            name="create_post_alert",
-            description="Create an alert for a post to notify users",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "post_id": {"type": "integer", "description": "Post ID"},
-                    "alert_title": {"type": "string", "description": "Alert title"},
-                    "alert_message": {"type": "string", "description": "Alert message"}
-                },
-                "required": ["post_id", "alert_title"]
-            }
-        ),
-        
-        # ==================== ENGAGEMENT ====================
-        Tool(
-            name="add_comment",
-            description="Add a comment to a post",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "post_id": {"type": "integer", "description": "Post ID"},
-                    "content": {"type": "string", "description": "Comment content"}
-                },
-                "required": ["post_id", "content"]
-            }
-        ),
-        Tool(
-            name="delete_comment",
-            description="Delete a comment from a post",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "post_id": {"type": "integer", "description": "Post ID"},
-                    "comment_id": {"type": "integer", "description": "Comment ID to delete"}
-                },
-                "required": ["post_id", "comment_id"]
-            }
-        ),
-        Tool(
-            name="toggle_like",
-            description="Like or unlike a post",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "post_id": {"type": "integer", "description": "Post ID to like/unlike"}
-                },
-                "required": ["post_id"]
-            }
-        ),
-        Tool(
-            name="toggle_ignite",
-            description="Ignite or un-ignite a post (super like)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "post_id": {"type": "integer", "description": "Post ID to ignite/un-ignite"}
-                },
-                "required": ["post_id"]
-            }
-        ),
-        
-        # ==================== DEPARTMENTS ====================
-        Tool(
-            name="create_department",
-            description="Create a new department in the college",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "college_id": {"type": "integer", "description": "College ID"},
-                    "name": {"type": "string", "description": "Department name"},
-                    "code": {"type": "string", "description": "Department code (e.g., CS, EE, ME)"},
-                    "description": {"type": "string", "description": "Department description (optional)"},
-                    "is_active": {"type": "boolean", "description": "Whether the department is active", "default": True}
-                },
-                "required": ["college_id", "name", "code"]
-            }
-        ),
-        Tool(
-            name="update_department",
-            description="Update department information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "department_id": {"type": "integer", "description": "Department ID"},
-                    "name": {"type": "string", "description": "Department name"},
-                    "code": {"type": "string", "description": "Department code"},
-                    "description": {"type": "string", "description": "Department description"},
-                    "is_active": {"type": "boolean", "description": "Active status"}
-                },
-                "required": ["department_id"]
-            }
-        ),
-        Tool(
-            name="deactivate_department",
-            description="Deactivate a department",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "department_id": {"type": "integer", "description": "Department ID to deactivate"},
-                    "force_delete": {"type": "boolean", "description": "Force delete even if department has related data", "default": False}
-                },
-                "required": ["department_id"]
-            }
-        ),
-        Tool(
-            name="activate_department",
-            description="Activate a department",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "department_id": {"type": "integer", "description": "Department ID to activate"}
-                },
-                "required": ["department_id"]
-            }
-        ),
-        
-        # ==================== ACADEMIC MANAGEMENT ====================
-        Tool(
-            name="create_academic_year",
-            description="Create a new academic year",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "year_name": {"type": "string", "description": "Year name (e.g., 2024-2025)"},
-                    "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
-                    "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
-                    "is_active": {"type": "boolean", "description": "Active status", "default": False}
-                },
-                "required": ["year_name", "start_date", "end_date"]
-            }
-        ),
-        Tool(
-            name="update_academic_year",
-            description="Update academic year information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "year_id": {"type": "integer", "description": "Academic year ID"},
-                    "year_name": {"type": "string", "description": "Year name"},
-                    "start_date": {"type": "string", "description": "Start date"},
-                    "end_date": {"type": "string", "description": "End date"},
-                    "is_active": {"type": "boolean", "description": "Active status"}
-                },
-                "required": ["year_id"]
-            }
-        ),
-        Tool(
-            name="activate_academic_year",
-            description="Activate an academic year (deactivates others)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "year_id": {"type": "integer", "description": "Academic year ID to activate"}
-                },
-                "required": ["year_id"]
-            }
-        ),
-        Tool(
-            name="create_program",
-            description="Create an academic program under a department",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "college_id": {"type": "integer", "description": "College ID"},
-                    "department_id": {"type": "integer", "description": "Department ID"},
-                    "code": {"type": "string", "description": "Program code (e.g., BTECH-CS, MBA)"},
-                    "name": {"type": "string", "description": "Program name"},
-                    "short_name": {"type": "string", "description": "Short name (optional)"},
-                    "duration_years": {"type": "integer", "description": "Duration in years"},
-                    "description": {"type": "string", "description": "Program description (optional)"},
-                    "is_active": {"type": "boolean", "description": "Active status", "default": True}
-                },
-                "required": ["college_id", "department_id", "code", "name", "duration_years"]
-            }
-        ),
-        Tool(
-            name="update_program",
-            description="Update program information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "program_id": {"type": "integer", "description": "Program ID"},
-                    "name": {"type": "string", "description": "Program name"},
-                    "code": {"type": "string", "description": "Program code"},
-                    "short_name": {"type": "string", "description": "Short name"},
-                    "duration_years": {"type": "integer", "description": "Duration in years"},
-                    "description": {"type": "string", "description": "Description"},
-                    "is_active": {"type": "boolean", "description": "Active status"}
-                },
-                "required": ["program_id"]
-            }
-        ),
-        Tool(
-            name="create_cohort",
-            description="Create a cohort (batch/year group) for a program",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "college_id": {"type": "integer", "description": "College ID"},
-                    "program_id": {"type": "integer", "description": "Program ID"},
-                    "admission_year": {"type": "integer", "description": "Admission year (e.g., 2024)"},
-                    "code": {"type": "string", "description": "Cohort code (e.g., BTECH-CS-2024)"},
-                    "name": {"type": "string", "description": "Cohort name"},
-                    "expected_graduation_year": {"type": "integer", "description": "Expected graduation year (optional)"},
-                    "current_semester": {"type": "integer", "description": "Current semester", "default": 1},
-                    "is_active": {"type": "boolean", "description": "Active status", "default": True}
-                },
-                "required": ["college_id", "program_id", "admission_year", "code", "name"]
-            }
-        ),
-        Tool(
-            name="update_cohort",
-            description="Update cohort information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "cohort_id": {"type": "integer", "description": "Cohort ID"},
-                    "name": {"type": "string", "description": "Cohort name"},
-                    "code": {"type": "string", "description": "Cohort code"},
-                    "current_semester": {"type": "integer", "description": "Current semester"},
-                    "expected_graduation_year": {"type": "integer", "description": "Expected graduation year"},
-                    "is_active": {"type": "boolean", "description": "Active status"}
-                },
-                "required": ["cohort_id"]
-            }
-        ),
-        Tool(
-            name="create_class",
-            description="Create a section/class for a cohort",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "college_id": {"type": "integer", "description": "College ID"},
-                    "cohort_id": {"type": "integer", "description": "Cohort ID"},
-                    "program_id": {"type": "integer", "description": "Program ID"},
-                    "section_code": {"type": "string", "description": "Section code (e.g., A, B, C)"},
-                    "section_name": {"type": "string", "description": "Section name (optional)"},
-                    "capacity": {"type": "integer", "description": "Maximum capacity (optional)"},
-                    "is_active": {"type": "boolean", "description": "Active status", "default": True}
-                },
-                "required": ["college_id", "cohort_id", "program_id", "section_code"]
-            }
-        ),
-        Tool(
-            name="update_class",
-            description="Update class/section information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "class_id": {"type": "integer", "description": "Class ID"},
-                    "section_code": {"type": "string", "description": "Section code"},
-                    "section_name": {"type": "string", "description": "Section name"},
-                    "capacity": {"type": "integer", "description": "Maximum capacity"},
-                    "is_active": {"type": "boolean", "description": "Active status"}
-                },
-                "required": ["class_id"]
-            }
-        ),
-        Tool(
-            name="assign_teacher_to_class",
-            description="Assign a teacher to a class/section",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "class_id": {"type": "integer", "description": "Class ID"},
-                    "teacher_id": {"type": "integer", "description": "Teacher user ID"},
-                    "subject": {"type": "string", "description": "Subject being taught (optional)"}
-                },
-                "required": ["class_id", "teacher_id"]
-            }
-        ),
-        Tool(
-            name="remove_teacher_from_class",
-            description="Remove a teacher assignment from a class",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "assignment_id": {"type": "integer", "description": "Teacher assignment ID to remove"}
-                },
-                "required": ["assignment_id"]
-            }
-        ),
-        
-        # ==================== ADMIN & USER MANAGEMENT ====================
-        Tool(
-            name="create_student",
-            description="Create a new student user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "username": {"type": "string", "description": "Student username"},
-                    "email": {"type": "string", "description": "Student email"},
-                    "full_name": {"type": "string", "description": "Student full name"},
-                    "password": {"type": "string", "description": "Student password"},
-                    "college_id": {"type": "integer", "description": "College ID"},
-                    "department_id": {"type": "integer", "description": "Department ID"},
-                    "program_id": {"type": "integer", "description": "Program ID"},
-                    "cohort_id": {"type": "integer", "description": "Cohort ID"},
-                    "class_id": {"type": "integer", "description": "Section/Class ID"},
-                    "admission_year": {"type": "integer", "description": "Admission year"}
-                },
-                "required": ["username", "email", "full_name", "password", "college_id", "department_id", "program_id", "cohort_id", "class_id", "admission_year"]
-            }
-        ),
-        Tool(
-            name="create_staff",
-            description="Create a new staff/faculty user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "username": {"type": "string", "description": "Staff username"},
-                    "email": {"type": "string", "description": "Staff email"},
-                    "full_name": {"type": "string", "description": "Staff full name"},
-                    "password": {"type": "string", "description": "Staff password"},
-                    "college_id": {"type": "integer", "description": "College ID"},
-                    "department_id": {"type": "integer", "description": "Department ID (optional)"},
-                    "role": {"type": "string", "description": "Staff role (e.g., faculty, staff, admin)", "default": "staff"}
-                },
-                "required": ["username", "email", "full_name", "password", "college_id", "role"]
-            }
-        ),
-        Tool(
-            name="update_user_profile",
-            description="Update a user's profile information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "integer", "description": "User ID to update"},
-                    "full_name": {"type": "string", "description": "Full name (optional)"},
-                    "email": {"type": "string", "description": "Email (optional)"},
-                    "bio": {"type": "string", "description": "Bio (optional)"},
-                    "profile_picture": {"type": "string", "description": "Profile picture URL (optional)"}
-                },
-                "required": ["user_id"]
-            }
-        ),
-        Tool(
-            name="update_user_role",
-            description="Update a user's role",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "integer", "description": "User ID"},
-                    "role": {"type": "string", "description": "New role (student, faculty, admin, staff)"}
-                },
-                "required": ["user_id", "role"]
-            }
-        ),
-        Tool(
-            name="update_user_status",
-            description="Update a user's status (active/inactive/suspended)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "integer", "description": "User ID"},
-                    "status": {"type": "string", "description": "New status (active, inactive, suspended)"}
-                },
-                "required": ["user_id", "status"]
-            }
-        ),
-        Tool(
-            name="delete_user",
-            description="Delete a user from the system",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "integer", "description": "User ID to delete"},
-                    "force": {"type": "boolean", "description": "Force delete even if user has related data", "default": False}
-                },
-                "required": ["user_id"]
-            }
-        ),
-        Tool(
-            name="grant_permission",
-            description="Grant or revoke a permission for a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "integer", "description": "User ID"},
-                    "permission_name": {"type": "string", "description": "Permission name"},
-                    "grant": {"type": "boolean", "description": "True to grant, False to revoke", "default": True}
-                },
-                "required": ["user_id", "permission_name"]
-            }
-        ),
-        Tool(
-            name="remove_permission",
-            description="Remove a custom permission from a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "integer", "description": "User ID"},
-                    "permission_name": {"type": "string", "description": "Permission name to remove"}
-                },
-                "required": ["user_id", "permission_name"]
-            }
-        ),
-        
-        # ==================== GROUPS ====================
-        Tool(
-            name="create_group",
-            description="Create a new group/community",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Group name"},
-                    "description": {"type": "string", "description": "Group description"},
-                    "is_public": {"type": "boolean", "description": "Public visibility", "default": True},
-                    "group_type": {"type": "string", "description": "Group type (optional)"}
-                },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="update_group",
-            description="Update group information",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "group_id": {"type": "integer", "description": "Group ID"},
-                    "name": {"type": "string", "description": "Group name"},
-                    "description": {"type": "string", "description": "Group description"},
-                    "is_public": {"type": "boolean", "description": "Public visibility"}
-                },
-                "required": ["group_id"]
-            }
-        ),
-        Tool(
-            name="delete_group",
-            description="Delete a group",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "group_id": {"type": "integer", "description": "Group ID to delete"}
-                },
-                "required": ["group_id"]
-            }
-        ),
-        Tool(
-            name="join_group",
-            description="Join a public group or request to join private group",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "group_id": {"type": "integer", "description": "Group ID to join"}
-                },
-                "required": ["group_id"]
-            }
-        ),
-        Tool(
-            name="add_group_member",
-            description="Add a member to a group (admin action)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "group_id": {"type": "integer", "description": "Group ID"},
-                    "user_id": {"type": "integer", "description": "User ID to add"},
-                    "role": {"type": "string", "description": "Member role (member, moderator, admin)", "default": "member"}
-                },
-                "required": ["group_id", "user_id"]
-            }
-        ),
-        Tool(
-            name="update_group_member_role",
-            description="Update a group member's role",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "group_id": {"type": "integer", "description": "Group ID"},
-                    "user_id": {"type": "integer", "description": "User ID"},
-                    "role": {"type": "string", "description": "New role (member, moderator, admin)"}
-                },
-                "required": ["group_id", "user_id", "role"]
-            }
-        ),
-        Tool(
-            name="remove_group_member",
-            description="Remove a member from a group",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "group_id": {"type": "integer", "description": "Group ID"},
-                    "user_id": {"type": "integer", "description": "User ID to remove"}
-                },
-                "required": ["group_id", "user_id"]
-            }
-        ),
-        
-        # ==================== ALERTS ====================
-        Tool(
-            name="create_alert",
-            description="Create an alert for specific users",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Alert title"},
-                    "message": {"type": "string", "description": "Alert message"},
-                    "alert_type": {"type": "string", "description": "Alert type (info, warning, success, error)"},
-                    "user_ids": {"type": "array", "items": {"type": "integer"}, "description": "List of user IDs to alert"}
-                },
-                "required": ["title", "message"]
-            }
-        ),
-        Tool(
-            name="create_group_alert",
-            description="Create an alert for all members of a group",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Alert title"},
-                    "message": {"type": "string", "description": "Alert message"},
-                    "group_id": {"type": "integer", "description": "Group ID to alert"},
-                    "alert_type": {"type": "string", "description": "Alert type"}
-                },
-                "required": ["title", "message", "group_id"]
-            }
-        ),
-        Tool(
-            name="update_alert",
-            description="Update an existing alert",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "alert_id": {"type": "integer", "description": "Alert ID"},
-                    "title": {"type": "string", "description": "Alert title"},
-                    "message": {"type": "string", "description": "Alert message"},
-                    "is_read": {"type": "boolean", "description": "Read status"}
-                },
-                "required": ["alert_id"]
-            }
-        ),
-        Tool(
-            name="delete_alert",
-            description="Delete an alert",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "alert_id": {"type": "integer", "description": "Alert ID to delete"}
-                },
-                "required": ["alert_id"]
-            }
-        ),
-        Tool(
-            name="mark_all_alerts_read",
-            description="Mark all alerts as read for the current user",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        
-        # ==================== AUTHENTICATION ====================
-        Tool(
-            name="login",
-            description="Login to get authentication token",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "username": {"type": "string", "description": "Username or email"},
-                    "password": {"type": "string", "description": "Password"}
-                },
-                "required": ["username", "password"]
-            }
-        ),
-        Tool(
-            name="logout",
-            description="Logout and invalidate current session",
-            inputSchema={
-                "type": "object",
-                "properties": {}
-            }
-        ),
-        Tool(
-            name="update_password",
-            description="Update user password",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "current_password": {"type": "string", "description": "Current password"},
-                    "new_password": {"type": "string", "description": "New password"}
-                },
-                "required": ["current_password", "new_password"]
-            }
-        ),
-        
-        # ==================== REWARDS ====================
-        Tool(
-            name="give_reward",
-            description="Give reward points to a user",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "user_id": {"type": "integer", "description": "User ID to reward"},
-                    "points": {"type": "integer", "description": "Points to award"},
-                    "reason": {"type": "string", "description": "Reason for reward"}
-                },
-                "required": ["user_id", "points"]
-            }
-        ),
-        Tool(
-            name="credit_pool",
-            description="Credit points to reward pool",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "points": {"type": "integer", "description": "Points to credit"},
-                    "description": {"type": "string", "description": "Description"}
-                },
-                "required": ["points"]
-            }
-        ),
-        
-        # ==================== FILES ====================
-        Tool(
-            name="upload_file",
-            description="Upload a file to the system",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_name": {"type": "string", "description": "File name"},
-                    "file_data": {"type": "string", "description": "Base64 encoded file data"},
-                    "folder_id": {"type": "integer", "description": "Folder ID (optional)"}
-                },
-                "required": ["file_name", "file_data"]
-            }
-        ),
-        Tool(
-            name="create_folder",
-            description="Create a new folder",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string", "description": "Folder name"},
-                    "parent_folder_id": {"type": "integer", "description": "Parent folder ID (optional)"}
-                },
-                "required": ["name"]
-            }
-        ),
-        Tool(
-            name="delete_folder",
-            description="Delete a folder",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "folder_path": {"type": "string", "description": "Folder path to delete"},
-                    "recursive": {"type": "boolean", "description": "Delete recursively", "default": False}
-                },
-                "required": ["folder_path"]
-            }
-        ),
-        Tool(
-            name="move_folder",
-            description="Move a folder to a new location",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "source_path": {"type": "string", "description": "Source folder path"},
-                    "destination_path": {"type": "string", "description": "Destination folder path"}
-                },
-                "required": ["source_path", "destination_path"]
-            }
-        ),
-        Tool(
-            name="update_file",
-            description="Update file metadata",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "integer", "description": "File ID"},
-                    "name": {"type": "string", "description": "New file name"},
-                    "description": {"type": "string", "description": "File description"}
-                },
-                "required": ["file_id"]
-            }
-        ),
-        Tool(
-            name="delete_file",
-            description="Delete a file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "file_id": {"type": "integer", "description": "File ID to delete"}
-                },
-                "required": ["file_id"]
-            }
-        ),
-        
-        # ==================== AI TOOLS ====================
-        Tool(
-            name="ask_ai",
-            description="Ask AI a question about the college/content",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "question": {"type": "string", "description": "Question to ask"},
-                    "context": {"type": "string", "description": "Additional context (optional)"}
-                },
-                "required": ["question"]
-            }
-        ),
-        Tool(
-            name="search_knowledge",
-            description="Search the AI knowledge base",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search query"},
-                    "limit": {"type": "integer", "description": "Max results", "default": 10}
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="rewrite_content",
-            description="Use AI to rewrite/improve content",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "content": {"type": "string", "description": "Content to rewrite"},
-                    "style": {"type": "string", "description": "Writing style (formal, casual, academic)"}
-                },
-                "required": ["content"]
-            }
-        ),
-        
-        # ==================== DEVICE MANAGEMENT ====================
-        Tool(
-            name="register_device",
-            description="Register a device for push notifications",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "device_token": {"type": "string", "description": "Device FCM token"},
-                    "device_type": {"type": "string", "description": "Device type (ios, android, web)"},
-                    "device_name": {"type": "string", "description": "Device name (optional)"}
-                },
-                "required": ["device_token", "device_type"]
-            }
-        ),
-        Tool(
-            name="unregister_device",
-            description="Unregister a device by device ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "device_id": {"type": "integer", "description": "Device ID to unregister"}
-                },
-                "required": ["device_id"]
-            }
-        ),
-        Tool(
-            name="unregister_device_by_token",
-            description="Unregister a device by token",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "device_token": {"type": "string", "description": "Device token to unregister"}
-                },
-                "required": ["device_token"]
+    # ==================== ENGAGEMENT ====================
+    Endpoint(
+        name="add_comment",
+        description="Add a comment to a post",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "post_id": {"type": "integer", "description": "Post ID"},
+                "content": {"type": "string", "description": "Comment content"}
+            },
+            "required": ["post_id", "content"]
+        },
+        route=Route(
+            "POST", "/posts/{post_id}/comments",
+            data={"content": Arg("content")},
+            invalidates=("/posts/{post_id}/comments", "/posts/{post_id}") + POST_LISTS
+        )
+    ),
+    Endpoint(
+        name="delete_comment",
+        description="Delete a comment from a post",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "post_id": {"type": "integer", "description": "Post ID"},
+                "comment_id": {"type": "integer", "description": "Comment ID to delete"}
+            },
+            "required": ["post_id", "comment_id"]
+        },
+        route=Route(
+            "DELETE", "/posts/{post_id}/comments/{comment_id}",
+            invalidates=("/posts/{post_id}/comments", "/posts/{post_id}") + POST_LISTS
+        )
+    ),
+    Endpoint(
+        name="toggle_like",
+        description="Like or unlike a post",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "post_id": {"type": "integer", "description": "Post ID to like/unlike"}
+            },
+            "required": ["post_id"]
+        },
+        route=Route(
+            "POST", "/posts/{post_id}/like",
+            invalidates=("/posts/{post_id}/likes", "/posts/{post_id}/is-liked", "/posts/{post_id}") + POST_LISTS,
+            replayable=False
+        )
+    ),
+    Endpoint(
+        name="toggle_ignite",
+        description="Ignite or un-ignite a post (super like)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "post_id": {"type": "integer", "description": "Post ID to ignite/un-ignite"}
+            },
+            "required": ["post_id"]
+        },
+        route=Route(
+            "POST", "/posts/{post_id}/ignite",
+            invalidates=("/posts/{post_id}/ignites", "/posts/{post_id}") + POST_LISTS,
+            replayable=False
+        )
+    ),
+    
+    # ==================== DEPARTMENTS ====================
+    Endpoint(
+        name="create_department",
+        description="Create a new department in the college",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "college_id": {"type": "integer", "description": "College ID"},
+                "name": {"type": "string", "description": "Department name"},
+                "code": {"type": "string", "description": "Department code (e.g., CS, EE, ME)"},
+                "description": {"type": "string", "description": "Department description (optional)"},
+                "is_active": {"type": "boolean", "description": "Whether the department is active", "default": True}
+            },
+            "required": ["college_id", "name", "code"]
+        },
+        route=Route(
+            "POST", "/departments/",
+            data={
+                "name": Arg("name"),
+                "code": Arg("code"),
+                "description": Arg("description", None),
+                "is_active": Arg("is_active", True)
+            },
+            invalidates=("/departments/", "/departments/with-stats", "/files/departments/list")
+        )
+    ),
+    Endpoint(
+        name="update_department",
+        description="Update department information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "department_id": {"type": "integer", "description": "Department ID"},
+                "name": {"type": "string", "description": "Department name"},
+                "code": {"type": "string", "description": "Department code"},
+                "description": {"type": "string", "description": "Department description"},
+                "is_active": {"type": "boolean", "description": "Active status"}
+            },
+            "required": ["department_id"]
+        },
+        route=Route(
+            "PUT", "/departments/{department_id}",
+            data=REST,
+            invalidates=("/departments/", "/departments/with-stats", "/departments/{department_id}", "/files/departments/list")
+        )
+    ),
+    Endpoint(
+        name="deactivate_department",
+        description="Deactivate a department",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "department_id": {"type": "integer", "description": "Department ID to deactivate"},
+                "force_delete": {"type": "boolean", "description": "Force delete even if department has related data", "default": False}
+            },
+            "required": ["department_id"]
+        },
+        route=Route(
+            "DELETE", "/departments/{department_id}",
+            params={"force_delete": Arg("force_delete", False)},
+            invalidates=("/departments/", "/departments/with-stats", "/departments/{department_id}", "/files/departments/list")
+        )
+    ),
+    Endpoint(
+        name="activate_department",
+        description="Activate a department",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "department_id": {"type": "integer", "description": "Department ID to activate"}
+            },
+            "required": ["department_id"]
+        },
+        route=Route(
+            "POST", "/departments/{department_id}/activate",
+            invalidates=("/departments/", "/departments/with-stats", "/departments/{department_id}", "/files/departments/list"),
+            replayable=False
+        )
+    ),
+    
+    # ==================== ACADEMIC MANAGEMENT ====================
+    Endpoint(
+        name="create_academic_year",
+        description="Create a new academic year",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "year_name": {"type": "string", "description": "Year name (e.g., 2024-2025)"},
+                "start_date": {"type": "string", "description": "Start date (YYYY-MM-DD)"},
+                "end_date": {"type": "string", "description": "End date (YYYY-MM-DD)"},
+                "is_active": {"type": "boolean", "description": "Active status", "default": False}
+            },
+            "required": ["year_name", "start_date", "end_date"]
+        },
+        route=Route(
+            "POST", "/academic/years",
+            data={
+                "year_name": Arg("year_name"),
+                "start_date": Arg("start_date"),
+                "end_date": Arg("end_date"),
+                "is_active": Arg("is_active", False)
+            },
+            invalidates=("/academic/years", "/academic/years/current")
+        )
+    ),
+    Endpoint(
+        name="update_academic_year",
+        description="Update academic year information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "year_id": {"type": "integer", "description": "Academic year ID"},
+                "year_name": {"type": "string", "description": "Year name"},
+                "start_date": {"type": "string", "description": "Start date"},
+                "end_date": {"type": "string", "description": "End date"},
+                "is_active": {"type": "boolean", "description": "Active status"}
+            },
+            "required": ["year_id"]
+        },
+        route=Route(
+            "PUT", "/academic/years/{year_id}",
+            data=REST,
+            invalidates=("/academic/years", "/academic/years/current", "/academic/years/{year_id}")
+        )
+    ),
+    Endpoint(
+        name="activate_academic_year",
+        description="Activate an academic year (deactivates others)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "year_id": {"type": "integer", "description": "Academic year ID to activate"}
+            },
+            "required": ["year_id"]
+        },
+        route=Route(
+            "POST", "/academic/years/{year_id}/activate",
+            invalidates=("/academic/years", "/academic/years/*"),
+            replayable=False
+        )
+    ),
+    Endpoint(
+        name="create_program",
+        description="Create an academic program under a department",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "college_id": {"type": "integer", "description": "College ID"},
+                "department_id": {"type": "integer", "description": "Department ID"},
+                "code": {"type": "string", "description": "Program code (e.g., BTECH-CS, MBA)"},
+                "name": {"type": "string", "description": "Program name"},
+                "short_name": {"type": "string", "description": "Short name (optional)"},
+                "duration_years": {"type": "integer", "description": "Duration in years"},
+                "description": {"type": "string", "description": "Program description (optional)"},
+                "is_active": {"type": "boolean", "description": "Active status", "default": True}
+            },
+            "required": ["college_id", "department_id", "code", "name", "duration_years"]
+        },
+        route=Route(
+            "POST", "/academic/programs",
+            data={
+                "college_id": Arg("college_id"),
+                "department_id": Arg("department_id"),
+                "code": Arg("code"),
+                "name": Arg("name"),
+                "short_name": Arg("short_name", None),
+                "duration_years": Arg("duration_years"),
+                "description": Arg("description", None),
+                "is_active": Arg("is_active", True)
+            },
+            invalidates=("/academic/programs", "/departments/with-stats")
+        )
+    ),
+    Endpoint(
+        name="update_program",
+        description="Update program information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "program_id": {"type": "integer", "description": "Program ID"},
+                "name": {"type": "string", "description": "Program name"},
+                "code": {"type": "string", "description": "Program code"},
+                "short_name": {"type": "string", "description": "Short name"},
+                "duration_years": {"type": "integer", "description": "Duration in years"},
+                "description": {"type": "string", "description": "Description"},
+                "is_active": {"type": "boolean", "description": "Active status"}
+            },
+            "required": ["program_id"]
+        },
+        route=Route(
+            "PUT", "/academic/programs/{program_id}",
+            data=REST,
+            invalidates=("/academic/programs", "/academic/programs/{program_id}")
+        )
+    ),
+    Endpoint(
+        name="create_cohort",
+        description="Create a cohort (batch/year group) for a program",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "college_id": {"type": "integer", "description": "College ID"},
+                "program_id": {"type": "integer", "description": "Program ID"},
+                "admission_year": {"type": "integer", "description": "Admission year (e.g., 2024)"},
+                "code": {"type": "string", "description": "Cohort code (e.g., BTECH-CS-2024)"},
+                "name": {"type": "string", "description": "Cohort name"},
+                "expected_graduation_year": {"type": "integer", "description": "Expected graduation year (optional)"},
+                "current_semester": {"type": "integer", "description": "Current semester", "default": 1},
+                "is_active": {"type": "boolean", "description": "Active status", "default": True}
+            },
+            "required": ["college_id", "program_id", "admission_year", "code", "name"]
+        },
+        route=Route(
+            "POST", "/academic/cohorts",
+            data={
+                "college_id": Arg("college_id"),
+                "program_id": Arg("program_id"),
+                "admission_year": Arg("admission_year"),
+                "code": Arg("code"),
+                "name": Arg("name"),
+                "expected_graduation_year": Arg("expected_graduation_year", None),
+                "current_semester": Arg("current_semester", 1),
+                "is_active": Arg("is_active", True)
+            },
+            invalidates=("/academic/cohorts",)
+        )
+    ),
+    Endpoint(
+        name="update_cohort",
+        description="Update cohort information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "cohort_id": {"type": "integer", "description": "Cohort ID"},
+                "name": {"type": "string", "description": "Cohort name"},
+                "code": {"type": "string", "description": "Cohort code"},
+                "current_semester": {"type": "integer", "description": "Current semester"},
+                "expected_graduation_year": {"type": "integer", "description": "Expected graduation year"},
+                "is_active": {"type": "boolean", "description": "Active status"}
+            },
+            "required": ["cohort_id"]
+        },
+        route=Route(
+            "PUT", "/academic/cohorts/{cohort_id}",
+            data=REST,
+            invalidates=("/academic/cohorts", "/academic/cohorts/{cohort_id}")
+        )
+    ),
+    Endpoint(
+        name="create_class",
+        description="Create a section/class for a cohort",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "college_id": {"type": "integer", "description": "College ID"},
+                "cohort_id": {"type": "integer", "description": "Cohort ID"},
+                "program_id": {"type": "integer", "description": "Program ID"},
+                "section_code": {"type": "string", "description": "Section code (e.g., A, B, C)"},
+                "section_name": {"type": "string", "description": "Section name (optional)"},
+                "capacity": {"type": "integer", "description": "Maximum capacity (optional)"},
+                "is_active": {"type": "boolean", "description": "Active status", "default": True}
+            },
+            "required": ["college_id", "cohort_id", "program_id", "section_code"]
+        },
+        route=Route(
+            "POST", "/academic/classes",
+            data={
+                "college_id": Arg("college_id"),
+                "cohort_id": Arg("cohort_id"),
+                "program_id": Arg("program_id"),
+                "section_code": Arg("section_code"),
+                "section_name": Arg("section_name", None),
+                "capacity": Arg("capacity", None),
+                "is_active": Arg("is_active", True)
+            },
+            invalidates=("/academic/classes",)
+        )
+    ),
+    Endpoint(
+        name="update_class",
+        description="Update class/section information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "class_id": {"type": "integer", "description": "Class ID"},
+                "section_code": {"type": "string", "description": "Section code"},
+                "section_name": {"type": "string", "description": "Section name"},
+                "capacity": {"type": "integer", "description": "Maximum capacity"},
+                "is_active": {"type": "boolean", "description": "Active status"}
+            },
+            "required": ["class_id"]
+        },
+        route=Route(
+            "PUT", "/academic/classes/{class_id}",
+            data=REST,
+            invalidates=("/academic/classes", "/academic/classes/{class_id}")
+        )
+    ),
+    Endpoint(
+        name="assign_teacher_to_class",
+        description="Assign a teacher to a class/section",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "class_id": {"type": "integer", "description": "Class ID"},
+                "teacher_id": {"type": "integer", "description": "Teacher user ID"},
+                "subject": {"type": "string", "description": "Subject being taught (optional)"}
+            },
+            "required": ["class_id", "teacher_id"]
+        },
+        route=Route(
+            "POST", "/academic/class-teachers",
+            data={"class_id": Arg("class_id"), "teacher_id": Arg("teacher_id"), "subject": Arg("subject", None)},
+            invalidates=("/academic/classes/{class_id}", "/academic/classes/{class_id}/teachers")
+        )
+    ),
+    Endpoint(
+        name="remove_teacher_from_class",
+        description="Remove a teacher assignment from a class",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "assignment_id": {"type": "integer", "description": "Teacher assignment ID to remove"}
+            },
+            "required": ["assignment_id"]
+        },
+        route=Route(
+            "DELETE", "/academic/class-teachers/{assignment_id}",
+            invalidates=("/academic/classes/*/teachers",)
+        )
+    ),
+    
+    # ==================== ADMIN & USER MANAGEMENT ====================
+    Endpoint(
+        name="create_student",
+        description="Create a new student user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "username": {"type": "string", "description": "Student username"},
+                "email": {"type": "string", "description": "Student email"},
+                "full_name": {"type": "string", "description": "Student full name"},
+                "password": {"type": "string", "description": "Student password"},
+                "college_id": {"type": "integer", "description": "College ID"},
+                "department_id": {"type": "integer", "description": "Department ID"},
+                "program_id": {"type": "integer", "description": "Program ID"},
+                "cohort_id": {"type": "integer", "description": "Cohort ID"},
+                "class_id": {"type": "integer", "description": "Section/Class ID"},
+                "admission_year": {"type": "integer", "description": "Admission year"}
+            },
+            "required": ["username", "email", "full_name", "password", "college_id", "department_id", "program_id", "cohort_id", "class_id", "admission_year"]
+        },
+        route=Route(
+            "POST", "/admin/users",
+            data={
+                "username": Arg("username"),
+                "email": Arg("email"),
+                "full_name": Arg("full_name"),
+                "password": Arg("password"),
+                "role": "student",
+                "college_id": Arg("college_id"),
+                "department_id": Arg("department_id"),
+                "program_id": Arg("program_id"),
+                "cohort_id": Arg("cohort_id"),
+                "class_id": Arg("class_id"),
+                "admission_year": Arg("admission_year")
+            },
+            invalidates=("/users/", "/academic/classes/{class_id}/students", "/departments/with-stats")
+        )
+    ),
+    Endpoint(
+        name="create_staff",
+        description="Create a new staff/faculty user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "username": {"type": "string", "description": "Staff username"},
+                "email": {"type": "string", "description": "Staff email"},
+                "full_name": {"type": "string", "description": "Staff full name"},
+                "password": {"type": "string", "description": "Staff password"},
+                "college_id": {"type": "integer", "description": "College ID"},
+                "department_id": {"type": "integer", "description": "Department ID (optional)"},
+                "role": {"type": "string", "description": "Staff role (e.g., faculty, staff, admin)", "default": "staff"}
+            },
+            "required": ["username", "email", "full_name", "password", "college_id", "role"]
+        },
+        route=Route(
+            "POST", "/admin/users",
+            data={
+                "username": Arg("username"),
+                "email": Arg("email"),
+                "full_name": Arg("full_name"),
+                "password": Arg("password"),
+                "role": Arg("role", "staff"),
+                "college_id": Arg("college_id"),
+                "department_id": Arg("department_id", None)
+            },
+            invalidates=("/users/", "/departments/with-stats")
+        )
+    ),
+    Endpoint(
+        name="update_user_profile",
+        description="Update a user's profile information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {"type": "integer", "description": "User ID to update"},
+                "full_name": {"type": "string", "description": "Full name (optional)"},
+                "email": {"type": "string", "description": "Email (optional)"},
+                "bio": {"type": "string", "description": "Bio (optional)"},
+                "profile_picture": {"type": "string", "description": "Profile picture URL (optional)"}
+            },
+            "required": ["user_id"]
+        },
+        route=Route(
+            "PUT", "/users/{user_id}",
+            data=REST,
+            invalidates=("/users/", "/users/me", "/users/{user_id}")
+        )
+    ),
+    Endpoint(
+        name="update_user_role",
+        description="Update a user's role",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {"type": "integer", "description": "User ID"},
+                "role": {"type": "string", "description": "New role (student, faculty, admin, staff)"}
+            },
+            "required": ["user_id", "role"]
+        },
+        route=Route(
+            "PUT", "/admin/users/{user_id}/role",
+            data={"role": Arg("role")},
+            invalidates=("/users/", "/users/me", "/users/{user_id}", "/admin/users/{user_id}/permissions")
+        )
+    ),
+    Endpoint(
+        name="update_user_status",
+        description="Update a user's status (active/inactive/suspended)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {"type": "integer", "description": "User ID"},
+                "status": {"type": "string", "description": "New status (active, inactive, suspended)"}
+            },
+            "required": ["user_id", "status"]
+        },
+        route=Route(
+            "PUT", "/admin/users/{user_id}/status",
+            data={"status": Arg("status")},
+            invalidates=("/users/", "/users/me", "/users/{user_id}")
+        )
+    ),
+    Endpoint(
+        name="delete_user",
+        description="Delete a user from the system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {"type": "integer", "description": "User ID to delete"},
+                "force": {"type": "boolean", "description": "Force delete even if user has related data", "default": False}
+            },
+            "required": ["user_id"]
+        },
+        route=Route(
+            "DELETE", "/admin/users/{user_id}",
+            params={"force": Arg("force", False)},
+            invalidates=("/users/", "/users/{user_id}", "/departments/with-stats", "/academic/classes/*", "/groups/*", "/rewards/leaderboard")
+        )
+    ),
+    Endpoint(
+        name="grant_permission",
+        description="Grant or revoke a permission for a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {"type": "integer", "description": "User ID"},
+                "permission_name": {"type": "string", "description": "Permission name"},
+                "grant": {"type": "boolean", "description": "True to grant, False to revoke", "default": True}
+            },
+            "required": ["user_id", "permission_name"]
+        },
+        route=Route(
+            "POST", "/admin/users/{user_id}/permissions",
+            data={"permission_name": Arg("permission_name"), "grant": Arg("grant", True)},
+            invalidates=("/users/me", "/users/{user_id}", "/admin/users/{user_id}/permissions"),
+            replayable=False
+        )
+    ),
+    Endpoint(
+        name="remove_permission",
+        description="Remove a custom permission from a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {"type": "integer", "description": "User ID"},
+                "permission_name": {"type": "string", "description": "Permission name to remove"}
+            },
+            "required": ["user_id", "permission_name"]
+        },
+        route=Route(
+            "DELETE", "/admin/users/{user_id}/permissions/{permission_name}",
+            invalidates=("/users/me", "/users/{user_id}", "/admin/users/{user_id}/permissions")
+        )
+    ),
+    
+    # ==================== GROUPS ====================
+    Endpoint(
+        name="create_group",
+        description="Create a new group/community",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Group name"},
+                "description": {"type": "string", "description": "Group description"},
+                "is_public": {"type": "boolean", "description": "Public visibility", "default": True},
+                "group_type": {"type": "string", "description": "Group type (optional)"}
+            },
+            "required": ["name"]
+        },
+        route=Route(
+            "POST", "/groups/",
+            data={
+                "name": Arg("name"),
+                "description": Arg("description", None),
+                "is_public": Arg("is_public", True),
+                "group_type": Arg("group_type", None)
+            },
+            invalidates=("/groups/", "/groups/my-groups")
+        )
+    ),
+    Endpoint(
+        name="update_group",
+        description="Update group information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "group_id": {"type": "integer", "description": "Group ID"},
+                "name": {"type": "string", "description": "Group name"},
+                "description": {"type": "string", "description": "Group description"},
+                "is_public": {"type": "boolean", "description": "Public visibility"}
+            },
+            "required": ["group_id"]
+        },
+        route=Route(
+            "PUT", "/groups/{group_id}",
+            data=REST,
+            invalidates=("/groups/", "/groups/my-groups", "/groups/{group_id}")
+        )
+    ),
+    Endpoint(
+        name="delete_group",
+        description="Delete a group",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "group_id": {"type": "integer", "description": "Group ID to delete"}
+            },
+            "required": ["group_id"]
+        },
+        route=Route(
+            "DELETE", "/groups/{group_id}",
+            invalidates=("/groups/", "/groups/my-groups", "/groups/{group_id}", "/groups/{group_id}/members")
+        )
+    ),
+    Endpoint(
+        name="join_group",
+        description="Join a public group or request to join private group",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "group_id": {"type": "integer", "description": "Group ID to join"}
+            },
+            "required": ["group_id"]
+        },
+        route=Route(
+            "POST", "/groups/{group_id}/join",
+            invalidates=("/groups/", "/groups/my-groups", "/groups/{group_id}", "/groups/{group_id}/members"),
+            replayable=False
+        )
+    ),
+    Endpoint(
+        name="add_group_member",
+        description="Add a member to a group (admin action)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "group_id": {"type": "integer", "description": "Group ID"},
+                "user_id": {"type": "integer", "description": "User ID to add"},
+                "role": {"type": "string", "description": "Member role (member, moderator, admin)", "default": "member"}
+            },
+            "required": ["group_id", "user_id"]
+        },
+        route=Route(
+            "POST", "/groups/{group_id}/members",
+            params={"user_id": Arg("user_id"), "role": Arg("role", "MEMBER")},
+            invalidates=("/groups/", "/groups/my-groups", "/groups/{group_id}", "/groups/{group_id}/members"),
+            replayable=False
+        )
+    ),
+    Endpoint(
+        name="update_group_member_role",
+        description="Update a group member's role",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "group_id": {"type": "integer", "description": "Group ID"},
+                "user_id": {"type": "integer", "description": "User ID"},
+                "role": {"type": "string", "description": "New role (member, moderator, admin)"}
+            },
+            "required": ["group_id", "user_id", "role"]
+        },
+        route=Route(
+            "PUT", "/groups/{group_id}/members/{user_id}",
+            data={"role": Arg("role")},
+            invalidates=("/groups/{group_id}/members",)
+        )
+    ),
+    Endpoint(
+        name="remove_group_member",
+        description="Remove a member from a group",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "group_id": {"type": "integer", "description": "Group ID"},
+                "user_id": {"type": "integer", "description": "User ID to remove"}
+            },
+            "required": ["group_id", "user_id"]
+        },
+        route=Route(
+            "DELETE", "/groups/{group_id}/members/{user_id}",
+            invalidates=("/groups/", "/groups/my-groups", "/groups/{group_id}", "/groups/{group_id}/members")
+        )
+    ),
+    
+    # ==================== ALERTS ====================
+    Endpoint(
+        name="create_alert",
+        description="Create an alert for specific users",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Alert title"},
+                "message": {"type": "string", "description": "Alert message"},
+                "alert_type": {"type": "string", "description": "Alert type (info, warning, success, error)"},
+                "user_ids": {"type": "array", "items": {"type": "integer"}, "description": "List of user IDs to alert"}
+            },
+            "required": ["title", "message"]
+        },
+        route=Route(
+            "POST", "/alerts/",
+            data={
+                "title": Arg("title"),
+                "message": Arg("message"),
+                "alert_type": Arg("alert_type", None),
+                "user_ids": Arg("user_ids", [])
+            },
+            invalidates=("/alerts/*",)
+        )
+    ),
+    Endpoint(
+        name="create_group_alert",
+        description="Create an alert for all members of a group",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Alert title"},
+                "message": {"type": "string", "description": "Alert message"},
+                "group_id": {"type": "integer", "description": "Group ID to alert"},
+                "alert_type": {"type": "string", "description": "Alert type"}
+            },
+            "required": ["title", "message", "group_id"]
+        },
+        route=Route(
+            "POST", "/alerts/group-alerts",
+            data={
+                "title": Arg("title"),
+                "message": Arg("message"),
+                "target_group_id": Arg("group_id"),
+                "alert_type": Arg("alert_type", "GENERAL")
+            },
+            invalidates=("/alerts/*",)
+        )
+    ),
+    Endpoint(
+        name="update_alert",
+        description="Update an existing alert",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "alert_id": {"type": "integer", "description": "Alert ID"},
+                "title": {"type": "string", "description": "Alert title"},
+                "message": {"type": "string", "description": "Alert message"},
+                "is_read": {"type": "boolean", "description": "Read status"}
+            },
+            "required": ["alert_id"]
+        },
+        route=Route("PUT", "/alerts/{alert_id}", data=REST, invalidates=("/alerts/*",))
+    ),
+    Endpoint(
+        name="delete_alert",
+        description="Delete an alert",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "alert_id": {"type": "integer", "description": "Alert ID to delete"}
+            },
+            "required": ["alert_id"]
+        },
+        route=Route("DELETE", "/alerts/{alert_id}", invalidates=("/alerts/*",))
+    ),
+    Endpoint(
+        name="mark_all_alerts_read",
+        description="Mark all alerts as read for the current user",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        },
+        route=Route("POST", "/alerts/mark-all-read", invalidates=("/alerts/*",), replayable=False)
+    ),
+    
+    # ==================== AUTHENTICATION ====================
+    Endpoint(
+        name="login",
+        description="Login to get authentication token",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "username": {"type": "string", "description": "Username or email"},
+                "password": {"type": "string", "description": "Password"}
+            },
+            "required": ["username", "password"]
+        },
+        route=Route("POST", "/auth/login", data={"username": Arg("username"), "password": Arg("password")})
+    ),
+    Endpoint(
+        name="logout",
+        description="Logout and invalidate current session",
+        inputSchema={
+            "type": "object",
+            "properties": {}
+        },
+        route=Route("POST", "/auth/logout")
+    ),
+    Endpoint(
+        name="update_password",
+        description="Update user password",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "current_password": {"type": "string", "description": "Current password"},
+                "new_password": {"type": "string", "description": "New password"}
+            },
+            "required": ["current_password", "new_password"]
+        },
+        route=Route(
+            "PUT", "/auth/update-password",
+            data={"current_password": Arg("current_password"), "new_password": Arg("new_password")}
+        )
+    ),
+    
+    # ==================== REWARDS ====================
+    Endpoint(
+        name="give_reward",
+        description="Give reward points to a user",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "user_id": {"type": "integer", "description": "User ID to reward"},
+                "points": {"type": "integer", "description": "Points to award"},
+                "reason": {"type": "string", "description": "Reason for reward"}
+            },
+            "required": ["user_id", "points"]
+        },
+        route=Route(
+            "POST", "/rewards/",
+            data={"user_id": Arg("user_id"), "points": Arg("points"), "reason": Arg("reason", None)},
+            invalidates=("/rewards/", "/rewards/me", "/rewards/leaderboard", "/rewards/points/{user_id}", "/rewards/store/balance*", "/pool/*")
+        )
+    ),
+    Endpoint(
+        name="credit_pool",
+        description="Credit points to reward pool",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "points": {"type": "integer", "description": "Points to credit"},
+                "description": {"type": "string", "description": "Description"}
+            },
+            "required": ["points"]
+        },
+        route=Route(
+            "POST", "/pool/credit",
+            data={"points": Arg("points"), "description": Arg("description", None)},
+            invalidates=("/pool/*",)
+        )
+    ),
+    
+    # ==================== FILES ====================
+    Endpoint(
+        name="upload_file",
+        description="Upload a file to the system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_name": {"type": "string", "description": "File name"},
+                "file_data": {"type": "string", "description": "Base64 encoded file data"},
+                "folder_id": {"type": "integer", "description": "Folder ID (optional)"}
+            },
+            "required": ["file_name", "file_data"]
+        },
+        route=Route(
+            "POST", "/files/upload",
+            data={"file_name": Arg("file_name"), "file_data": Arg("file_data"), "folder_id": Arg("folder_id", None)},
+            invalidates=("/files/", "/files/folders/browse", "/files/stats/summary"),
+            timeout=UPLOAD_TIMEOUT,
+            slow_call=UPLOAD_SLOW_CALL
+        )
+    ),
+    Endpoint(
+        name="create_folder",
+        description="Create a new folder",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Folder name"},
+                "parent_folder_id": {"type": "integer", "description": "Parent folder ID (optional)"}
+            },
+            "required": ["name"]
+        },
+        route=Route(
+            "POST", "/files/folders/create",
+            data={"name": Arg("name"), "parent_folder_id": Arg("parent_folder_id", None)},
+            invalidates=("/files/folders/browse",)
+        )
+    ),
+    Endpoint(
+        name="delete_folder",
+        description="Delete a folder",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "folder_path": {"type": "string", "description": "Folder path to delete"},
+                "recursive": {"type": "boolean", "description": "Delete recursively", "default": False}
+            },
+            "required": ["folder_path"]
+        },
+        route=Route(
+            "DELETE", "/files/folders/delete",
+            params=_folder_delete_params,
+            invalidates=("/files/", "/files/folders/browse", "/files/stats/summary")
+        )
+    ),
+    Endpoint(
+        name="move_folder",
+        description="Move a folder to a new location",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "source_path": {"type": "string", "description": "Source folder path"},
+                "destination_path": {"type": "string", "description": "Destination folder path"}
+            },
+            "required": ["source_path", "destination_path"]
+        },
+        route=Route(
+            "PUT", "/files/folders/move",
+            params=_folder_move_params,
+            invalidates=("/files/", "/files/folders/browse")
+        )
+    ),
+    Endpoint(
+        name="update_file",
+        description="Update file metadata",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "integer", "description": "File ID"},
+                "name": {"type": "string", "description": "New file name"},
+                "description": {"type": "string", "description": "File description"}
+            },
+            "required": ["file_id"]
+        },
+        route=Route(
+            "PUT", "/files/{file_id}",
+            data=REST,
+            invalidates=("/files/", "/files/{file_id}", "/files/folders/browse")
+        )
+    ),
+    Endpoint(
+        name="delete_file",
+        description="Delete a file",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "file_id": {"type": "integer", "description": "File ID to delete"}
+            },
+            "required": ["file_id"]
+        },
+        route=Route(
+            "DELETE", "/files/{file_id}",
+            invalidates=("/files/", "/files/{file_id}", "/files/folders/browse", "/files/stats/summary")
+        )
+    ),
+    
+    # ==================== AI TOOLS ====================
+    Endpoint(
+        name="ask_ai",
+        description="Ask AI a question about the college/content",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "question": {"type": "string", "description": "Question to ask"},
+                "context": {"type": "string", "description": "Additional context (optional)"}
+            },
+            "required": ["question"]
+        },
+        route=Route(
+            "POST", "/ai/ask",
+            data={"question": Arg("question"), "context": Arg("context", None)},
+            invalidates=("/ai/stats", "/ai/conversations"),
+            priority=INTERACTIVE,
+            timeout=AI_TIMEOUT,
+            slow_call=AI_SLOW_CALL
+        )
+    ),
+    Endpoint(
+        name="rewrite_content",
+        description="Use AI to rewrite/improve content",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "content": {"type": "string", "description": "Content to rewrite"},
+                "style": {"type": "string", "description": "Writing style (formal, casual, academic)"}
+            },
+            "required": ["content"]
+        },
+        route=Route(
+            "POST", "/ai/rewrite",
+            data={"content": Arg("content"), "style": Arg("style", None)},
+            priority=INTERACTIVE,
+            timeout=AI_TIMEOUT,
+            slow_call=AI_SLOW_CALL
+        )
+    ),
+    
+    # ==================== DEVICE MANAGEMENT ====================
+    Endpoint(
+        name="register_device",
+        description="Register a device for push notifications",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "device_token": {"type": "string", "description": "Device FCM token"},
+                "device_type": {"type": "string", "description": "Device type (ios, android, web)"},
+                "device_name": {"type": "string", "description": "Device name (optional)"}
+            },
+            "required": ["device_token", "device_type"]
+        },
+        route=Route(
+            "POST", "/users/devices",
+            data={
+                "device_token": Arg("device_token"),
+                "device_type": Arg("device_type"),
+                "device_name": Arg("device_name", None)
             }
-        ),
-    ]
+        )
+    ),
+    Endpoint(
+        name="unregister_device",
+        description="Unregister a device by device ID",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "device_id": {"type": "integer", "description": "Device ID to unregister"}
+            },
+            "required": ["device_id"]
+        },
+        route=Route("DELETE", "/users/devices/{device_id}")
+    ),
+    Endpoint(
+        name="unregister_device_by_token",
+        description="Unregister a device by token",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "device_token": {"type": "string", "description": "Device token to unregister"}
+            },
+            "required": ["device_token"]
+        },
+        route=Route("DELETE", "/users/devices", data={"device_token": Arg("device_token")})
+    ),
+)
+
+
+def get_write_tools():
+    """Returns list of all write operation tools (POST, PUT, PATCH, DELETE)"""
+    return [endpoint.to_tool() for endpoint in WRITE_ENDPOINTS]